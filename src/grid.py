@@ -3,7 +3,7 @@ Module containing grid classes
 """
 
 import pygame
-from copy import deepcopy
+from array import array
 
 
 class Cell:
@@ -87,7 +87,10 @@ class Grid:
                  cellColor: list, cellBorderColor: list=None, cellBorderWidth: int=1):
         self.grid = Grid.create_grid(position, size, cellSize,
                                      cellColor, cellBorderColor, cellBorderWidth)
-        self.gridBackup = deepcopy(self.grid)
+
+        # only the mutable state of the cells is kept to reset the grid
+        # (subclasses take their own snapshot once their cells are created)
+        self.gridSnapshot = Grid.take_snapshot(self)
 
         self.position = list(position)
 
@@ -175,6 +178,23 @@ class Grid:
         return rotatedCoords
 
 
+    def get_cell_at(self, position: list) -> Cell:
+        """
+        Returns the cell at the given (absolute) position or None if it's outside of the grid
+        """
+
+        x = position[0] - self.position[0]
+        y = position[1] - self.position[1]
+        if x < 0 or y < 0:
+            return None
+
+        rowI = y // self.cellSize[1]
+        cellI = x // self.cellSize[0]
+        if rowI >= len(self) or cellI >= len(self[rowI]):
+            return None
+
+        return self[rowI][cellI]
+
     def draw_grid(self, display):
         for row in self:
             for cell in row:
@@ -185,8 +205,48 @@ class Grid:
             for cell in row:
                 cell.color = color
 
+    def take_snapshot(self) -> tuple:
+        """
+        Returns the mutable state of every cell (its color) in a compact form,
+        which can be restored in place with restore_snapshot
+        """
+
+        colors = array('B')
+        for row in self:
+            for cell in row:
+                colors.extend(cell.color[:3])
+
+        return (colors,)
+
+    def restore_snapshot(self, snapshot: tuple):
+        """
+        Restores the state of every cell saved by take_snapshot (in place)
+        """
+
+        cellI = 0
+        for row in self:
+            for cell in row:
+                self.restore_cell_snapshot(cell, cellI, snapshot)
+                cellI += 1
+
+    def restore_cell_snapshot(self, cell: Cell, cellI: int, snapshot: tuple):
+        """
+        Restores the state of a single cell saved by take_snapshot (cellI is its index counting row by row)
+        """
+
+        colors = snapshot[0]
+        cell.color = list(colors[cellI * 3:cellI * 3 + 3])
+
+    def keep_snapshot(self):
+        """
+        Keeps the current state of every cell as the one reset_grid and reset_cell restore
+        """
+
+        self.gridSnapshot = self.take_snapshot()
+
     def reset_grid(self):
-        self.grid = deepcopy(self.gridBackup)
+        self.restore_snapshot(self.gridSnapshot)
 
     def reset_cell(self, gridPosition: list):
-        self[gridPosition[0]][gridPosition[1]] = self.gridBackup[gridPosition[0]][gridPosition[1]]
+        cellI = gridPosition[0] * len(self[0]) + gridPosition[1]
+        self.restore_cell_snapshot(self[gridPosition[0]][gridPosition[1]], cellI, self.gridSnapshot)
@@ -25,4 +25,10 @@ resolution = options['resolution']
 cellSize = options['cellSize']
 textSize = options['textSize']
 framerate = options['framerate']
+stepPolicy = options['stepPolicy']
+stepsPerFrame = options['stepsPerFrame']
+stepTimeBudget = options['stepTimeBudget']
+solverMode = options['solverMode']
+stepQueueSize = options['stepQueueSize']
+replayFile = options['replayFile']
 difficulty = options['difficulty']
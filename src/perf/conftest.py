@@ -0,0 +1,212 @@
+"""
+Pytest plugin of the performance suite (python -m pytest perf, run from /src)
+
+    Every case measures one API on one board and checks the result against its baseline in baselines.json:
+    the node count (the same on every machine, so it's gated, by default no extra node is allowed)
+    and the time (noisy, so it's only reported unless --perf-time-threshold is given).
+    The speedups against the baselines are printed at the end of the run.
+    --update-baselines stores the results of the run instead of checking them.
+
+    Main classes:
+        PerfRecorder -- checks the results against the baselines and keeps them for the report
+"""
+
+import json
+import math
+import os
+import sys
+import time
+
+import pytest
+
+# the sudoku package is next to this directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+baselinesPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+
+_fileVersion = 1
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('perf', 'performance suite')
+    group.addoption('--update-baselines', action='store_true',
+                    help='store the node counts and times of this run as the baselines instead of checking them')
+    group.addoption('--perf-node-threshold', type=float, default=0.0, metavar='FRACTION',
+                    help='fraction of extra nodes allowed over the baseline, e.g. 0.05 (default: 0)')
+    group.addoption('--perf-time-threshold', type=float, default=None, metavar='FRACTION',
+                    help='fraction of extra time allowed over the baseline, e.g. 0.5 (default: times are only reported)')
+    group.addoption('--perf-repeat', type=int, default=3, metavar='N',
+                    help='times every case is run, the fastest time is kept (default: 3)')
+
+
+class PerfRecorder:
+    """
+    Checks the results of the cases against the baselines and keeps them for the report.
+
+        Arguments:
+            path {str} -- json file of the baselines
+
+        Keyword Arguments:
+            update {bool} -- store the results as the new baselines instead of checking them (default: {False})
+            nodeThreshold {float} -- fraction of extra nodes allowed (default: {0.0})
+            timeThreshold {float} -- fraction of extra time allowed (default: {None} (the time isn't checked))
+            repeat {int} -- times every case is run (default: {3})
+    """
+
+    # seconds after which a case isn't run again (the slow ones are measured well enough by a single run)
+    repeatBudget = 1.0
+
+    def __init__(self, path, update=False, nodeThreshold=0.0, timeThreshold=None, repeat=3):
+        self.path = path
+        self.update = update
+        self.nodeThreshold = nodeThreshold
+        self.timeThreshold = timeThreshold
+        self.repeat = max(repeat, 1)
+
+        self.baselines = {}
+        if os.path.exists(path):
+            with open(path, 'r') as baselinesFile:
+                baselines = json.load(baselinesFile)
+            if baselines.get('version') == _fileVersion:
+                self.baselines = baselines['cases']
+
+        # case -> its result, in the order the cases were run
+        self.results = {}
+
+    def measure(self, function, *args, **kwargs):
+        """
+        Runs function(*args, **kwargs) up to repeat times (just once if it's slow).
+
+        Returns:
+            {tuple} -- the result of the last run and the fastest time in seconds
+        """
+
+        bestTime = math.inf
+        totalTime = 0.0
+        for _ in range(self.repeat):
+            startTime = time.perf_counter()
+            result = function(*args, **kwargs)
+            elapsed = time.perf_counter() - startTime
+
+            bestTime = min(bestTime, elapsed)
+            totalTime += elapsed
+            if totalTime >= self.repeatBudget:
+                break
+
+        return result, bestTime
+
+    def check(self, case, seconds, nodes=None, backtracks=None):
+        """
+        Records the result of a case and fails the test if it's worse than the baseline.
+
+        Arguments:
+            case {str} -- e.g. 'solve/bitmask/boards9[0]'
+            seconds {float}
+
+        Keyword Arguments:
+            nodes {int} -- nums placed by the search (default: {None} (the case has no node count))
+            backtracks {int} -- default: {None}
+        """
+
+        result = {'time': round(seconds, 6), 'nodes': nodes, 'backtracks': backtracks}
+        self.results[case] = result
+
+        if self.update:
+            return
+
+        baseline = self.baselines.get(case)
+        if baseline is None:
+            pytest.fail('No baseline for {} (python -m pytest perf --update-baselines).'.format(case))
+
+        failures = []
+        if baseline['nodes'] is not None:
+            if nodes is None or nodes > baseline['nodes'] * (1 + self.nodeThreshold):
+                failures.append('nodes {} -> {}'.format(baseline['nodes'], nodes))
+
+        if self.timeThreshold is not None and seconds > baseline['time'] * (1 + self.timeThreshold):
+            failures.append('time {:.4f}s -> {:.4f}s'.format(baseline['time'], seconds))
+
+        if failures:
+            pytest.fail('{} regressed: {}.'.format(case, ', '.join(failures)))
+
+    def save(self):
+        """
+        Stores the results of this run as the baselines (the baselines of the cases which weren't run are kept).
+        """
+
+        cases = dict(self.baselines)
+        cases.update(self.results)
+
+        with open(self.path, 'w') as baselinesFile:
+            json.dump({'version': _fileVersion, 'cases': cases}, baselinesFile, indent=1, sort_keys=True)
+            baselinesFile.write('\n')
+
+    def get_report(self):
+        """
+        Returns:
+            {list of str} -- a line per case with its time and nodes against the baseline
+            and the geometric mean of the speedups
+        """
+
+        lines = ['{:<52} {:>10} {:>10} {:>8} {:>18}'.format('case', 'baseline', 'now', 'speedup', 'nodes')]
+        speedups = []
+        for case, result in self.results.items():
+            baseline = self.baselines.get(case)
+            if baseline is None:
+                lines.append('{:<52} {:>10} {:>9.4f}s {:>8} {:>18}'.format(
+                    case, '-', result['time'], '-', _format_nodes(None, result['nodes'])))
+                continue
+
+            speedup = baseline['time'] / result['time'] if result['time'] else math.inf
+            speedups.append(speedup)
+            lines.append('{:<52} {:>9.4f}s {:>9.4f}s {:>7.2f}x {:>18}'.format(
+                case, baseline['time'], result['time'], speedup, _format_nodes(baseline['nodes'], result['nodes'])))
+
+        speedups = [speedup for speedup in speedups if 0 < speedup < math.inf]
+        if speedups:
+            meanSpeedup = math.exp(sum(math.log(speedup) for speedup in speedups) / len(speedups))
+            lines.append('geometric mean speedup: {:.2f}x over {} cases'.format(meanSpeedup, len(speedups)))
+
+        return lines
+
+
+def _format_nodes(baselineNodes, nodes):
+    if nodes is None:
+        return '-'
+    if baselineNodes is None or baselineNodes == nodes:
+        return str(nodes)
+
+    return '{} -> {}'.format(baselineNodes, nodes)
+
+
+def pytest_configure(config):
+    config._perfRecorder = PerfRecorder(baselinesPath, config.getoption('--update-baselines'),
+                                        config.getoption('--perf-node-threshold'),
+                                        config.getoption('--perf-time-threshold'),
+                                        config.getoption('--perf-repeat'))
+
+
+@pytest.fixture
+def perf(request):
+    return request.config._perfRecorder
+
+
+def pytest_sessionfinish(session):
+    recorder = session.config._perfRecorder
+    if recorder.update and recorder.results:
+        recorder.save()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    recorder = config._perfRecorder
+    if not recorder.results:
+        return
+
+    if recorder.update:
+        terminalreporter.write_sep('-', 'baselines of {} cases stored in {}'.format(len(recorder.results),
+                                                                                   recorder.path))
+        return
+
+    terminalreporter.write_sep('-', 'performance against the baselines')
+    for line in recorder.get_report():
+        terminalreporter.write_line(line)
@@ -0,0 +1,154 @@
+"""
+Performance cases of the solving APIs on the sample boards (see conftest for the baselines and the options)
+
+    Every case is named '<api>/<strategy or variant>/<board>' in baselines.json. The node counts of the searches
+    don't depend on the machine, so they're gated, the times are reported (and gated with --perf-time-threshold).
+    The 'parallel' strategy isn't measured, its node counts depend on how the processes race.
+    Boards from generate_board_from_api aren't measured either, they come from the network.
+"""
+
+import pytest
+
+from sudoku import sudoku
+from sudoku import sudokubatch
+from sudoku.sudokubenchmark import get_sample_boards
+from sudoku.sudokuboard import SudokuBoard
+
+sampleBoards = dict(get_sample_boards())
+
+solveStrategies = ('backtrack', 'bitmask', 'sat')
+
+# boards the backtracking takes minutes on
+slowBacktrackBoards = ('boards15[1]', 'boards16[1]', 'boards16[2]', 'boards18[0]', 'boards25[0]', 'boards25[1]',
+                       'boards25[2]', 'boards36[0]', 'boards36[1]')
+
+# boards the SAT solver takes most of a minute on (the empty ones leave it nothing to propagate)
+slowSatBoards = ('boards36[0]',)
+
+# boards sudoku_solve and the step by step solving finish in well under a second
+smallBoards = ('boards9[0]', 'boards9[6]', 'boards9[7]', 'boards9[8]', 'boards12[0]')
+
+# boards whose every step is worth a whole MoveResult (gen_solving_step_by_step)
+stepBoards = ('boards9[0]', 'boards9[7]', 'boards9[8]')
+
+# boards gen_sudoku_solving_step_by_step finishes in under a second
+legacyStepBoards = ('boards9[0]', 'boards9[7]')
+
+
+def _copy_board(board):
+    return tuple([list(row) for row in board])
+
+
+def _solve(name, strategy='bitmask'):
+    sudokuBoard = SudokuBoard(_copy_board(sampleBoards[name]))
+    solution = sudokuBoard.solve(True, strategy)
+
+    return solution, sudokuBoard.solveStats
+
+
+def _get_solution(name):
+    # the first solution in the order the spots are filled (some samples have more than one)
+    return _solve(name, 'backtrack')[0]
+
+
+@pytest.mark.parametrize('name', list(sampleBoards))
+@pytest.mark.parametrize('strategy', solveStrategies)
+def test_solve(perf, strategy, name):
+    if strategy == 'backtrack' and name in slowBacktrackBoards:
+        pytest.skip('the backtracking takes minutes on {}'.format(name))
+    if strategy == 'sat' and name in slowSatBoards:
+        pytest.skip('the SAT solver takes most of a minute on {}'.format(name))
+
+    (solution, stats), seconds = perf.measure(_solve, name, strategy)
+    assert solution
+
+    perf.check('solve/{}/{}'.format(strategy, name), seconds, stats['nodes'], stats['backtracks'])
+
+
+@pytest.mark.parametrize('name', smallBoards)
+def test_legacy_solve(perf, name):
+    solution, seconds = perf.measure(lambda: sudoku.sudoku_solve(_copy_board(sampleBoards[name])))
+    assert tuple(solution) == tuple(_get_solution(name))
+
+    # sudoku_solve doesn't count its nodes
+    perf.check('sudoku_solve/legacy/{}'.format(name), seconds)
+
+
+@pytest.mark.parametrize('name', legacyStepBoards)
+def test_legacy_steps(perf, name):
+    steps, seconds = perf.measure(
+        lambda: sum(1 for _ in sudoku.gen_sudoku_solving_step_by_step(_copy_board(sampleBoards[name]))))
+
+    perf.check('gen_sudoku_solving_step_by_step/legacy/{}'.format(name), seconds, steps)
+
+
+@pytest.mark.parametrize('name', stepBoards)
+def test_steps(perf, name):
+    steps, seconds = perf.measure(
+        lambda: sum(1 for _ in SudokuBoard(_copy_board(sampleBoards[name])).gen_solving_step_by_step(True)))
+
+    perf.check('gen_solving_step_by_step/backtrack/{}'.format(name), seconds, steps)
+
+
+@pytest.mark.parametrize('name', smallBoards)
+def test_deltas(perf, name):
+    deltas, seconds = perf.measure(
+        lambda: sum(1 for _ in SudokuBoard(_copy_board(sampleBoards[name])).gen_solving_deltas(True)))
+
+    perf.check('gen_solving_deltas/backtrack/{}'.format(name), seconds, deltas)
+
+
+@pytest.mark.parametrize('size', (9, 12))
+def test_iter_solutions(perf, size):
+    emptyBoard = tuple([['0'] * size for _ in range(size)])
+
+    count, seconds = perf.measure(SudokuBoard(emptyBoard).count_solutions, 1000)
+    assert count == 1000
+
+    # the solutions are counted instead of the nodes (iter_solutions doesn't expose them)
+    perf.check('iter_solutions/bitmask/empty{}x{}'.format(size, size), seconds, count)
+
+
+def _solve_batch(names, strategy='bitmask', propagate=False):
+    results = list(sudokubatch.solve_boards([_copy_board(sampleBoards[name]) for name in names], strategy,
+                                            propagate=propagate))
+    assert all(solution for solution, _ in results)
+
+    return sum(stats['nodes'] for _, stats in results), sum(stats['backtracks'] for _, stats in results)
+
+
+@pytest.mark.parametrize('strategy', ('bitmask', 'sat'))
+def test_solve_boards(perf, strategy):
+    names = [name for name in sampleBoards if strategy != 'sat' or name not in slowSatBoards]
+    (nodes, backtracks), seconds = perf.measure(_solve_batch, names, strategy)
+
+    perf.check('solve_boards/{}/all'.format(strategy), seconds, nodes, backtracks)
+
+
+def test_solve_boards_backtrack(perf):
+    names = [name for name in sampleBoards if name.startswith('boards9')]
+    (nodes, backtracks), seconds = perf.measure(_solve_batch, names, 'backtrack')
+
+    perf.check('solve_boards/backtrack/boards9', seconds, nodes, backtracks)
+
+
+def test_solve_boards_propagated(perf):
+    pytest.importorskip('numpy')
+
+    (nodes, backtracks), seconds = perf.measure(_solve_batch, list(sampleBoards), 'bitmask', True)
+
+    perf.check('solve_boards/propagated/all', seconds, nodes, backtracks)
+
+
+def test_rate_boards(perf):
+    ratings, seconds = perf.measure(lambda: list(sudokubatch.rate_boards(sampleBoards.values())))
+    assert not any('error' in rating for rating in ratings)
+
+    perf.check('rate_boards/human/all', seconds)
+
+
+def test_hash_boards(perf):
+    hashes, seconds = perf.measure(lambda: list(sudokubatch.hash_boards(sampleBoards.values())))
+    assert None not in hashes
+
+    perf.check('hash_boards/canonical/all', seconds)
@@ -2,13 +2,30 @@
 Module containing the main loop of the game and additional methods
 """
 
+import io
+import os
+import time
 import pygame
 from sudoku.sudokuboard import SudokuBoard
+from sudoku.sudokuexceptions import ArgumentError
+from sudoku.sudokuworker import SolveWorker, stepPolicies, frame_is_over
+from sudoku.sudokurecording import record_solving, SolveRecording
 from sudokugrid import SudokuGrid, SudokuCell
-from options import colors, cellSize, framerate, textSize, difficulty
+from options import (colors, cellSize, framerate, textSize, difficulty,
+                     stepPolicy, stepsPerFrame, stepTimeBudget,
+                     solverMode, stepQueueSize, replayFile)
+
+
+# where the solver runs
+solverModes = ('inline', 'thread', 'process', 'replay')
 
 
 def game_screen(display):
+    if stepPolicy not in stepPolicies:
+        raise ArgumentError("Incorrect stepPolicy ('steps', 'time' or 'forward').")
+    if solverMode not in solverModes:
+        raise ArgumentError("Incorrect solverMode ('inline', 'thread', 'process' or 'replay').")
+
     resolution = display.get_size()
 
     # time stuff
@@ -25,6 +42,9 @@ def game_screen(display):
     # main loop
     run = True
     solveStepByStep = False
+    solveWorker = None
+    replay = None
+    hoveredCell = None
     while run:
         # event loop
         for event in pygame.event.get():
@@ -36,48 +56,102 @@ def game_screen(display):
                     if not solveStepByStep:
                         # solve step by step
                         if event.key == pygame.K_SPACE:
-                            solveGen = board.gen_solving_step_by_step()
+                            if solverMode == 'inline':
+                                solveGen = board.gen_solving_step_by_step()
+                            elif solverMode == 'replay':
+                                replay = record_replay(board, replayFile)
+                                replaySpeed = stepsPerFrame
+                            else:
+                                solveWorker = SolveWorker(board, solverMode, stepQueueSize)
+                                solveWorker.start()
                             solveStepByStep = True
 
-                    # reset board
+                    # reset board (both are reset in place)
                     if event.key == pygame.K_ESCAPE:
+                        solveWorker = stop_worker(solveWorker)
+                        replay = None
+
                         board.reset_board()
-                        sudokuGrid.change_board(board)
-                        sudokuGrid.change_color(newTextColor=colors['text'])
+                        sudokuGrid.reset_grid()
+                        if hoveredCell:
+                            hoveredCell.color = colors['cellHover']
 
                         solveStepByStep = False
 
                 # random board
                 if event.key == pygame.K_r:
+                    solveWorker = stop_worker(solveWorker)
+                    replay = None
+
                     board = SudokuBoard('r', difficulty, '', True)
-                    sudokuGrid.change_board(board)
-                    sudokuGrid.change_color(newTextColor=colors['text'])
+                    show_new_board(sudokuGrid, board, hoveredCell)
 
                     solveStepByStep = False
 
-            mousePos = pygame.mouse.get_pos()
-            # highlight
-            for row in sudokuGrid:
-                for cell in row:
-                    if is_mouse_on_cell(cell, mousePos):
-                        cell.color = colors['cellHover']
-                    else:
-                        cell.color = colors['cell']
+                # load the recorded replay
+                if event.key == pygame.K_p and solverMode == 'replay' and replayFile and os.path.isfile(replayFile):
+                    solveWorker = stop_worker(solveWorker)
+
+                    replay = SolveRecording.load(replayFile, '')
+                    replaySpeed = stepsPerFrame
+
+                    board = SudokuBoard(replay.initial_board(), 'N/A', '')
+                    show_new_board(sudokuGrid, board, hoveredCell)
+
+                    solveStepByStep = True
+
+                # replay controls
+                if replay:
+                    if event.key == pygame.K_RIGHT:
+                        replaySpeed = abs(replaySpeed)
+                    elif event.key == pygame.K_LEFT:
+                        replaySpeed = -abs(replaySpeed)
+                    elif event.key == pygame.K_UP:
+                        replaySpeed *= 2
+                    elif event.key == pygame.K_DOWN and abs(replaySpeed) > 1:
+                        replaySpeed //= 2
+                    elif event.key == pygame.K_HOME:
+                        show_replay_changes(sudokuGrid, replay.seek(0))
+                    elif event.key == pygame.K_END:
+                        show_replay_changes(sudokuGrid, replay.seek(len(replay)))
+
+            # highlight (only the previously and the newly hovered cells are repainted)
+            if event.type == pygame.MOUSEMOTION:
+                hoveredCell = highlight_cell(sudokuGrid, hoveredCell, event.pos)
 
         # do stuff
-        if solveStepByStep:
-            try:
-                moveResult = next(solveGen)
-            except StopIteration:
-                solveStepByStep = False
-            else:
-                changedCell = sudokuGrid[moveResult.changed_coords[0]][moveResult.changed_coords[1]]
-                isValid = moveResult.isValid
+        if solveStepByStep and replay:
+            show_replay_changes(sudokuGrid, replay.step(replaySpeed))
+
+        elif solveStepByStep and solveWorker:
+            for coords, (num, isValid) in solveWorker.get_steps(stepPolicy, stepsPerFrame,
+                                                                stepTimeBudget).items():
+                changedCell = sudokuGrid[coords[0]][coords[1]]
 
                 if isValid:
-                    changedCell.change_text(changedCell.text, colors['validTextColor'])
+                    changedCell.change_text(num, colors['validTextColor'])
                 else:
-                    changedCell.change_text(changedCell.text, colors['invalidTextColor'])
+                    changedCell.change_text(num, colors['invalidTextColor'])
+
+            if solveWorker.finished:
+                solveWorker = None
+                solveStepByStep = False
+
+        elif solveStepByStep:
+            changedCoords, moveResult, solved = advance_solver(solveGen, stepPolicy,
+                                                               stepsPerFrame, stepTimeBudget)
+            if solved:
+                solveStepByStep = False
+
+            # only the final state of the frame gets rendered
+            if moveResult:
+                for coords, isValid in changedCoords.items():
+                    changedCell = sudokuGrid[coords[0]][coords[1]]
+
+                    if isValid:
+                        changedCell.change_text(changedCell.text, colors['validTextColor'])
+                    else:
+                        changedCell.change_text(changedCell.text, colors['invalidTextColor'])
 
                 sudokuGrid.change_board(moveResult.board)
 
@@ -89,10 +163,120 @@ def game_screen(display):
 
         clock.tick(framerate)
 
+    stop_worker(solveWorker)
+
+
+def stop_worker(solveWorker):
+    """
+    Stops the given SolveWorker (if there is one).
+
+    Returns:
+        {None} -- so it can replace the stopped worker
+    """
+
+    if solveWorker:
+        solveWorker.stop()
+
+
+def show_new_board(sudokuGrid: SudokuGrid, board: SudokuBoard, hoveredCell: SudokuCell):
+    """
+    Shows a new board and keeps the grid's snapshot of it (without the highlight), which resetting restores.
+    """
+
+    sudokuGrid.change_board(board)
+    sudokuGrid.change_color(colors['cell'], colors['text'])
+    sudokuGrid.keep_snapshot()
+
+    if hoveredCell:
+        hoveredCell.color = colors['cellHover']
+
+
+def highlight_cell(sudokuGrid: SudokuGrid, hoveredCell: SudokuCell, mousePos: list) -> SudokuCell:
+    """
+    Highlights the cell under the mouse and unhighlights the previously hovered one.
+
+    Returns:
+        {SudokuCell} -- the hovered cell (None if the mouse isn't on the grid)
+    """
+
+    newHoveredCell = sudokuGrid.get_cell_at(mousePos)
+    if newHoveredCell is not hoveredCell:
+        if hoveredCell:
+            hoveredCell.color = colors['cell']
+        if newHoveredCell:
+            newHoveredCell.color = colors['cellHover']
+
+    return newHoveredCell
+
+
+def record_replay(board: SudokuBoard, replayFile: str=None) -> SolveRecording:
+    """
+    Solves the board at full speed, recording every step.
+
+    Keyword Arguments:
+        replayFile {str} -- if given, the recording is also saved there (default: {None})
+
+    Returns:
+        {SolveRecording}
+    """
+
+    recordingFile = io.BytesIO()
+    record_solving(board, recordingFile)
+
+    replay = SolveRecording.from_bytes(recordingFile.getvalue(), board.emptySpotChar)
+    if replayFile:
+        replay.save(replayFile)
+
+    return replay
+
+
+def show_replay_changes(sudokuGrid: SudokuGrid, changes: dict):
+    """
+    Shows spots changed by seeking a replay.
+
+    Arguments:
+        changes {dict} -- {(row index, element index): num} (0 meaning an empty spot)
+    """
+
+    for coords, num in changes.items():
+        changedCell = sudokuGrid[coords[0]][coords[1]]
+
+        if num:
+            changedCell.change_text(str(num), colors['validTextColor'])
+        else:
+            changedCell.change_text('', colors['invalidTextColor'])
+
+
+def advance_solver(solveGen, policy: str='steps', steps: int=1, timeBudget: float=15) -> tuple:
+    """
+    Advances the solving generator by as many steps as the policy allows in a single frame
+    (see frame_is_over in sudokuworker, a solver running in a worker keeps to it the same way).
+
+    Returns:
+        {tuple} -- dict of changed coords and their validity, the last MoveResult (or None)
+        and whether the solver has finished
+    """
+
+    deadline = time.perf_counter() + timeBudget / 1000
+
+    changedCoords = {}
+    lastResult = None
+    stepCount = 0
+    while True:
+        try:
+            moveResult = next(solveGen)
+        except StopIteration:
+            return changedCoords, lastResult, True
+
+        # the board is unsolvable
+        if moveResult is None:
+            return changedCoords, lastResult, True
+
+        changedCoords[moveResult.changed_coords] = moveResult.isValid
+        lastResult = moveResult
+        stepCount += 1
+
+        if frame_is_over(policy, stepCount, steps, deadline, moveResult.isValid):
+            break
 
-def is_mouse_on_cell(cell: SudokuCell, mousePos: list) -> bool:
-    if((mousePos[0] > cell.position[0] and mousePos[0] <= cell.position[0] + cell.size[0]) and
-       (mousePos[1] > cell.position[1] and mousePos[1] <= cell.position[1] + cell.size[1])):
-        return True
-    else:
-        return False
+    return changedCoords, lastResult, False
@@ -0,0 +1,18 @@
+"""
+Builds the solver kernel (sudoku/sudokukernel.py) with mypyc, which makes the 'bitmask' strategy a few times faster
+
+    python setup_kernel.py build_ext --inplace
+
+    It needs mypy (pip install mypy) and a C compiler. The compiled module (sudoku/sudokukernel.*.so) is put
+    next to sudokukernel.py and python imports it instead of the .py file, deleting it goes back
+    to the pure python kernel (is_compiled in sudokukernel tells which one is used,
+    python -m sudoku bench --kernel compares them).
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(name='sudoku-kernel',
+      packages=[],
+      py_modules=[],
+      ext_modules=mypycify(['sudoku/sudokukernel.py'], opt_level='3'))
@@ -0,0 +1,9 @@
+"""
+Runs the command-line interface of the sudoku package (python -m sudoku)
+"""
+
+import sys
+from sudoku.sudokucli import main
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,8 +10,8 @@ Methods used to solve a sudoku board
 """
 
 from copy import deepcopy
-from requestsJson import get_data_from_json_site
-from sudokuexceptions import BoardError, ArgumentError
+from sudoku.requestsJson import get_data_from_json_site
+from sudoku.sudokuexceptions import BoardError, ArgumentError
 
 # char meaning the spot is empty
 emptySpotChar = '0'
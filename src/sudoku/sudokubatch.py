@@ -0,0 +1,429 @@
+"""
+Methods used to solve many boards at once
+
+    Main methods:
+        solve_board -- solves a single board and returns the solution with the stats of solving it
+        solve_boards -- solves the given boards (optionally in a pool of processes), yielding the results in order
+        hash_boards -- computes the canonical hashes of the given boards (optionally in a pool of processes)
+        dedupe_boards -- yields only the first of the boards equal up to symmetry
+        rate_boards -- rates how hard the given boards are for a human (optionally in a pool of processes)
+
+    solve_boards can propagate the boards with NumPy first (see sudokunumpy), it's only needed for that.
+"""
+
+import itertools
+import multiprocessing
+import os
+from sudoku.sudokuboard import SudokuBoard, checkpointStrategies
+from sudoku.sudokucanon import canonical_hash
+from sudoku.sudokucheckpoint import get_checkpoint_name
+from sudoku.sudokuexceptions import ArgumentError, BoardError
+from sudoku.sudokukernel import board_to_cells, cells_to_board
+from sudoku.sudokurating import rate
+
+try:
+    from sudoku.sudokunumpy import propagate_boards
+except ImportError:
+    # NumPy isn't installed
+    propagate_boards = None
+
+# number of boards propagated together by solve_boards with propagate (the rest of them waits in the iterable)
+propagationBatchSize = 4096
+
+
+def solve_board(board, strategy='bitmask', emptySpotChar='0', cache=None, timeout=None, maxNodes=None,
+                checkpointDir=None, checkpointInterval=60):
+    """
+    Solves a single board.
+
+    Arguments:
+        board {tuple of lists} -- the tuple contains lists(rows), and the lists contain the actual elements
+
+    Keyword Arguments:
+        strategy {str} -- strategy used by SudokuBoard.solve (default: {'bitmask'})
+        emptySpotChar {char} -- char meaning the spot is empty (default: {'0'})
+        cache {SolutionCache} -- cache of solutions used by SudokuBoard.solve (default: {None})
+        timeout {float} -- seconds the search can take (default: {None} (no limit))
+        maxNodes {int} -- nums the search can place (default: {None} (no limit))
+        checkpointDir {str} -- directory the search is saved to now and then (one file per board and strategy,
+        see get_checkpoint_name), so solving the board again resumes it (default: {None})
+        checkpointInterval {float} -- seconds between the saves (default: {60})
+
+    Returns:
+        {tuple} -- the solved board (or None if it's unsolvable or the budget was exceeded) and the stats
+        of solving it (with the reason under 'exceeded' if the budget was exceeded)
+    """
+
+    sudokuBoard = SudokuBoard(board, emptySpotChar=emptySpotChar)
+
+    checkpointFile = None
+    if checkpointDir is not None:
+        checkpointFile = os.path.join(checkpointDir, get_checkpoint_name(
+            board_to_cells(sudokuBoard.board, emptySpotChar), strategy))
+
+    solution = sudokuBoard.solve(True, strategy, cache, timeout, maxNodes, checkpointFile=checkpointFile,
+                                 checkpointInterval=checkpointInterval)
+
+    return solution or None, sudokuBoard.solveStats
+
+
+def solve_boards(boards, strategy='bitmask', workers=1, emptySpotChar='0', chunkSize=8, cache=None,
+                 hardestFirst=False, timeout=None, maxNodes=None, checkpointDir=None, checkpointInterval=60,
+                 propagate=False, profiler=None):
+    """
+    Solves the given boards, yielding the results in the same order.
+
+    Arguments:
+        boards {iterable of tuples of lists}
+
+    Keyword Arguments:
+        strategy {str} -- strategy used by SudokuBoard.solve (default: {'bitmask'})
+        workers {int} -- number of processes solving the boards (default: {1})
+        emptySpotChar {char} -- char meaning the spot is empty (default: {'0'})
+        chunkSize {int} -- number of boards sent to a process at once (default: {8})
+        cache {SolutionCache} -- cache of solutions, it's used in this process only (boards found in it
+        aren't sent to the pool, and the solutions from the pool are stored in it) (default: {None})
+        hardestFirst {bool} -- send the boards to the pool in the order of SudokuBoard.estimate_cost, the most
+        expensive first, so they don't end up running alone at the end (the results are still yielded
+        in the same order as the boards) (default: {False})
+        timeout {float} -- seconds the search of every board can take (default: {None} (no limit))
+        maxNodes {int} -- nums the search of every board can place (default: {None} (no limit))
+        checkpointDir {str} -- directory the searches are saved to now and then, so solving the boards again
+        (e.g. after the machine was taken away) resumes the unfinished ones (see solve_board) (default: {None})
+        checkpointInterval {float} -- seconds between the saves of every search (default: {60})
+        propagate {bool} -- place the naked and hidden singles of many boards at once with NumPy first
+        (see sudokunumpy), only the boards it doesn't solve are searched (as they are after propagating,
+        also in the cache and the checkpoints), their stats get 'propagated' (default: {False})
+        profiler {SamplingProfiler} -- samples the solving of every board under the scope
+        (strategy, 'board <its number from 1>'), and the propagating under (strategy, 'propagation'),
+        see sudokuprofile (default: {None})
+
+    Raises:
+        ArgumentError: workers must be positive.
+        ArgumentError: Strategy 'parallel' can't be used with many workers.
+        ArgumentError: Checkpoints are only supported by the 'backtrack' and 'bitmask' strategies.
+        ArgumentError: Propagating needs NumPy (pip install numpy).
+        ArgumentError: Profiling can't be used with many workers.
+
+    Yields:
+        {tuple} -- the solved board (or None if it's unsolvable) and the stats of solving it
+        (if the budget was exceeded, the stats contain the reason under 'exceeded',
+        if the board is incorrect, the stats contain only the error)
+    """
+
+    if workers < 1:
+        raise ArgumentError('workers must be positive.')
+    if workers > 1 and strategy == 'parallel':
+        # the processes of a pool can't start processes of their own
+        raise ArgumentError("Strategy 'parallel' can't be used with many workers.")
+    if checkpointDir is not None and strategy not in checkpointStrategies:
+        raise ArgumentError("Checkpoints are only supported by the 'backtrack' and 'bitmask' strategies.")
+    if propagate and propagate_boards is None:
+        raise ArgumentError('Propagating needs NumPy (pip install numpy).')
+    if workers > 1 and profiler is not None:
+        # the profiler only sees this process
+        raise ArgumentError("Profiling can't be used with many workers.")
+
+    if propagate:
+        yield from _solve_boards_propagated(boards, strategy, workers, emptySpotChar, chunkSize, cache,
+                                            hardestFirst, timeout, maxNodes, checkpointDir, checkpointInterval,
+                                            profiler)
+        return
+
+    if workers == 1:
+        for boardI, board in enumerate(boards):
+            yield _solve_profiled_job((board, strategy, emptySpotChar, cache, timeout, maxNodes, checkpointDir,
+                                       checkpointInterval), profiler, boardI + 1)
+        return
+
+    if cache is not None:
+        yield from _solve_boards_with_cache(list(boards), strategy, workers, emptySpotChar, chunkSize, cache,
+                                            hardestFirst, timeout, maxNodes, checkpointDir, checkpointInterval)
+        return
+
+    if hardestFirst:
+        yield from _solve_boards_hardest_first(list(boards), strategy, workers, emptySpotChar, chunkSize,
+                                               timeout, maxNodes, checkpointDir, checkpointInterval)
+        return
+
+    jobs = ((board, strategy, emptySpotChar, None, timeout, maxNodes, checkpointDir, checkpointInterval)
+            for board in boards)
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap(_solve_job, jobs, chunkSize)
+
+
+def _solve_boards_hardest_first(boards, strategy, workers, emptySpotChar, chunkSize, timeout=None, maxNodes=None,
+                                checkpointDir=None, checkpointInterval=60):
+    """
+    Solves the boards in a pool starting with the most expensive ones, yielding the results in the original order.
+    """
+
+    costs = [_estimate_cost(board, emptySpotChar) for board in boards]
+    order = sorted(range(len(boards)), key=lambda boardI: -costs[boardI])
+
+    jobs = ((boardI, (boards[boardI], strategy, emptySpotChar, None, timeout, maxNodes, checkpointDir,
+                      checkpointInterval))
+            for boardI in order)
+
+    results = {}
+    nextBoardI = 0
+    with multiprocessing.Pool(workers) as pool:
+        for boardI, result in pool.imap_unordered(_solve_indexed_job, jobs, chunkSize):
+            results[boardI] = result
+
+            # yield everything that's ready in order
+            while nextBoardI in results:
+                yield results.pop(nextBoardI)
+                nextBoardI += 1
+
+
+def _solve_boards_propagated(boards, strategy, workers, emptySpotChar, chunkSize, cache=None, hardestFirst=False,
+                             timeout=None, maxNodes=None, checkpointDir=None, checkpointInterval=60, profiler=None):
+    """
+    Propagates the boards propagationBatchSize at a time and searches only the ones which aren't solved by it,
+    yielding the results in the original order.
+    """
+
+    boards = iter(boards)
+    boardCount = 0
+    while True:
+        batch = list(itertools.islice(boards, propagationBatchSize))
+        if not batch:
+            return
+
+        results = [None] * len(batch)
+
+        # boards of the same shape are propagated together
+        shapes = {}
+        for boardI, board in enumerate(batch):
+            try:
+                sudokuBoard = SudokuBoard(board, emptySpotChar=emptySpotChar)
+            except BoardError as error:
+                results[boardI] = (None, {'error': error.message})
+                continue
+
+            shape = (len(sudokuBoard.board), sudokuBoard.boxRows, sudokuBoard.boxCols)
+            shapes.setdefault(shape, []).append((boardI, board_to_cells(sudokuBoard.board, emptySpotChar)))
+
+        searchedIndexes = []
+        searchedBoards = []
+        for (size, boxRows, boxCols), shapeBoards in shapes.items():
+            givens = [cells for _, cells in shapeBoards]
+            try:
+                if profiler is None:
+                    propagated, solved, unsolvable = propagate_boards(givens, size, boxRows, boxCols)
+                else:
+                    propagated, solved, unsolvable = profiler.run((strategy, 'propagation'), propagate_boards,
+                                                                  givens, size, boxRows, boxCols)
+            except BoardError:
+                # one of them is incorrect, the search tells which
+                propagated, solved, unsolvable = givens, [False] * len(givens), [False] * len(givens)
+
+            for (boardI, _), cells, isSolved, isUnsolvable in zip(shapeBoards, propagated, solved, unsolvable):
+                if isSolved or isUnsolvable:
+                    results[boardI] = (cells_to_board(cells, size) if isSolved else None,
+                                       {'nodes': 0, 'backtracks': 0, 'strategy': strategy, 'propagated': True})
+                else:
+                    searchedIndexes.append(boardI)
+                    searchedBoards.append(cells_to_board(cells, size))
+
+        if profiler is None:
+            searchedResults = solve_boards(searchedBoards, strategy, workers, '0', chunkSize, cache, hardestFirst,
+                                           timeout, maxNodes, checkpointDir, checkpointInterval)
+        else:
+            # one worker, solved here so the boards keep their numbers in the profile
+            searchedResults = (_solve_profiled_job((board, strategy, '0', cache, timeout, maxNodes, checkpointDir,
+                                                    checkpointInterval), profiler, boardCount + boardI + 1)
+                               for boardI, board in zip(searchedIndexes, searchedBoards))
+
+        for boardI, (solution, stats) in zip(searchedIndexes, searchedResults):
+            if 'error' not in stats:
+                stats['propagated'] = True
+            results[boardI] = (solution, stats)
+
+        boardCount += len(batch)
+        yield from results
+
+
+def _estimate_cost(board, emptySpotChar):
+    try:
+        return SudokuBoard(board, emptySpotChar=emptySpotChar).estimate_cost()['cost']
+    except BoardError:
+        # incorrect boards fail right away
+        return 0
+
+
+def _solve_boards_with_cache(boards, strategy, workers, emptySpotChar, chunkSize, cache, hardestFirst=False,
+                             timeout=None, maxNodes=None, checkpointDir=None, checkpointInterval=60):
+    """
+    Looks the boards up in the cache and solves only the missing ones in the pool.
+    """
+
+    results = [None] * len(boards)
+    missingBoards = []
+    for boardI, board in enumerate(boards):
+        try:
+            sudokuBoard = SudokuBoard(board, emptySpotChar=emptySpotChar)
+            cells = board_to_cells(sudokuBoard.board, emptySpotChar)
+        except BoardError as error:
+            results[boardI] = (None, {'error': error.message})
+            continue
+
+        solution = cache.lookup(cells, len(board))
+        if solution is None:
+            missingBoards.append((boardI, cells))
+        elif solution:
+            results[boardI] = (cells_to_board(solution, len(board)), {'nodes': 0, 'backtracks': 0,
+                                                                      'strategy': strategy, 'cached': True})
+        else:
+            results[boardI] = (None, {'nodes': 0, 'backtracks': 0, 'strategy': strategy, 'cached': True})
+
+    solvedBoards = solve_boards([boards[boardI] for boardI, _ in missingBoards],
+                                strategy, workers, emptySpotChar, chunkSize, hardestFirst=hardestFirst,
+                                timeout=timeout, maxNodes=maxNodes, checkpointDir=checkpointDir,
+                                checkpointInterval=checkpointInterval)
+
+    for (boardI, cells), result in zip(missingBoards, solvedBoards):
+        results[boardI] = result
+
+        if 'error' not in result[1] and 'exceeded' not in result[1]:
+            cache.store(cells, len(boards[boardI]), result[0] and board_to_cells(result[0], emptySpotChar))
+
+    yield from results
+
+
+def hash_boards(boards, workers=1, emptySpotChar='0', chunkSize=256):
+    """
+    Computes the canonical hashes of the given boards, yielding them in the same order.
+
+    Arguments:
+        boards {iterable of tuples of lists}
+
+    Keyword Arguments:
+        workers {int} -- number of processes hashing the boards (default: {1})
+        emptySpotChar {char} -- char meaning the spot is empty (default: {'0'})
+        chunkSize {int} -- number of boards sent to a process at once (default: {256})
+
+    Raises:
+        ArgumentError: workers must be positive.
+
+    Yields:
+        {str} -- the hash (see sudokucanon.canonical_hash) or None if the board is incorrect
+    """
+
+    if workers < 1:
+        raise ArgumentError('workers must be positive.')
+
+    jobs = ((board, emptySpotChar) for board in boards)
+
+    if workers == 1:
+        for job in jobs:
+            yield _hash_job(job)
+        return
+
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap(_hash_job, jobs, chunkSize)
+
+
+def dedupe_boards(boards, workers=1, emptySpotChar='0', chunkSize=256):
+    """
+    Yields the boards which aren't equal up to symmetry to any board before them.
+    Only the hashes of the boards seen are kept in memory.
+
+    Arguments:
+        boards {iterable of tuples of lists}
+
+    Keyword Arguments:
+        workers {int} -- number of processes hashing the boards (default: {1})
+        emptySpotChar {char} -- char meaning the spot is empty (default: {'0'})
+        chunkSize {int} -- number of boards sent to a process at once (default: {256})
+
+    Yields:
+        {tuple} -- the board and its hash (None if the board is incorrect, those are never dropped)
+    """
+
+    # the boards are iterated twice, once by the pool and once here
+    boards, hashedBoards = itertools.tee(boards)
+
+    seenHashes = set()
+    for board, boardHash in zip(boards, hash_boards(hashedBoards, workers, emptySpotChar, chunkSize)):
+        if boardHash in seenHashes:
+            continue
+
+        if boardHash is not None:
+            seenHashes.add(boardHash)
+
+        yield board, boardHash
+
+
+def rate_boards(boards, workers=1, emptySpotChar='0', chunkSize=64):
+    """
+    Rates how hard the given boards are for a human (see sudokurating), yielding the ratings in the same order.
+
+    Arguments:
+        boards {iterable of tuples of lists}
+
+    Keyword Arguments:
+        workers {int} -- number of processes rating the boards (default: {1})
+        emptySpotChar {char} -- char meaning the spot is empty (default: {'0'})
+        chunkSize {int} -- number of boards sent to a process at once (default: {64})
+
+    Raises:
+        ArgumentError: workers must be positive.
+
+    Yields:
+        {dict} -- the rating (if the board is incorrect, it contains only the error)
+    """
+
+    if workers < 1:
+        raise ArgumentError('workers must be positive.')
+
+    jobs = ((board, emptySpotChar) for board in boards)
+
+    if workers == 1:
+        for job in jobs:
+            yield _rate_job(job)
+        return
+
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap(_rate_job, jobs, chunkSize)
+
+
+def _rate_job(job):
+    board, emptySpotChar = job
+
+    try:
+        return rate(board_to_cells(board, emptySpotChar), len(board))
+    except BoardError as error:
+        return {'error': error.message}
+    except ValueError:
+        return {'error': 'Unknown char in board'}
+
+
+def _hash_job(job):
+    board, emptySpotChar = job
+
+    try:
+        return canonical_hash(board_to_cells(board, emptySpotChar), len(board))
+    except (BoardError, ValueError, TypeError):
+        return
+
+
+def _solve_profiled_job(job, profiler, boardNumber):
+    if profiler is None:
+        return _solve_job(job)
+
+    return profiler.run((job[1], 'board {}'.format(boardNumber)), _solve_job, job)
+
+
+def _solve_indexed_job(indexedJob):
+    boardI, job = indexedJob
+
+    return boardI, _solve_job(job)
+
+
+def _solve_job(job):
+    try:
+        return solve_board(*job)
+    except BoardError as error:
+        return None, {'error': error.message}
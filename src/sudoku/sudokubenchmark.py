@@ -0,0 +1,286 @@
+"""
+Module comparing how fast the strategies of SudokuBoard.solve are on the same boards (python -m sudoku bench)
+
+    Main methods:
+        get_sample_boards -- returns the boards of sudokusamples
+        run_benchmark -- solves every board with every strategy and yields the results
+        run_kernel_benchmark -- solves every board with the pure python and the compiled kernel and yields the results
+        format_benchmark -- formats the results as a table
+        get_speedup -- returns how many times faster a column of the results is than another one
+"""
+
+import importlib.util
+import os
+import time
+from sudoku import sudokukernel
+from sudoku import sudokusamples
+from sudoku.sudokuboard import SudokuBoard
+from sudoku.sudokubudget import Budget
+from sudoku.sudokukernel import board_to_cells, SOLVED
+from sudoku.sudokusat import solve_sat
+
+# strategies compared by default
+benchmarkStrategies = ('backtrack', 'bitmask', 'sat')
+
+# column of the external SAT solver (see run_benchmark)
+EXTERNAL = 'external'
+
+# columns of run_kernel_benchmark
+PYTHON_KERNEL = 'python'
+COMPILED_KERNEL = 'mypyc'
+
+
+def get_sample_boards():
+    """
+    Returns:
+        {list of tuples} -- (name, board) for every board of sudokusamples
+    """
+
+    boards = []
+    for name in ('boards9', 'boards12', 'boards15', 'boards16', 'boards18', 'boards25', 'boards36'):
+        for boardI, board in enumerate(getattr(sudokusamples, name, ())):
+            boards.append(('{}[{}]'.format(name, boardI), board))
+
+    return boards
+
+
+def run_benchmark(boards, strategies=benchmarkStrategies, repeat=1, timeout=None, satSolver=None, profiler=None):
+    """
+    Solves every board with every strategy.
+
+    Arguments:
+        boards {list of tuples} -- (name, board) for every board
+
+    Keyword Arguments:
+        strategies {tuple of str} -- strategies of SudokuBoard.solve (default: {benchmarkStrategies})
+        repeat {int} -- times every board is solved with every strategy, the fastest time is kept (default: {1})
+        timeout {float} -- seconds a strategy can take on a single board (default: {None} (no limit))
+        satSolver {str} -- name or path of an external SAT solver (see solve_sat) compared as EXTERNAL,
+        'auto' finds one on the PATH (default: {None} (none))
+        profiler {SamplingProfiler} -- samples every solve under the scope (strategy, name of the board),
+        the times include its overhead (see sudokuprofile) (default: {None})
+
+    Raises:
+        ArgumentError: if a strategy or the SAT solver is incorrect
+
+    Yields:
+        {dict} -- name and size of the board and results (status, time, nodes and backtracks) of every strategy
+    """
+
+    for name, board in boards:
+        results = {}
+        for strategy in strategies:
+            results[strategy] = _time_strategy(board, strategy, repeat, timeout, profiler, (strategy, name))
+
+        if satSolver is not None:
+            results[EXTERNAL] = _time_external_solver(board, satSolver, repeat, timeout, profiler, (EXTERNAL, name))
+
+        yield {'name': name, 'size': len(board), 'results': results}
+
+
+def run_kernel_benchmark(boards, repeat=1):
+    """
+    Solves every board with the bitmask kernel (the search of 'bitmask'), once with sudokukernel.py
+    and once with the module compiled by setup_kernel.py (if it was built, see sudokukernel.is_compiled).
+    Both do exactly the same search, so the nodes are the same and only the times differ.
+
+    Arguments:
+        boards {list of tuples} -- (name, board) for every board
+
+    Keyword Arguments:
+        repeat {int} -- times every board is solved by every kernel, the fastest time is kept (default: {1})
+
+    Raises:
+        BoardError: if a board is incorrect (see KernelSolver)
+
+    Yields:
+        {dict} -- name and size of the board and results of PYTHON_KERNEL and COMPILED_KERNEL (see run_benchmark)
+    """
+
+    kernels = {PYTHON_KERNEL: _load_python_kernel()}
+    if sudokukernel.is_compiled():
+        kernels[COMPILED_KERNEL] = sudokukernel
+
+    for name, board in boards:
+        cells = board_to_cells(board)
+
+        results = {}
+        for kernelName, kernelModule in kernels.items():
+            results[kernelName] = _time_kernel(kernelModule, cells, len(board), repeat)
+
+        yield {'name': name, 'size': len(board), 'results': results}
+
+
+def get_speedup(rows, baseline, column):
+    """
+    Returns:
+        {float} -- the total time of baseline divided by the total time of column, over the boards both solved
+        (None if there are none)
+    """
+
+    baselineTime = columnTime = 0
+    for row in rows:
+        baselineResult = row['results'].get(baseline)
+        columnResult = row['results'].get(column)
+        if (baselineResult is None or columnResult is None or
+           baselineResult['status'] != SOLVED or columnResult['status'] != SOLVED):
+            continue
+
+        baselineTime += baselineResult['time']
+        columnTime += columnResult['time']
+
+    if not columnTime:
+        return
+
+    return baselineTime / columnTime
+
+
+def format_benchmark(rows, strategies=benchmarkStrategies):
+    """
+    Formats the results of run_benchmark as a table (time in ms and nodes of every strategy,
+    with the totals of the boards every strategy solved in the last row).
+
+    Arguments:
+        rows {list of dicts} -- (see run_benchmark)
+
+    Keyword Arguments:
+        strategies {tuple of str} -- columns of the table (default: {benchmarkStrategies})
+
+    Returns:
+        {str}
+    """
+
+    columnWidth = 22
+    lines = ['{:<14}{:>6}'.format('board', 'size') + ''.join(['{:>{}}'.format(strategy, columnWidth)
+                                                             for strategy in strategies])]
+
+    totals = {strategy: [0, 0, 0] for strategy in strategies}
+    for row in rows:
+        line = '{:<14}{:>6}'.format(row['name'], '{0}x{0}'.format(row['size']))
+        for strategy in strategies:
+            result = row['results'].get(strategy)
+            if result is None:
+                cell = '-'
+            elif result['status'] == SOLVED:
+                cell = '{:.1f}ms {}n'.format(result['time'] * 1000, result['nodes'])
+                totals[strategy][0] += 1
+                totals[strategy][1] += result['time']
+                totals[strategy][2] += result['nodes']
+            else:
+                cell = result['status']
+            line += '{:>{}}'.format(cell, columnWidth)
+        lines.append(line)
+
+    line = '{:<20}'.format('solved (total)')
+    for strategy in strategies:
+        solvedCount, totalTime, totalNodes = totals[strategy]
+        line += '{:>{}}'.format('{} ({:.1f}ms {}n)'.format(solvedCount, totalTime * 1000, totalNodes), columnWidth)
+    lines.append(line)
+
+    return '\n'.join(lines)
+
+
+def _call(profiler, scope, function, *args, **kwargs):
+    """
+    Calls the function, under the profiler if there is one.
+    """
+
+    if profiler is None:
+        return function(*args, **kwargs)
+
+    return profiler.run(scope, function, *args, **kwargs)
+
+
+def _time_strategy(board, strategy, repeat, timeout, profiler=None, scope=()):
+    """
+    Returns:
+        {dict} -- status ('solved', 'unsolvable' or 'exceeded'), the fastest time (in seconds),
+        nodes and backtracks of solving the board with the strategy
+    """
+
+    result = None
+    for _ in range(repeat):
+        sudokuBoard = SudokuBoard(tuple([list(row) for row in board]))
+
+        startTime = time.perf_counter()
+        solution = _call(profiler, scope, sudokuBoard.solve, True, strategy, timeout=timeout)
+        solveTime = time.perf_counter() - startTime
+
+        if solution:
+            status = SOLVED
+        elif 'exceeded' in sudokuBoard.solveStats:
+            status = 'exceeded'
+        else:
+            status = 'unsolvable'
+
+        if result is None or solveTime < result['time']:
+            result = {'status': status, 'time': solveTime, 'nodes': sudokuBoard.solveStats['nodes'],
+                      'backtracks': sudokuBoard.solveStats['backtracks']}
+
+        if status == 'exceeded':
+            # it would only be exceeded again
+            break
+
+    return result
+
+
+def _load_python_kernel():
+    """
+    Returns:
+        {module} -- sudokukernel.py as a separate module (even if the compiled one is imported as sudokukernel)
+    """
+
+    spec = importlib.util.spec_from_file_location('sudoku._pythonkernel',
+                                                  os.path.join(os.path.dirname(__file__), 'sudokukernel.py'))
+    kernelModule = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(kernelModule)
+
+    return kernelModule
+
+
+def _time_kernel(kernelModule, cells, size, repeat):
+    """
+    Returns:
+        {dict} -- (see _time_strategy) for the KernelSolver of the module
+    """
+
+    result = None
+    for _ in range(repeat):
+        startTime = time.perf_counter()
+        kernel = kernelModule.KernelSolver(cells, size)
+        status = kernel.solve()
+        solveTime = time.perf_counter() - startTime
+
+        if result is None or solveTime < result['time']:
+            result = {'status': status, 'time': solveTime, 'nodes': kernel.nodes, 'backtracks': kernel.backtracks}
+
+    return result
+
+
+def _time_external_solver(board, satSolver, repeat, timeout, profiler=None, scope=()):
+    """
+    Returns:
+        {dict} -- (see _time_strategy) for the external SAT solver, time includes encoding the board
+    """
+
+    size = len(board)
+    cells = board_to_cells(board)
+
+    result = None
+    for _ in range(repeat):
+        startTime = time.perf_counter()
+        status, _, stats = _call(profiler, scope, solve_sat, cells, size,
+                                 budget=None if timeout is None else Budget(timeout), solver=satSolver)
+        solveTime = time.perf_counter() - startTime
+
+        if 'exceeded' in stats:
+            status = 'exceeded'
+
+        if result is None or solveTime < result['time']:
+            result = {'status': status, 'time': solveTime, 'nodes': stats['nodes'], 'backtracks': stats['backtracks'],
+                      'solver': stats['solver']}
+
+        if status == 'exceeded':
+            break
+
+    return result
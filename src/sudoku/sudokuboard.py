@@ -2,9 +2,26 @@
 Module containing the class SudokuBoard used to store, solve or print the given board
 """
 
+import math
+import time
 from copy import deepcopy
 from sudoku.requestsJson import get_data_from_json_site
+from sudoku.sudokubudget import Budget, BudgetExceeded, NODES
+from sudoku.sudokucandidates import CandidateGrid
+from sudoku.sudokucheckpoint import Checkpointer
 from sudoku.sudokuexceptions import BoardError, ArgumentError
+from sudoku.sudokukernel import KernelSolver, board_to_cells, cells_to_board, get_box_shape, SOLVED, PAUSED
+from sudoku.sudokukernel import iter_solutions
+from sudoku.sudokuparallel import solve_parallel
+from sudoku.sudokurating import rate
+from sudoku.sudokusat import solve_sat, encode_board, to_dimacs
+from sudoku.sudokuvalue import Board
+
+# algorithms solve can use
+strategies = ('backtrack', 'bitmask', 'parallel', 'sat')
+
+# strategies whose search can be saved to a checkpoint file and resumed
+checkpointStrategies = ('backtrack', 'bitmask')
 
 
 class SudokuBoard:
@@ -15,6 +32,8 @@ class SudokuBoard:
             board {a tuple of lists} -- the tuple contains lists(rows),
             and the lists contain the actual elements
             or
+            {Board} -- compact board (see sudokuvalue)
+            or
             if board equals 'random' or 'rand' or 'r' it generates a random board from an api
             (https://sugoku.herokuapp.com/board)
 
@@ -24,17 +43,24 @@ class SudokuBoard:
             emptySpotChar {char} -- char meaning the spot is empty in the given board (default: {'0'})
             constMarker {char} -- char used for marking spots the algorithm mustn't change (default: {'$'})
             correctWrongChars {bool} -- if True, every unknown char will be marked as emp
+            boxRows {int} -- row count of a single square (default: {None} (see get_box_shape in sudokukernel,
+            3x3 for 9x9, 4x4 for 16x16, 3x4 for 12x12...))
+            boxCols {int} -- column count of a single square (default: {None} (size // boxRows))
+            constraints {list of Constraints} -- extra rules of the board, e.g. diagonals, jigsaw regions
+            or killer cages (see sudokuconstraints), solve keeps to them (default: {None})
 
         Raises:
             ArgumentError: Incorrect difficulty ('easy', 'medium' or 'hard').
             ArgumentError: Incorrect board command (Try 'random', 'rand' or 'r' to generate a random board.
             ArgumentError: constMarker cannot be empty.
             ArgumentError: correctWrongChars must be boolean.
-            BoardError: Board's size must be a multiple of 3.
+            BoardError: Board's size must be divisible into squares.
             BoardError: Board's row count and row length must be uniform.
+            BoardError: if a constraint doesn't fit the board
     """
 
-    def __init__(self, board, difficulty='N/A', emptySpotChar='0', correctWrongChars=False, constMarker='$'):
+    def __init__(self, board, difficulty='N/A', emptySpotChar='0', correctWrongChars=False, constMarker='$',
+                 boxRows=None, boxCols=None, constraints=None):
 
         # char meaning the spot is empty
         self.emptySpotChar = emptySpotChar
@@ -47,6 +73,9 @@ class SudokuBoard:
             raise ArgumentError("Incorrect difficulty ('N/A', 'easy', 'medium' or 'hard').")
 
 
+        if isinstance(board, Board):
+            board = board.to_rows(emptySpotChar)
+
         # check if they tried to generate a board
         try:
             # board is set to be random
@@ -57,9 +86,8 @@ class SudokuBoard:
             # board is a board
 
             # general checks if the board is valid for sudoku
-            if len(board) % 3 != 0 or len(board) == 0:
-                raise BoardError("Board's size must be a multiple of 3.")
-            elif not(self._is_board_square(board)):
+            get_box_shape(len(board), boxRows, boxCols)
+            if not(self._is_board_square(board)):
                 raise BoardError("Board's row count and row length must be uniform.")
 
             self.board = board
@@ -75,11 +103,16 @@ class SudokuBoard:
                 self.board = self.generate_board_from_api(self.difficulty)
             else:
                 raise ArgumentError("Incorrect board command (Try 'random', 'rand' or 'r' to generate a random board).")
-        finally:
-            # board backup is used to reset the board if needed
-            self.boardBackup = deepcopy(self.board)
 
 
+        # shape of the squares
+        self.boxRows, self.boxCols = get_box_shape(len(self.board), boxRows, boxCols)
+
+        # extra rules of the board (binding them checks they fit it)
+        self.constraints = tuple(constraints or ())
+        for constraint in self.constraints:
+            constraint.bind(len(self.board))
+
         # numbers that can be used in the board
         self._possibleNums = tuple([str(i)
                                     for i in range(1, len(self.board) + 1)])
@@ -93,7 +126,9 @@ class SudokuBoard:
 
         # ensuring the board elements types
         self.board = self._ensure_board_types(self.board, self._correctWrongChars)
-        self.boardBackup = self._ensure_board_types(self.boardBackup, self._correctWrongChars)
+
+        # board backup is used to reset the board if needed (it's immutable, so it never has to be copied)
+        self.boardBackup = tuple([tuple(row) for row in self.board])
 
 
         if constMarker == '':
@@ -102,6 +137,9 @@ class SudokuBoard:
         # the constMarker is for constant values that CANNOT be changed by the algorithm
         self._constMarker = constMarker
 
+        # stats of the last solve (strategy, nodes, backtracks and time)
+        self.solveStats = {}
+
     def __getitem__(self, key):
         return self.board[key]
 
@@ -147,130 +185,447 @@ class SudokuBoard:
         return boardStr
 
 
-    def solve(self, copyBoard=False):
+    def solve(self, copyBoard=False, strategy='backtrack', cache=None, timeout=None, maxNodes=None, cancelToken=None,
+              checkpointFile=None, checkpointInterval=60):
         """
-        Solves the stored board.
+        Solves the stored board (the stats of solving it are stored in solveStats).
 
         Keyword Arguments:
             copyBoard {bool} -- should the method work on a copied board and just return it (True)
             or just work with the original (False) (default: {False})
+            strategy {str} -- 'backtrack' (fills the spots in order), 'bitmask' (sudokukernel,
+            fills the spot with the fewest candidates first, a lot faster), 'parallel' (sudokuparallel,
+            the bitmask search split between all cores, for single very hard boards) or 'sat' (sudokusat,
+            a clause learning SAT solver, for boards the searches thrash on) (default: {'backtrack'})
+            cache {SolutionCache} -- if given, the solution is looked up in it first
+            (also for boards which only differ from a cached one by symmetry) and stored in it after solving,
+            it isn't used for boards with constraints (default: {None})
+            timeout {float} -- seconds the search can take (default: {None} (no limit))
+            maxNodes {int} -- nums the search can place (default: {None} (no limit))
+            cancelToken {CancelToken} -- lets another thread stop the search (see sudokubudget) (default: {None})
+            checkpointFile {str} -- if given, the state of the search is saved to it every checkpointInterval seconds
+            and when the budget is exceeded, and a search saved in it is resumed instead of starting over
+            (the budget counts from there), it's removed once the search is over (see sudokucheckpoint),
+            only 'backtrack' and 'bitmask' support it (default: {None})
+            checkpointInterval {float} -- seconds between the saves (default: {60})
+
+        Raises:
+            ArgumentError: Incorrect strategy ('backtrack', 'bitmask', 'parallel' or 'sat').
+            ArgumentError: Checkpoints are only supported by the 'backtrack' and 'bitmask' strategies.
+            ArgumentError: if the checkpoint file is incorrect or belongs to another board (see Checkpointer)
+            BoardError: Incorrect search state.
 
         Returns:
             {a tuple of lists} -- the solved board
             or
-            {None} -- if the board is unsolvable
+            {None} -- if the board is unsolvable (if it's obvious from the givens, without searching,
+            solveStats contain the reason under 'contradiction', see find_contradiction)
+            or
+            {BudgetExceeded} -- (falsy) if the search stopped because of timeout, maxNodes or cancelToken,
+            it contains the reason and the stats so far (the board is left as it was)
         """
 
+        if strategy not in strategies:
+            raise ArgumentError("Incorrect strategy ('backtrack', 'bitmask', 'parallel' or 'sat').")
 
-        if copyBoard:
-            brd = deepcopy(self.board)
+        if checkpointFile is not None and strategy not in checkpointStrategies:
+            raise ArgumentError("Checkpoints are only supported by the 'backtrack' and 'bitmask' strategies.")
+
+        startTime = time.perf_counter()
+
+        contradiction = self.find_contradiction()
+        if contradiction:
+            self.solveStats = {'nodes': 0, 'backtracks': 0, 'strategy': strategy, 'contradiction': contradiction,
+                               'time': time.perf_counter() - startTime}
+            return
+
+        if self.constraints:
+            # the cache only knows the symmetries of plain boards
+            cache = None
+
+        if cache is not None:
+            size = len(self.board)
+            cells = board_to_cells(self.board, self.emptySpotChar, self._constMarker)
+
+            cachedSolution = cache.lookup(cells, size, self.boxRows, self.boxCols)
+            if cachedSolution is not None:
+                self.solveStats = {'nodes': 0, 'backtracks': 0, 'strategy': strategy, 'cached': True,
+                                   'time': time.perf_counter() - startTime}
+
+                if not cachedSolution:
+                    return
+
+                return cells_to_board(cachedSolution, size, None if copyBoard else self.board)
+
+        budget = Budget(timeout, maxNodes, cancelToken)
+        if not budget.is_limited():
+            budget = None
+
+        checkpointer = None
+        if checkpointFile is not None:
+            checkpointer = Checkpointer(checkpointFile, self._get_checkpoint_board(strategy), checkpointInterval)
+
+        if strategy == 'bitmask':
+            solution = self._solve_with_kernel(copyBoard, budget, checkpointer)
+        elif strategy == 'parallel':
+            solution = self._solve_in_parallel(copyBoard, budget)
+        elif strategy == 'sat':
+            solution = self._solve_with_sat(copyBoard, budget)
         else:
-            brd = self.board
+            solution = self._solve_with_backtracking(copyBoard, budget, checkpointer)
 
-        brd = self._mark_constants(brd)
+        self.solveStats['strategy'] = strategy
+        self.solveStats['time'] = time.perf_counter() - startTime
 
-        maxBoardIndex = len(brd) - 1
-        maxBoardRange = len(brd) + 1
+        if isinstance(solution, BudgetExceeded):
+            self.solveStats['exceeded'] = solution.reason
+            solution.stats = self.solveStats
+            return solution
 
+        if checkpointer is not None:
+            checkpointer.remove()
 
+        if cache is not None:
+            cache.store(cells, size, solution and board_to_cells(solution, self.emptySpotChar, self._constMarker),
+                        self.boxRows, self.boxCols)
 
-        rowI = elementI = 0
-        while True:
+        return solution
 
-            # if it isn't taken by a constant num
-            if brd[rowI][elementI] == self.emptySpotChar or brd[rowI][elementI] in self._possibleNums:
+    def _solve_with_kernel(self, copyBoard=False, budget=None, checkpointer=None):
+        """
+        Solves the stored board with the bitmask kernel.
 
-                # if it had already reached 9 before and it cannot increment further
-                if brd[rowI][elementI] == self._possibleNums[-1]:
+        Keyword Arguments:
+            copyBoard {bool} -- should the method work on a copied board and just return it (True)
+            or just work with the original (False) (default: {False})
+            budget {Budget} -- limits of the search (default: {None})
+            checkpointer {Checkpointer} -- resumes the search saved in it and saves it now and then (default: {None})
 
-                    # reset the spot
-                    brd[rowI][elementI] = self.emptySpotChar
+        Returns:
+            {a tuple of lists} -- the solved board
+            or
+            {None} -- if the board is unsolvable
+            or
+            {BudgetExceeded}
+        """
 
-                    # backtrack to the last available spot
-                    newCoords = self._get_bactrack_coordinates(rowI, elementI, brd)
-                    if not newCoords:
+        cells = board_to_cells(self.board, self.emptySpotChar, self._constMarker)
 
-                        # the board cannot be solved
-                        return
+        state = None if checkpointer is None else checkpointer.load()
+        if state is None:
+            kernel = KernelSolver(cells, len(self.board), self.boxRows, self.boxCols, self.constraints)
+        else:
+            kernel = KernelSolver.from_state(state, len(self.board), self.boxRows, self.boxCols, self.constraints)
 
-                    rowI = newCoords[0]
-                    elementI = newCoords[1]
+        if checkpointer is not None and budget is None:
+            # no limits, the pauses are only for the checkpoints
+            budget = Budget()
 
-                else:
-                    currentHorizontalNums = self._get_horizontal_nums(brd)[rowI]
-                    currentVerticalNums = self._get_vertical_nums(brd)[elementI]
-                    currentSquareNums = self._get_nums_in_squares(brd)[self._get_square_num(rowI, elementI, len(brd))]
+        if budget is None:
+            status = kernel.solve()
+        else:
+            # the kernel pauses every few nodes, so the budget is checked between the pauses
+            # (it counts the nodes from where the search was resumed)
+            startNodes = kernel.nodes
+            while True:
+                reason = budget.get_exceeded_reason(kernel.nodes - startNodes)
+                if reason:
+                    if checkpointer is not None:
+                        checkpointer.save(kernel.get_state())
+
+                    self.solveStats = kernel.get_stats()
+                    return BudgetExceeded(reason, self.solveStats)
+
+                if checkpointer is not None and checkpointer.is_due():
+                    checkpointer.save(kernel.get_state())
+
+                status = kernel.solve(startNodes + budget.get_node_limit(kernel.nodes - startNodes))
+                if status != PAUSED:
+                    break
 
-                    bannedNums = currentHorizontalNums | currentVerticalNums | currentSquareNums
+        self.solveStats = kernel.get_stats()
 
-                    validNums = [num
-                                 for num in range(self._get_current_num_incremented(rowI, elementI,
-                                                                                    brd),
-                                                  maxBoardRange)
-                                 if num not in bannedNums]
+        if status != SOLVED:
+            return
 
-                    # go through all nums valid nums
-                    for num in validNums:
+        if copyBoard:
+            return cells_to_board(kernel.cells, len(self.board))
 
-                        # if the num isn't already on the horizontal or vertical line or in a square
-                        if str(num) not in bannedNums:
+        return cells_to_board(kernel.cells, len(self.board), self.board)
 
-                            # set the first available num on the spot
-                            brd[rowI][elementI] = str(num)
+    def _solve_in_parallel(self, copyBoard=False, budget=None):
+        """
+        Solves the stored board with the bitmask kernel in many processes at once.
 
-                            # go forward a spot
-                            newCoords = self._get_forward_coordinates(rowI, elementI, maxBoardIndex)
-                            if not newCoords:
+        Keyword Arguments:
+            copyBoard {bool} -- should the method work on a copied board and just return it (True)
+            or just work with the original (False) (default: {False})
+            budget {Budget} -- limits of the search (default: {None})
 
-                                # final return (with the markers deleted for good measure)
-                                return self._remove_constant_marks(brd)
+        Returns:
+            {a tuple of lists} -- the solved board
+            or
+            {None} -- if the board is unsolvable
+            or
+            {BudgetExceeded}
+        """
 
-                            rowI = newCoords[0]
-                            elementI = newCoords[1]
+        status, cells, self.solveStats = solve_parallel(board_to_cells(self.board, self.emptySpotChar,
+                                                                       self._constMarker), len(self.board),
+                                                        self.boxRows, self.boxCols, budget=budget,
+                                                        constraints=self.constraints)
 
-                            break
+        if status == PAUSED:
+            return BudgetExceeded(self.solveStats['exceeded'], self.solveStats)
 
-                        # if none of the spots are available
-                        elif num == maxBoardRange - 1:
+        if status != SOLVED:
+            return
 
-                            # reset the spot
-                            brd[rowI][elementI] = self.emptySpotChar
+        return cells_to_board(cells, len(self.board), None if copyBoard else self.board)
 
-                            # backtrack to the last available spot
-                            newCoords = self._get_bactrack_coordinates(rowI, elementI, brd)
-                            if not newCoords:
+    def _solve_with_sat(self, copyBoard=False, budget=None):
+        """
+        Solves the stored board with the CDCL solver of sudokusat.
 
-                                # the board cannot be solved
-                                return
+        Keyword Arguments:
+            copyBoard {bool} -- should the method work on a copied board and just return it (True)
+            or just work with the original (False) (default: {False})
+            budget {Budget} -- limits of the search (maxNodes counts the decisions) (default: {None})
 
-                            rowI = newCoords[0]
-                            elementI = newCoords[1]
+        Returns:
+            {a tuple of lists} -- the solved board
+            or
+            {None} -- if the board is unsolvable
+            or
+            {BudgetExceeded}
+        """
+
+        status, cells, self.solveStats = solve_sat(board_to_cells(self.board, self.emptySpotChar, self._constMarker),
+                                                   len(self.board), self.boxRows, self.boxCols, self.constraints,
+                                                   budget)
+
+        if status == PAUSED:
+            return BudgetExceeded(self.solveStats['exceeded'], self.solveStats)
+
+        if status != SOLVED:
+            return
+
+        return cells_to_board(cells, len(self.board), None if copyBoard else self.board)
+
+    def _solve_with_backtracking(self, copyBoard=False, budget=None, checkpointer=None):
+        """
+        Solves the stored board going through the spots in order.
+        The nums are kept as ints and every row, column and square keeps its nums as a bitmask,
+        so a step doesn't have to look at the whole board (the steps are the same as in gen_solving_step_by_step).
+
+        Keyword Arguments:
+            copyBoard {bool} -- should the method work on a copied board and just return it (True)
+            or just work with the original (False) (default: {False})
+            budget {Budget} -- limits of the search (default: {None})
+            checkpointer {Checkpointer} -- resumes the search saved in it and saves it now and then
+            (the same state as gen_solving_step_by_step) (default: {None})
+
+        Returns:
+            {a tuple of lists} -- the solved board
+            or
+            {None} -- if the board is unsolvable
+            or
+            {BudgetExceeded}
+        """
+
+        self.solveStats = {'nodes': 0, 'backtracks': 0}
+
+        size = len(self.board)
+        cells = board_to_cells(self.board, self.emptySpotChar, self._constMarker)
+        fullMask = (1 << size) - 1
+
+        rowMasks = [0] * size
+        colMasks = [0] * size
+        squareMasks = [0] * size
+        squareOf = [self._get_square_num(rowI, elementI, size)
+                    for rowI in range(size)
+                    for elementI in range(size)]
+
+        # the constraints restricting every spot (jigsaw regions take the place of the squares)
+        spotConstraints = [()] * (size * size)
+        for constraint in self.constraints:
+            constraint = constraint.bind(size)
+            for spot in constraint.get_spots():
+                spotConstraints[spot] += (constraint,)
+            if constraint.get_regions() is not None:
+                squareOf = constraint.get_regions()
+
+        # spots which aren't taken by constant nums, in the order they're filled
+        emptySpots = [spot for spot, num in enumerate(cells) if not num]
+
+        nodes = backtracks = 0
+        spotI = 0
+
+        state = None if checkpointer is None else checkpointer.load()
+        if state is not None:
+            cells, spot, nodes, backtracks = self._load_backtracking_state(state, cells)
+            spotI = emptySpots.index(spot)
+
+        for spot, num in enumerate(cells):
+            if num:
+                bit = 1 << (num - 1)
+                rowMasks[spot // size] |= bit
+                colMasks[spot % size] |= bit
+                squareMasks[squareOf[spot]] |= bit
+                for constraint in spotConstraints[spot]:
+                    constraint.place(spot, bit)
+
+        if checkpointer is not None and budget is None:
+            # no limits, the checks are only for the checkpoints
+            budget = Budget()
+
+        # the time, the token and the checkpoints are checked every checkInterval steps, the nodes on every step
+        # (counting them from where the search was resumed)
+        steps = 0
+        nextBudgetCheck = 0
+        startNodes = nodes
+        nodeLimit = None if budget is None or budget.maxNodes is None else startNodes + budget.maxNodes
+
+        while spotI < len(emptySpots):
+
+            if budget is not None:
+                steps += 1
+                reason = NODES if nodeLimit is not None and nodes >= nodeLimit else None
+                if reason or steps >= nextBudgetCheck:
+                    reason = reason or budget.get_exceeded_reason(nodes - startNodes)
+                    if reason or checkpointer is not None and checkpointer.is_due():
+                        if checkpointer is not None:
+                            checkpointer.save({'cells': cells, 'spot': emptySpots[spotI], 'nodes': nodes,
+                                               'backtracks': backtracks})
+
+                    if reason:
+                        self.solveStats = {'nodes': nodes, 'backtracks': backtracks}
+                        return BudgetExceeded(reason, self.solveStats)
+
+                    nextBudgetCheck = steps + budget.checkInterval
+
+            spot = emptySpots[spotI]
+            rowI = spot // size
+            elementI = spot % size
+            squareI = squareOf[spot]
+
+            num = cells[spot]
+            if num:
+                # take the num back before looking for the next one
+                bit = 1 << (num - 1)
+                rowMasks[rowI] &= ~bit
+                colMasks[elementI] &= ~bit
+                squareMasks[squareI] &= ~bit
+                for constraint in spotConstraints[spot]:
+                    constraint.remove(spot, bit)
+
+            # nums bigger than the current one which aren't in the spot's row, column or square
+            candidates = fullMask & ~(rowMasks[rowI] | colMasks[elementI] | squareMasks[squareI]) & ~((1 << num) - 1)
+            for constraint in spotConstraints[spot]:
+                candidates &= constraint.allowed(spot)
+
+            if candidates:
+
+                # set the first available num on the spot and go forward a spot
+                bit = candidates & -candidates
+                cells[spot] = bit.bit_length()
+                rowMasks[rowI] |= bit
+                colMasks[elementI] |= bit
+                squareMasks[squareI] |= bit
+                for constraint in spotConstraints[spot]:
+                    constraint.place(spot, bit)
+                nodes += 1
+                spotI += 1
 
-            # if it's a constant num
             else:
 
-                # go forward a spot
-                newCoords = self._get_forward_coordinates(rowI, elementI, maxBoardIndex)
-                if not newCoords:
+                # reset the spot and backtrack to the last available one
+                cells[spot] = 0
+                backtracks += 1
+                spotI -= 1
+                if spotI < 0:
 
-                    # final return (with the markers deleted for good measure)
-                    return self._remove_constant_marks(brd)
+                    # the board cannot be solved
+                    self.solveStats = {'nodes': nodes, 'backtracks': backtracks}
+                    return
 
-                rowI = newCoords[0]
-                elementI = newCoords[1]
+        self.solveStats = {'nodes': nodes, 'backtracks': backtracks}
+
+        return cells_to_board(cells, size, None if copyBoard else self.board)
+
+    def _get_checkpoint_board(self, strategy):
+        """
+        Returns:
+            {dict} -- what a checkpoint of the strategy's search belongs to (see Checkpointer)
+        """
+
+        return {'strategy': strategy, 'size': len(self.board), 'boxRows': self.boxRows, 'boxCols': self.boxCols,
+                'cells': board_to_cells(self.board, self.emptySpotChar, self._constMarker),
+                'constraints': [repr(constraint) for constraint in self.constraints]}
+
+    def _load_backtracking_state(self, state, givens):
+        """
+        Checks the state of a backtracking search saved in a checkpoint
+        ({'cells', 'spot' (where the search is), 'nodes', 'backtracks'}).
+
+        Arguments:
+            state {dict}
+            givens {list of ints} -- the board the search belongs to
+
+        Raises:
+            BoardError: Incorrect search state.
+
+        Returns:
+            {tuple} -- (cells, spot, nodes, backtracks)
+        """
 
-    def gen_solving_step_by_step(self, copyBoard=False):
+        try:
+            cells = [int(num) for num in state['cells']]
+            spot = int(state['spot'])
+            nodes = int(state['nodes'])
+            backtracks = int(state['backtracks'])
+        except (KeyError, TypeError, ValueError):
+            raise BoardError('Incorrect search state.')
+
+        size = len(self.board)
+        if (len(cells) != len(givens) or not 0 <= spot < len(givens) or givens[spot] or
+           any(num < 0 or num > size or (given and num != given) for num, given in zip(cells, givens))):
+            raise BoardError('Incorrect search state.')
+
+        return cells, spot, nodes, backtracks
+
+    def gen_solving_step_by_step(self, copyBoard=False, checkpointFile=None, checkpointInterval=60):
         """
         solve but it yields every time it places or removes a num.
 
         Keyword Arguments:
             copyBoard {bool} -- should the method work on a copied board and just return it (True)
             or just work with the original (False) (default: {False})
+            checkpointFile {str} -- if given, the state of the search is saved to it every checkpointInterval seconds
+            and a search saved in it (also by solve with strategy 'backtrack') is resumed instead of starting over,
+            it's removed once the search is over (see sudokucheckpoint) (default: {None})
+            checkpointInterval {float} -- seconds between the saves (default: {60})
 
         Yields:
             MoveResult object containing the current board, whether the spot is valid and the current coords
+            (None if the board cannot be solved, right away if it's obvious from the givens)
+
+        Raises:
+            ArgumentError: Solving step by step doesn't support constraints.
+            ArgumentError: if the checkpoint file is incorrect or belongs to another board (see Checkpointer)
+            BoardError: Incorrect search state.
         """
 
+        if self.constraints:
+            raise ArgumentError("Solving step by step doesn't support constraints.")
+
+        if self.find_contradiction():
+            yield None
+            return
+
+        checkpointer = None
+        if checkpointFile is not None:
+            checkpointer = Checkpointer(checkpointFile, self._get_checkpoint_board('backtrack'), checkpointInterval)
 
         if copyBoard:
             brd = deepcopy(self.board)
@@ -279,30 +634,61 @@ class SudokuBoard:
 
         brd = self._mark_constants(brd)
 
+        nodes = backtracks = 0
+        rowI = elementI = 0
+
+        state = None if checkpointer is None else checkpointer.load()
+        if state is not None:
+            # the nums placed before the checkpoint, the search continues from its spot
+            cells, spot, nodes, backtracks = self._load_backtracking_state(
+                state, board_to_cells(brd, self.emptySpotChar, self._constMarker))
+            for cellI, num in enumerate(cells):
+                if num and brd[cellI // len(brd)][cellI % len(brd)] == self.emptySpotChar:
+                    brd[cellI // len(brd)][cellI % len(brd)] = str(num)
+
+            rowI, elementI = divmod(spot, len(brd))
+
         maxBoardIndex = len(brd) - 1
         maxBoardRange = len(brd) + 1
 
         possibleNums = tuple([str(i)
                               for i in range(1, maxBoardRange)])
 
-        rowI = elementI = 0
+        # candidates of every spot, kept up to date with brd
+        grid = CandidateGrid(board_to_cells(brd, self.emptySpotChar, self._constMarker), len(brd),
+                             self.boxRows, self.boxCols)
+
+        # every step's board is made with the same attributes as this one
+        boardAttr = (self.difficulty, self.emptySpotChar, False, self._constMarker, self.boxRows, self.boxCols,
+                     self.constraints)
+
         while True:
             # if it isn't taken by a constant num
             if brd[rowI][elementI] == self.emptySpotChar or brd[rowI][elementI] in possibleNums:
 
+                spot = rowI * len(brd) + elementI
+                if checkpointer is not None and checkpointer.is_due():
+                    checkpointer.save({'cells': board_to_cells(brd, self.emptySpotChar, self._constMarker),
+                                       'spot': spot, 'nodes': nodes, 'backtracks': backtracks})
+
+                # the num in the spot is going to change, so its candidates are the nums its peers leave
+                grid.remove(spot)
+
                 # if it had already reached 9 before and it cannot increment further
                 if brd[rowI][elementI] == possibleNums[-1]:
 
-                    yield self._MoveResult((rowI, elementI), False, self._remove_constant_marks(brd, True),
-                                           self.difficulty, self.emptySpotChar, False, self._constMarker)
+                    yield self._MoveResult((rowI, elementI), False, self._compact_board(brd), *boardAttr)
                     # reset the spot
                     brd[rowI][elementI] = self.emptySpotChar
+                    backtracks += 1
 
                     # backtrack to the last available spot
                     newCoords = self._get_bactrack_coordinates(rowI, elementI, brd)
                     if not(newCoords):
 
                         # the board cannot be solved
+                        if checkpointer is not None:
+                            checkpointer.remove()
                         yield None
                         return
 
@@ -311,34 +697,30 @@ class SudokuBoard:
 
                 else:
 
-                    currentHorizontalNums = self._get_horizontal_nums(brd)[rowI]
-                    currentVerticalNums = self._get_vertical_nums(brd)[elementI]
-                    currentSquareNums = self._get_nums_in_squares(brd)[self._get_square_num(rowI, elementI, len(brd))]
-
-                    bannedNums = currentHorizontalNums | currentVerticalNums | currentSquareNums
-
-                    validNums = [num
-                                 for num in range(self._get_current_num_incremented(rowI, elementI, brd), maxBoardRange)
-                                 if num not in bannedNums]
+                    candidates = grid.candidateMasks[spot]
 
-                    # go through all valid nums
-                    for num in validNums:
+                    # go through all nums bigger than the current one
+                    for num in range(self._get_current_num_incremented(rowI, elementI, brd), maxBoardRange):
 
                         # if the num isn't already on the horizontal or vertical line or in a square
-                        if str(num) not in bannedNums:
+                        if candidates >> (num - 1) & 1:
 
-                            yield self._MoveResult((rowI, elementI), True, self._remove_constant_marks(brd, True),
-                                                   self.difficulty, self.emptySpotChar, False, self._constMarker)
+                            yield self._MoveResult((rowI, elementI), True, self._compact_board(brd), *boardAttr)
                             # set the first available num on the spot
                             brd[rowI][elementI] = str(num)
+                            grid.place(spot, num)
+                            nodes += 1
 
                             # go forward a spot
                             newCoords = self._get_forward_coordinates(rowI, elementI, maxBoardIndex)
                             if not(newCoords):
 
                                 # board solved
-                                yield self._MoveResult((rowI, elementI), True, self._remove_constant_marks(brd),
-                                                       self.difficulty, self.emptySpotChar, False, self._constMarker)
+                                if checkpointer is not None:
+                                    checkpointer.remove()
+                                yield self._MoveResult((rowI, elementI), True,
+                                                       self._compact_board(self._remove_constant_marks(brd)),
+                                                       *boardAttr)
                                 return
 
                             rowI = newCoords[0]
@@ -349,16 +731,18 @@ class SudokuBoard:
                         # if none of the spots are available
                         elif (num == maxBoardRange - 1):
 
-                            yield self._MoveResult((rowI, elementI), False, self._remove_constant_marks(brd, True),
-                                                   self.difficulty, self.emptySpotChar, False, self._constMarker)
+                            yield self._MoveResult((rowI, elementI), False, self._compact_board(brd), *boardAttr)
                             # reset the spot
                             brd[rowI][elementI] = self.emptySpotChar
+                            backtracks += 1
 
                             # backtrack to the last available spot
                             newCoords = self._get_bactrack_coordinates(rowI, elementI, brd)
                             if not(newCoords):
 
                                 # the board cannot be solved
+                                if checkpointer is not None:
+                                    checkpointer.remove()
                                 yield None
                                 return
 
@@ -373,13 +757,294 @@ class SudokuBoard:
                 if not(newCoords):
 
                     # board solved
-                    yield self._MoveResult((rowI, elementI), True, self._remove_constant_marks(brd),
-                                           self.difficulty, self.emptySpotChar, False, self._constMarker)
+                    if checkpointer is not None:
+                        checkpointer.remove()
+                    yield self._MoveResult((rowI, elementI), True,
+                                           self._compact_board(self._remove_constant_marks(brd)),
+                                           *boardAttr)
                     return
 
                 rowI = newCoords[0]
                 elementI = newCoords[1]
 
+    def gen_solving_deltas(self, copyBoard=False):
+        """
+        solve but it yields only the change made in every step (a lot cheaper than a whole MoveResult).
+
+        Keyword Arguments:
+            copyBoard {bool} -- should the method work on a copied board and just return it (True)
+            or just work with the original (False) (default: {False})
+
+        Yields:
+            {tuple} -- (row index, element index, num placed in the spot or emptySpotChar if it was reset,
+            whether it went forward(True) or backtracked(False)), nothing if the board
+            obviously cannot be solved (see find_contradiction)
+
+        Raises:
+            ArgumentError: Solving step by step doesn't support constraints.
+        """
+
+        if self.constraints:
+            raise ArgumentError("Solving step by step doesn't support constraints.")
+
+        if self.find_contradiction():
+            return
+
+        if copyBoard:
+            brd = deepcopy(self.board)
+        else:
+            brd = self.board
+
+        brd = self._mark_constants(brd)
+
+        maxBoardIndex = len(brd) - 1
+        maxBoardRange = len(brd) + 1
+
+        # candidates of every spot, kept up to date with brd
+        grid = CandidateGrid(board_to_cells(brd, self.emptySpotChar, self._constMarker), len(brd),
+                             self.boxRows, self.boxCols)
+
+        rowI = elementI = 0
+        while True:
+
+            # if it's a constant num
+            if not(brd[rowI][elementI] == self.emptySpotChar or brd[rowI][elementI] in self._possibleNums):
+
+                # go forward a spot
+                newCoords = self._get_forward_coordinates(rowI, elementI, maxBoardIndex)
+                if not newCoords:
+
+                    # board solved
+                    self._remove_constant_marks(brd)
+                    return
+
+                rowI, elementI = newCoords
+                continue
+
+            # the num in the spot is going to change, so its candidates are the nums its peers leave
+            spot = rowI * len(brd) + elementI
+            grid.remove(spot)
+
+            # if it had already reached 9 before and it cannot increment further
+            if brd[rowI][elementI] == self._possibleNums[-1]:
+                nextNums = []
+            else:
+                candidates = grid.candidateMasks[spot]
+
+                nextNums = [num
+                            for num in range(self._get_current_num_incremented(rowI, elementI, brd), maxBoardRange)
+                            if candidates >> (num - 1) & 1]
+
+            if nextNums:
+
+                # set the first available num on the spot
+                brd[rowI][elementI] = str(nextNums[0])
+                grid.place(spot, nextNums[0])
+                yield (rowI, elementI, brd[rowI][elementI], True)
+
+                # go forward a spot
+                newCoords = self._get_forward_coordinates(rowI, elementI, maxBoardIndex)
+                if not newCoords:
+
+                    # board solved
+                    self._remove_constant_marks(brd)
+                    return
+
+            else:
+
+                # reset the spot
+                brd[rowI][elementI] = self.emptySpotChar
+                yield (rowI, elementI, self.emptySpotChar, False)
+
+                # backtrack to the last available spot
+                newCoords = self._get_bactrack_coordinates(rowI, elementI, brd)
+                if not newCoords:
+
+                    # the board cannot be solved
+                    self._remove_constant_marks(brd)
+                    return
+
+            rowI, elementI = newCoords
+
+    def get_candidate_grid(self):
+        """
+        Returns the candidates (pencil marks) of every empty spot of the stored board, e.g. to show them
+        or to build solving techniques on. The grid is a snapshot of the board: its set and clear
+        update the candidates in place, but changing the board doesn't change them.
+
+        Raises:
+            ArgumentError: Candidate grids don't support constraints.
+
+        Returns:
+            {CandidateGrid} -- (see sudokucandidates)
+        """
+
+        if self.constraints:
+            raise ArgumentError("Candidate grids don't support constraints.")
+
+        return CandidateGrid(board_to_cells(self.board, self.emptySpotChar, self._constMarker), len(self.board),
+                             self.boxRows, self.boxCols)
+
+    def find_contradiction(self):
+        """
+        Checks the stored board without solving it (takes microseconds): the same num given twice
+        in a row, column or square, an empty spot without candidates, or a num missing from a row,
+        column or square which can't go anywhere in it.
+
+        Returns:
+            {str} -- what's wrong with the board
+            or
+            {None} -- if nothing was found (the board can still turn out to be unsolvable)
+        """
+
+        return KernelSolver(board_to_cells(self.board, self.emptySpotChar, self._constMarker), len(self.board),
+                            self.boxRows, self.boxCols, self.constraints).find_contradiction()
+
+    def rate(self):
+        """
+        Rates how hard the stored board is for a human by the hardest technique needed to solve it (see sudokurating).
+        Neither the board nor its difficulty change (the difficulty is what the board was generated as).
+        The techniques only know rows, columns and squares, so constraints are ignored.
+
+        Returns:
+            {dict} -- score, label ('easy', 'medium', 'hard' or 'expert'), hardest (name of the technique),
+            techniques (how many times every technique was used) and status ('solved' or 'unsolvable')
+        """
+
+        return rate(board_to_cells(self.board, self.emptySpotChar, self._constMarker), len(self.board),
+                    self.boxRows, self.boxCols)
+
+    def iter_solutions(self, limit=None):
+        """
+        Yields the solutions of the stored board one at a time (without changing it), every next one
+        continuing the same bitmask search, e.g. to check whether a board has a single solution
+        or to go through the solutions of an unfinished one.
+
+        Keyword Arguments:
+            limit {int} -- max number of solutions (default: {None} (all of them))
+
+        Yields:
+            {a tuple of lists} -- a solved board (a new one every time)
+        """
+
+        for cells in iter_solutions(board_to_cells(self.board, self.emptySpotChar, self._constMarker),
+                                    len(self.board), self.boxRows, self.boxCols, self.constraints, limit):
+            yield cells_to_board(cells, len(self.board))
+
+    def count_solutions(self, limit=None):
+        """
+        Counts the solutions of the stored board (see iter_solutions), count_solutions(2) == 1
+        meaning the board has a single solution.
+
+        Keyword Arguments:
+            limit {int} -- the counting stops at limit solutions (default: {None} (all of them))
+
+        Returns:
+            {int}
+        """
+
+        return sum(1 for _ in self.iter_solutions(limit))
+
+    def estimate_cost(self):
+        """
+        Cheaply estimates how expensive the stored board is to solve (without searching).
+        Spots with a single candidate are filled first (on a copy), then the candidates
+        of the remaining spots tell how much the search could branch.
+
+        Returns:
+            {dict} -- emptySpots, forcedSpots (filled by the singles), remainingSpots, candidates (count left
+            in the remaining spots), branching (average candidates per remaining spot), searchSpace
+            (log10 of the product of the candidate counts), contradiction (whether a spot has no candidates)
+            and cost (searchSpace, the number used to compare boards)
+        """
+
+        brd = [list(row) for row in self.board]
+        size = len(brd)
+
+        horizontals = self._get_horizontal_nums(brd)
+        verticals = self._get_vertical_nums(brd)
+        squares = self._get_nums_in_squares(brd)
+
+        emptySpots = [(rowI, elementI)
+                      for rowI in range(size)
+                      for elementI in range(size)
+                      if brd[rowI][elementI] == self.emptySpotChar]
+        squareNums = {spot: self._get_square_num(spot[0], spot[1], size) for spot in emptySpots}
+
+        # fill the spots with a single candidate until there are none
+        possibleNums = set(self._possibleNums)
+        remainingSpots = emptySpots
+        contradiction = False
+        while True:
+            candidates = {}
+            forced = False
+            for rowI, elementI in remainingSpots:
+                squareI = squareNums[(rowI, elementI)]
+                spotCandidates = possibleNums - (horizontals[rowI] | verticals[elementI] | squares[squareI])
+                candidates[(rowI, elementI)] = len(spotCandidates)
+
+                if len(spotCandidates) == 1:
+                    num = spotCandidates.pop()
+                    horizontals[rowI].add(num)
+                    verticals[elementI].add(num)
+                    squares[squareI].add(num)
+                    del candidates[(rowI, elementI)]
+                    forced = True
+                elif not spotCandidates:
+                    contradiction = True
+
+            remainingSpots = list(candidates)
+            if not forced or contradiction:
+                break
+
+        candidateCount = sum(candidates.values())
+        searchSpace = sum([math.log10(count) for count in candidates.values() if count])
+
+        return {'emptySpots': len(emptySpots),
+                'forcedSpots': len(emptySpots) - len(remainingSpots),
+                'remainingSpots': len(remainingSpots),
+                'candidates': candidateCount,
+                'branching': candidateCount / len(remainingSpots) if remainingSpots else 0,
+                'searchSpace': searchSpace,
+                'contradiction': contradiction,
+                'cost': 0 if contradiction else searchSpace}
+
+    def to_value(self):
+        """
+        Returns:
+            {Board} -- the stored board as a compact immutable Board (see sudokuvalue)
+        """
+
+        return Board.from_rows(self.board, self.emptySpotChar, self._constMarker)
+
+    def to_args(self):
+        """
+        Returns:
+            {tuple} -- arguments making the same SudokuBoard (a copy of the board, difficulty, emptySpotChar,
+            correctWrongChars, constMarker, boxRows, boxCols, constraints), they can be pickled,
+            e.g. to solve the board in another process
+        """
+
+        return (tuple([list(row) for row in self.board]), self.difficulty, self.emptySpotChar,
+                self._correctWrongChars, self._constMarker, self.boxRows, self.boxCols, self.constraints)
+
+    def to_dimacs(self):
+        """
+        Encodes the stored board as CNF (see sudokusat), e.g. for an external SAT solver.
+        Variable (row * size + column) * size + num means num is in that spot.
+
+        Raises:
+            ArgumentError: if a constraint can't be encoded as CNF
+
+        Returns:
+            {str} -- the CNF in the DIMACS format
+        """
+
+        clauses, variableCount = encode_board(board_to_cells(self.board, self.emptySpotChar, self._constMarker),
+                                              len(self.board), self.boxRows, self.boxCols, self.constraints)
+
+        return to_dimacs(clauses, variableCount, ['sudoku {0}x{0}'.format(len(self.board))])
+
     def print_board(self):
         """
         Prints the stored board to the console
@@ -427,10 +1092,22 @@ class SudokuBoard:
         """
         Resets the board to the initial state
 
+        The board is reset in place, so everything referencing it sees the change.
+
+        Raises:
+            BoardError: Board's shape has changed, it can't be reset.
+
         Returns:
             {tuple of lists} -- board given while creating SudokuBoard
         """
-        self.board = deepcopy(self.boardBackup)
+
+        if len(self.board) != len(self.boardBackup) or \
+           any(len(row) != len(backupRow) for row, backupRow in zip(self.board, self.boardBackup)):
+            raise BoardError("Board's shape has changed, it can't be reset.")
+
+        for row, backupRow in zip(self.board, self.boardBackup):
+            row[:] = backupRow
+
         return self.board
 
     @staticmethod
@@ -603,20 +1280,9 @@ class SudokuBoard:
             {int} -- index used to mark the squares in get_nums_in_squares
         """
 
-        squareSize = int(boardLen / 3)
-        squareMaxYs = tuple(filter(lambda x: x % 3 == 0, range(3, boardLen + 1)))
-        squareMaxXs = tuple(filter(lambda x: x % squareSize == 0, range(squareSize, boardLen + 1)))
+        squaresInRow = boardLen // self.boxCols
 
-        index = 0
-        for maxY in squareMaxYs:
-            if rowI < maxY:
-                for maxX in squareMaxXs:
-                    if elementI < maxX:
-                        return index
-                    else:
-                        index += 1
-            else:
-                index += 3
+        return (rowI // self.boxRows) * squaresInRow + elementI // self.boxCols
 
     def _get_horizontal_nums(self, board):
         """
@@ -672,25 +1338,15 @@ class SudokuBoard:
             {tuple of sets} -- tuple contains sets of nums in corresponding squares
         """
 
-        squareSize = int(len(board) / 3)
-        squareY = 3
-        squareX = squareSize
-
         # empty list the same size as the board but filled with empty sets
         squares = [set()
                    for row in board]
 
-        for squareNum in range(len(board)):
-            for y in range(squareY - 3, squareY):
-                for x in range(squareX - squareSize, squareX):
-                    # adds only nums to save time
-                    if board[y][x] != self.emptySpotChar:
-                        squares[squareNum].add(board[y][x].replace(self._constMarker, ''))
-
-            squareX += squareSize
-            if squareX > len(board):
-                squareX = int(len(board) / 3)
-                squareY += 3
+        for y in range(len(board)):
+            for x in range(len(board)):
+                # adds only nums to save time
+                if board[y][x] != self.emptySpotChar:
+                    squares[self._get_square_num(y, x, len(board))].add(board[y][x].replace(self._constMarker, ''))
 
         return tuple(squares)
 
@@ -737,6 +1393,14 @@ class SudokuBoard:
 
         return brd
 
+    def _compact_board(self, board):
+        """
+        Returns:
+            {Board} -- the board (possibly with constMarkers) as a compact Board
+        """
+
+        return Board.from_rows(board, self.emptySpotChar, self._constMarker)
+
     def _ensure_board_types(self, board, correctWrongChars=False):
         """
         Ensures the board and its contents contain correct types of elements, if the element isn't a num
@@ -752,6 +1416,8 @@ class SudokuBoard:
             {a tuple of lists} -- corrected board
         """
 
+        possibleNums = set(self._possibleNums)
+
         ensuredBoard = []
         rowI = 0
         elementI = 0
@@ -762,7 +1428,7 @@ class SudokuBoard:
 
                 char = str(ensuredBoard[rowI][elementI])
 
-                if char not in self._possibleNums and char != self.emptySpotChar:
+                if char not in possibleNums and char != self.emptySpotChar:
                     if correctWrongChars:
                         char = self.emptySpotChar
                     else:
@@ -797,8 +1463,24 @@ class SudokuBoard:
 
 
     class _MoveResult:
-        def __init__(self, changed_coords, isValid, board, *boardAttr):
-            self.board = SudokuBoard(board, *boardAttr)
+        """
+        A single step of gen_solving_step_by_step, the board is kept as a compact Board (compactBoard)
+        and the SudokuBoard (board) is only made when it's asked for.
+        """
+
+        __slots__ = ('compactBoard', 'isValid', 'changed_coords', '_boardAttr', '_board')
+
+        def __init__(self, changed_coords, isValid, compactBoard, *boardAttr):
+            self.compactBoard = compactBoard
+            self._boardAttr = boardAttr
+            self._board = None
 
             self.isValid = isValid
             self.changed_coords = changed_coords
+
+        @property
+        def board(self):
+            if self._board is None:
+                self._board = SudokuBoard(self.compactBoard, *self._boardAttr)
+
+            return self._board
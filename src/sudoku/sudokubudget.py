@@ -0,0 +1,108 @@
+"""
+Module containing the limits SudokuBoard.solve can be given (a timeout, a node budget and a cancel token)
+
+    Main classes:
+        CancelToken -- lets another thread stop a running solve
+        Budget -- the limits of a single solve, checked every few nodes by the solvers
+        BudgetExceeded -- returned by SudokuBoard.solve instead of a board when it had to stop
+"""
+
+import threading
+import time
+
+# reasons of BudgetExceeded
+TIMEOUT = 'timeout'
+NODES = 'nodes'
+CANCELLED = 'cancelled'
+
+
+class CancelToken:
+    """
+    Shared between the solving thread and the one which may want to stop it.
+    """
+
+    __slots__ = ('_event',)
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+
+class Budget:
+    """
+    Limits of a single solve.
+
+        Keyword Arguments:
+            timeout {float} -- seconds the solve can take (default: {None} (no limit))
+            maxNodes {int} -- nums the solve can place (default: {None} (no limit))
+            cancelToken {CancelToken} -- (default: {None})
+            checkInterval {int} -- steps of the search between checking the time and the token (default: {1024})
+    """
+
+    __slots__ = ('deadline', 'maxNodes', 'cancelToken', 'checkInterval')
+
+    def __init__(self, timeout=None, maxNodes=None, cancelToken=None, checkInterval=1024):
+        self.deadline = None if timeout is None else time.perf_counter() + timeout
+        self.maxNodes = maxNodes
+        self.cancelToken = cancelToken
+        self.checkInterval = checkInterval
+
+    def is_limited(self):
+        return self.deadline is not None or self.maxNodes is not None or self.cancelToken is not None
+
+    def get_exceeded_reason(self, nodes):
+        """
+        Arguments:
+            nodes {int} -- nodes searched so far
+
+        Returns:
+            {str} -- TIMEOUT, NODES or CANCELLED if the search has to stop, else None
+        """
+
+        if self.maxNodes is not None and nodes >= self.maxNodes:
+            return NODES
+        if self.cancelToken is not None and self.cancelToken.cancelled:
+            return CANCELLED
+        if self.deadline is not None and time.perf_counter() >= self.deadline:
+            return TIMEOUT
+
+    def get_node_limit(self, nodes):
+        """
+        Returns:
+            {int} -- nodes at which the search should stop to check the budget again
+        """
+
+        nodeLimit = nodes + self.checkInterval
+        if self.maxNodes is not None:
+            nodeLimit = min(nodeLimit, self.maxNodes)
+
+        return nodeLimit
+
+
+class BudgetExceeded:
+    """
+    Returned by SudokuBoard.solve instead of a board when the search had to stop before finishing.
+    It's falsy, so code only checking whether a board was solved keeps working.
+
+        Arguments:
+            reason {str} -- TIMEOUT, NODES or CANCELLED
+            stats {dict} -- stats of the search up to that point
+    """
+
+    __slots__ = ('reason', 'stats')
+
+    def __init__(self, reason, stats):
+        self.reason = reason
+        self.stats = stats
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return 'BudgetExceeded({!r}, {!r})'.format(self.reason, self.stats)
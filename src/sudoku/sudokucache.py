@@ -0,0 +1,198 @@
+"""
+Module containing the cache of solutions used by SudokuBoard.solve (and the batch solver and the service)
+
+    Solutions are stored under the canonical form of their board (see sudokucanon), so a board
+    which is a relabeled, shuffled or transposed copy of a solved one is solved by transforming
+    the stored solution back. Boards seen before are found without computing the canonical form at all.
+
+    Main methods:
+        SolutionCache -- bounded (least recently used) cache of solutions, optionally kept in a file
+"""
+
+import json
+import os
+from collections import OrderedDict
+from sudoku.sudokucanon import canonical_form, apply_transform, invert_transform, board_key
+from sudoku.sudokuexceptions import ArgumentError
+from sudoku.sudokukernel import get_box_shape
+
+# stored instead of a solution for unsolvable boards
+UNSOLVABLE = ()
+
+_fileVersion = 1
+
+
+class SolutionCache:
+    """
+    Bounded cache of solutions keyed by the canonical form of the board.
+
+        Keyword Arguments:
+            maxSize {int} -- max number of stored solutions, the least recently used ones are dropped
+            (default: {10000})
+            path {str} -- file the cache is loaded from (if it exists) and saved to (default: {None})
+
+        Raises:
+            ArgumentError: maxSize must be positive.
+    """
+
+    def __init__(self, maxSize=10000, path=None):
+        if maxSize < 1:
+            raise ArgumentError('maxSize must be positive.')
+
+        self.maxSize = maxSize
+        self.path = path
+
+        # canonical key -> canonical solution
+        self._solutions = OrderedDict()
+
+        # key of the board as it was given -> its solution (skips computing the canonical form)
+        self._exactSolutions = OrderedDict()
+
+        # canonical form of the last board missing from the cache, so storing its solution doesn't compute it again
+        self._lastMiss = None
+
+        self.stats = {'hits': 0, 'exactHits': 0, 'misses': 0}
+
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self):
+        return len(self._solutions)
+
+    def lookup(self, cells, size, boxRows=None, boxCols=None):
+        """
+        Looks up the solution of a board.
+
+        Arguments:
+            cells {list of ints} -- board row by row, 0 meaning an empty spot
+            size {int} -- length of the board's side
+
+        Keyword Arguments:
+            boxRows {int} -- row count of a single square (default: {None} (see get_box_shape))
+            boxCols {int} -- column count of a single square (default: {None} (see get_box_shape))
+
+        Returns:
+            {tuple of ints} -- the solution row by row
+            or
+            {UNSOLVABLE} -- (an empty tuple) if the board is known to be unsolvable
+            or
+            {None} -- if the board isn't in the cache
+        """
+
+        boxRows, boxCols = get_box_shape(size, boxRows, boxCols)
+        exactKey = board_key(cells, size, boxRows)
+        solution = self._exactSolutions.get(exactKey)
+        if solution is not None:
+            self._exactSolutions.move_to_end(exactKey)
+            self.stats['exactHits'] += 1
+            return solution
+
+        canonicalCells, transform = canonical_form(cells, size, boxRows, boxCols)
+        key = board_key(canonicalCells, size, boxRows)
+
+        canonicalSolution = self._solutions.get(key)
+        if canonicalSolution is None:
+            self._lastMiss = (exactKey, key, transform)
+            self.stats['misses'] += 1
+            return
+
+        self._solutions.move_to_end(key)
+        self.stats['hits'] += 1
+
+        if canonicalSolution == UNSOLVABLE:
+            solution = UNSOLVABLE
+        else:
+            solution = invert_transform(canonicalSolution, transform)
+
+        self._put(self._exactSolutions, exactKey, solution)
+
+        return solution
+
+    def store(self, cells, size, solution, boxRows=None, boxCols=None):
+        """
+        Stores the solution of a board.
+
+        Arguments:
+            cells {list of ints} -- board row by row, 0 meaning an empty spot
+            size {int} -- length of the board's side
+            solution {list of ints} -- the solution row by row (None or UNSOLVABLE if the board is unsolvable)
+
+        Keyword Arguments:
+            boxRows {int} -- row count of a single square (default: {None} (see get_box_shape))
+            boxCols {int} -- column count of a single square (default: {None} (see get_box_shape))
+        """
+
+        boxRows, boxCols = get_box_shape(size, boxRows, boxCols)
+        exactKey = board_key(cells, size, boxRows)
+
+        if self._lastMiss and self._lastMiss[0] == exactKey:
+            _, key, transform = self._lastMiss
+        else:
+            canonicalCells, transform = canonical_form(cells, size, boxRows, boxCols)
+            key = board_key(canonicalCells, size, boxRows)
+        self._lastMiss = None
+
+        if not solution:
+            solution = canonicalSolution = UNSOLVABLE
+        else:
+            solution = tuple(solution)
+            canonicalSolution = apply_transform(solution, transform)
+
+        self._put(self._solutions, key, canonicalSolution)
+        self._put(self._exactSolutions, exactKey, solution)
+
+    def clear(self):
+        self._solutions.clear()
+        self._exactSolutions.clear()
+        self._lastMiss = None
+
+    def save(self, path=None):
+        """
+        Saves the cache to a json file (written to a temporary file first, so a crash can't corrupt it).
+
+        Keyword Arguments:
+            path {str} -- (default: {None} (the path given to the constructor))
+
+        Raises:
+            ArgumentError: No path to save the cache to.
+        """
+
+        path = path or self.path
+        if not path:
+            raise ArgumentError('No path to save the cache to.')
+
+        data = {'version': _fileVersion,
+                'entries': [[key.hex(), bytes(solution).hex()]
+                            for key, solution in self._solutions.items()]}
+
+        tempPath = path + '.tmp'
+        with open(tempPath, 'w') as cacheFile:
+            json.dump(data, cacheFile)
+        os.replace(tempPath, path)
+
+    def load(self, path):
+        """
+        Loads solutions from a json file saved by save (they're added to the ones already stored).
+
+        Raises:
+            ArgumentError: Incorrect cache file.
+        """
+
+        try:
+            with open(path, 'r') as cacheFile:
+                data = json.load(cacheFile)
+
+            if data.get('version') != _fileVersion:
+                raise ValueError
+
+            for keyHex, solutionHex in data['entries']:
+                self._put(self._solutions, bytes.fromhex(keyHex), tuple(bytes.fromhex(solutionHex)))
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            raise ArgumentError('Incorrect cache file ({}).'.format(path))
+
+    def _put(self, entries, key, value):
+        entries[key] = value
+        entries.move_to_end(key)
+
+        if len(entries) > self.maxSize:
+            entries.popitem(last=False)
@@ -0,0 +1,258 @@
+"""
+Module containing the candidates (pencil marks) of a board
+
+    Every empty spot keeps its candidates as a bitmask (num 1 is bit 0) and every row, column and square
+    keeps the spots each num is still a candidate of, both updated as nums are placed and removed,
+    so asking for them never looks at the whole board.
+
+    Main classes:
+        CandidateGrid -- board with the candidates of every empty spot
+"""
+
+from sudoku.sudokuexceptions import BoardError
+from sudoku.sudokukernel import get_box_shape
+
+
+class CandidateGrid:
+    """
+    Board with the candidates of every empty spot (used by SudokuBoard, the rating and solving step by step).
+
+    Units are numbered like in the kernel: rows (0 to size - 1), columns (size to 2 * size - 1),
+    then squares (2 * size to 3 * size - 1), units[unitI] being the spots of a unit in order.
+
+        Arguments:
+            cells {list of ints} -- board row by row, 0 meaning an empty spot
+            size {int} -- length of the board's side
+
+        Keyword Arguments:
+            boxRows {int} -- row count of a single square (default: {None} (see get_box_shape))
+            boxCols {int} -- column count of a single square (default: {None} (see get_box_shape))
+
+        Raises:
+            BoardError: Board's size doesn't match the cell count.
+            BoardError: Board's size must be divisible into squares.
+            BoardError: Num in board out of range.
+    """
+
+    def __init__(self, cells, size, boxRows=None, boxCols=None):
+        if len(cells) != size * size:
+            raise BoardError("Board's size doesn't match the cell count.")
+
+        boxRows, boxCols = get_box_shape(size, boxRows, boxCols)
+
+        self.size = size
+        self.fullMask = (1 << size) - 1
+
+        boxesInRow = size // boxCols
+        self.rows = [[rowI * size + colI for colI in range(size)] for rowI in range(size)]
+        self.cols = [[rowI * size + colI for rowI in range(size)] for colI in range(size)]
+        self.boxes = [[((boxI // boxesInRow) * boxRows + spotI // boxCols) * size +
+                       (boxI % boxesInRow) * boxCols + spotI % boxCols
+                       for spotI in range(size)]
+                      for boxI in range(size)]
+        self.lines = self.rows + self.cols
+        self.units = self.rows + self.cols + self.boxes
+
+        self.rowOf = [spot // size for spot in range(size * size)]
+        self.colOf = [spot % size for spot in range(size * size)]
+        self.boxOf = [0] * (size * size)
+        for boxI, box in enumerate(self.boxes):
+            for spot in box:
+                self.boxOf[spot] = boxI
+
+        # (unit, bit of the spot's index in it) of the row, column and square of every spot
+        self.unitsOf = [[] for _ in range(size * size)]
+        for unitI, unit in enumerate(self.units):
+            for spotI, spot in enumerate(unit):
+                self.unitsOf[spot].append((unitI, 1 << spotI))
+
+        self.peers = [set(self.rows[self.rowOf[spot]] + self.cols[self.colOf[spot]] +
+                          self.boxes[self.boxOf[spot]]) - {spot}
+                      for spot in range(size * size)]
+
+        self.cells = [0] * (size * size)
+        self.candidateMasks = [self.fullMask] * (size * size)
+        self.emptyCount = size * size
+
+        # nums placed in every unit
+        self.unitMasks = [0] * (3 * size)
+
+        # candidates removed by eliminate (removing a num doesn't bring them back)
+        self.eliminatedMasks = [0] * (size * size)
+
+        # spots of every unit every num is a candidate of, as bits of their index in the unit
+        self._numSpots = [[self.fullMask] * size for _ in range(3 * size)]
+
+        # the same num twice in a unit or an empty spot without candidates (set by place and eliminate)
+        self.contradiction = False
+
+        for spot, num in enumerate(cells):
+            if num < 0 or num > size:
+                raise BoardError('Num in board out of range.')
+
+            if num:
+                self.place(spot, num)
+
+    def candidates(self, rowI, elementI):
+        """
+        Returns:
+            {int} -- bitmask of the candidates of the spot (0 if it's taken)
+        """
+
+        return self.candidateMasks[rowI * self.size + elementI]
+
+    def candidate_nums(self, rowI, elementI):
+        """
+        Returns:
+            {list of ints} -- the candidates of the spot (e.g. to show them as pencil marks)
+        """
+
+        mask = self.candidateMasks[rowI * self.size + elementI]
+
+        return [num for num in range(1, self.size + 1) if mask >> (num - 1) & 1]
+
+    def cells_with_candidate(self, unitI, num):
+        """
+        Returns:
+            {int} -- spots of the unit the num is a candidate of, as bits of their index in units[unitI]
+            (0 if it's placed in the unit or can't go anywhere in it)
+        """
+
+        return self._numSpots[unitI][num - 1]
+
+    def set(self, rowI, elementI, num):
+        """
+        Places num in the spot (the num which was there is removed first).
+        """
+
+        spot = rowI * self.size + elementI
+        if self.cells[spot]:
+            self.remove(spot)
+
+        self.place(spot, num)
+
+    def clear(self, rowI, elementI):
+        """
+        Removes the num from the spot.
+        """
+
+        self.remove(rowI * self.size + elementI)
+
+    def place(self, spot, num):
+        """
+        Places num in an empty spot, removing it from the candidates of its peers.
+
+        Raises:
+            BoardError: Spot is taken, remove its num first.
+        """
+
+        if self.cells[spot]:
+            # the num there would stay in its units and the empty spots would be counted wrong
+            raise BoardError('Spot is taken, remove its num first.')
+
+        bit = 1 << (num - 1)
+        cells = self.cells
+        candidateMasks = self.candidateMasks
+        unitMasks = self.unitMasks
+
+        self._drop_candidates(spot, candidateMasks[spot])
+        cells[spot] = num
+        candidateMasks[spot] = 0
+        self.emptyCount -= 1
+
+        for unitI, _ in self.unitsOf[spot]:
+            if unitMasks[unitI] & bit:
+                # the same num is in the unit already
+                self.contradiction = True
+            unitMasks[unitI] |= bit
+
+        for peer in self.peers[spot]:
+            if candidateMasks[peer] & bit:
+                candidateMasks[peer] ^= bit
+                self._drop_candidates(peer, bit)
+
+                if not candidateMasks[peer]:
+                    self.contradiction = True
+
+    def remove(self, spot):
+        """
+        Removes the num from a spot, giving it back to the candidates of its peers which allow it
+        (apart from the candidates removed by eliminate).
+        """
+
+        num = self.cells[spot]
+        if not num:
+            return
+
+        bit = 1 << (num - 1)
+        cells = self.cells
+        candidateMasks = self.candidateMasks
+
+        cells[spot] = 0
+        self.emptyCount += 1
+        for unitI, _ in self.unitsOf[spot]:
+            self.unitMasks[unitI] &= ~bit
+
+        candidateMasks[spot] = self._get_allowed(spot)
+        self._add_candidates(spot, candidateMasks[spot])
+
+        for peer in self.peers[spot]:
+            if not cells[peer] and not candidateMasks[peer] & bit and self._get_allowed(peer) & bit:
+                candidateMasks[peer] |= bit
+                self._add_candidates(peer, bit)
+
+    def eliminate(self, spots, mask):
+        """
+        Removes the candidates in mask from the given spots.
+
+        Returns:
+            {bool} -- whether anything was removed
+        """
+
+        candidateMasks = self.candidateMasks
+        changed = False
+        for spot in spots:
+            removed = candidateMasks[spot] & mask
+            if removed:
+                candidateMasks[spot] ^= removed
+                self.eliminatedMasks[spot] |= removed
+                self._drop_candidates(spot, removed)
+                changed = True
+
+                if not candidateMasks[spot]:
+                    self.contradiction = True
+
+        return changed
+
+    def _get_allowed(self, spot):
+        """
+        Returns:
+            {int} -- nums none of the spot's units contain (and which weren't eliminated)
+        """
+
+        unitMasks = self.unitMasks
+        placed = 0
+        for unitI, _ in self.unitsOf[spot]:
+            placed |= unitMasks[unitI]
+
+        return self.fullMask & ~placed & ~self.eliminatedMasks[spot]
+
+    def _drop_candidates(self, spot, mask):
+        numSpots = self._numSpots
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+
+            numI = bit.bit_length() - 1
+            for unitI, spotBit in self.unitsOf[spot]:
+                numSpots[unitI][numI] &= ~spotBit
+
+    def _add_candidates(self, spot, mask):
+        numSpots = self._numSpots
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+
+            numI = bit.bit_length() - 1
+            for unitI, spotBit in self.unitsOf[spot]:
+                numSpots[unitI][numI] |= spotBit
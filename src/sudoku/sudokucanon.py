@@ -0,0 +1,659 @@
+"""
+Module computing a canonical form of a board under the sudoku symmetries
+
+    The symmetries are: relabeling the nums, swapping rows inside a band (a row of squares),
+    swapping bands, swapping columns inside a stack (a column of squares), swapping stacks
+    and transposing (only if the squares are square).
+    Every board has exactly one canonical form, so boards that are the same puzzle in disguise
+    share it.
+
+    The board is turned into a graph (a vertex for every given, every line, band, stack and num holding one,
+    and one for each of the two orientations) whose isomorphisms are exactly the sudoku symmetries,
+    and the graph gets a canonical labeling by individualization and refinement: the vertices are split
+    into classes by how they're connected until the classes stop changing, and when some are still tied
+    one vertex of a tied class is picked out, for every vertex of the class. Branches whose refinement
+    traces are worse than the best one so far are cut, and so are branches which an automorphism found
+    on the way maps onto a branch searched already, so boards with a lot of symmetry (full or very sparse ones)
+    stay cheap. The order of the bands, rows, stacks, columns and nums in the labeling gives the transform.
+
+    Main methods:
+        canonical_form -- returns the canonical form of a board and the transform leading to it
+        canonical_hash -- returns a short hash of the canonical form (equal for boards equal up to symmetry)
+        apply_transform -- transforms any board the same way (e.g. a solution)
+        invert_transform -- transforms a board back
+"""
+
+import hashlib
+import heapq
+from sudoku.sudokuexceptions import BoardError
+from sudoku.sudokukernel import get_box_shape
+
+
+class Transform:
+    """
+    Transform leading from a board to its canonical form.
+
+        Arguments:
+            size {int} -- length of the board's side
+            transposed {bool} -- whether the board is transposed first
+            rowOrder {tuple of ints} -- rowOrder[i] is the (transposed) board's row placed at row i
+            colOrder {tuple of ints} -- colOrder[j] is the (transposed) board's column placed at column j
+            relabeling {tuple of ints} -- relabeling[num] is the num replacing num (relabeling[0] == 0)
+    """
+
+    __slots__ = ('size', 'transposed', 'rowOrder', 'colOrder', 'relabeling')
+
+    def __init__(self, size, transposed, rowOrder, colOrder, relabeling):
+        self.size = size
+        self.transposed = transposed
+        self.rowOrder = tuple(rowOrder)
+        self.colOrder = tuple(colOrder)
+        self.relabeling = tuple(relabeling)
+
+    def __repr__(self):
+        return 'Transform(transposed={}, rowOrder={}, colOrder={}, relabeling={})'.format(
+            self.transposed, self.rowOrder, self.colOrder, self.relabeling)
+
+
+def canonical_form(cells, size, boxRows=None, boxCols=None):
+    """
+    Returns the canonical form of a board.
+
+    Arguments:
+        cells {list of ints} -- board row by row, 0 meaning an empty spot
+        size {int} -- length of the board's side
+
+    Keyword Arguments:
+        boxRows {int} -- row count of a single square (default: {None} (see get_box_shape))
+        boxCols {int} -- column count of a single square (default: {None} (see get_box_shape))
+
+    Raises:
+        BoardError: Board's size doesn't match the cell count.
+        BoardError: Board's size must be divisible into squares.
+        BoardError: Num in board out of range.
+
+    Returns:
+        {tuple} -- canonical form (tuple of ints, row by row) and the Transform leading to it
+    """
+
+    if len(cells) != size * size:
+        raise BoardError("Board's size doesn't match the cell count.")
+
+    boxRows, boxCols = get_box_shape(size, boxRows, boxCols)
+    if cells and (min(cells) < 0 or max(cells) > size):
+        raise BoardError('Num in board out of range.')
+
+    if not any(cells):
+        # every arrangement of an empty board is the same
+        return tuple(cells), Transform(size, False, range(size), range(size), range(size + 1))
+
+    graph = _BoardGraph(cells, size, boxRows, boxCols)
+    transform = graph.get_transform(_CanonicalLabeling(graph.neighbors, graph.classes).get_positions())
+
+    return apply_transform(cells, transform), transform
+
+
+def canonical_hash(cells, size, boxRows=None, boxCols=None):
+    """
+    Returns a hash of the canonical form of a board, it's the same for boards equal up to symmetry
+    and doesn't change between runs (unlike hash()).
+
+    Arguments:
+        cells {list of ints} -- board row by row, 0 meaning an empty spot
+        size {int} -- length of the board's side
+
+    Keyword Arguments:
+        boxRows {int} -- row count of a single square (default: {None} (see get_box_shape))
+        boxCols {int} -- column count of a single square (default: {None} (see get_box_shape))
+
+    Returns:
+        {str} -- 32 hex chars
+    """
+
+    boxRows, boxCols = get_box_shape(size, boxRows, boxCols)
+    canonicalCells, _ = canonical_form(cells, size, boxRows, boxCols)
+
+    return hashlib.blake2b(board_key(canonicalCells, size, boxRows), digest_size=16).hexdigest()
+
+
+def board_key(cells, size, boxRows=None):
+    """
+    Returns:
+        {bytes} -- the board with its shape packed into bytes (e.g. to be used as a dict key)
+    """
+
+    if boxRows is None:
+        boxRows, _ = get_box_shape(size)
+
+    return bytes((size, boxRows)) + bytes(cells)
+
+
+def apply_transform(cells, transform):
+    """
+    Transforms a board (e.g. its solution) the same way as the board the transform was made for.
+
+    Arguments:
+        cells {list of ints} -- board row by row, 0 meaning an empty spot
+        transform {Transform}
+
+    Returns:
+        {tuple of ints} -- transformed board row by row
+    """
+
+    size = transform.size
+    relabeling = transform.relabeling
+
+    if transform.transposed:
+        get = lambda rowI, colI: cells[colI * size + rowI]
+    else:
+        get = lambda rowI, colI: cells[rowI * size + colI]
+
+    return tuple([relabeling[get(rowI, colI)]
+                  for rowI in transform.rowOrder
+                  for colI in transform.colOrder])
+
+
+def invert_transform(cells, transform):
+    """
+    Transforms a board back (e.g. the solution of the canonical form into the solution of the original board).
+
+    Arguments:
+        cells {list of ints} -- transformed board row by row, 0 meaning an empty spot
+        transform {Transform}
+
+    Returns:
+        {tuple of ints} -- the original board row by row
+    """
+
+    size = transform.size
+
+    inverseRelabeling = [0] * (size + 1)
+    for num, newNum in enumerate(transform.relabeling):
+        inverseRelabeling[newNum] = num
+
+    original = [0] * (size * size)
+    for newRowI, rowI in enumerate(transform.rowOrder):
+        for newColI, colI in enumerate(transform.colOrder):
+            if transform.transposed:
+                spot = colI * size + rowI
+            else:
+                spot = rowI * size + colI
+
+            original[spot] = inverseRelabeling[cells[newRowI * size + newColI]]
+
+    return tuple(original)
+
+
+class _BoardGraph:
+    """
+    Graph of a board whose isomorphisms are the sudoku symmetries of the board.
+
+    Vertices: the two orientations, the bands and stacks, rows and columns, nums and givens
+    (only the ones holding a given, the empty ones can be swapped freely anyway, and how many there are
+    follows from the size). Edges: orientation - its bands (stacks), band - its rows, stack - its columns,
+    given - its row, column and num. If the squares are square, rows and columns (bands and stacks,
+    the orientations) are in the same class, so transposing is a symmetry too.
+    """
+
+    def __init__(self, cells, size, boxRows, boxCols):
+        self.size = size
+        self.boxRows = boxRows
+        self.boxCols = boxCols
+        self.square = boxRows == boxCols
+
+        givens = [spot for spot in range(size * size) if cells[spot]]
+
+        self.neighbors = [[], []]
+        self.rowOrientation = 0
+        self.colOrientation = 1
+
+        self.bands = self._add_vertices(sorted({spot // size // boxRows for spot in givens}))
+        self.stacks = self._add_vertices(sorted({spot % size // boxCols for spot in givens}))
+        self.rows = self._add_vertices(sorted({spot // size for spot in givens}))
+        self.cols = self._add_vertices(sorted({spot % size for spot in givens}))
+        self.nums = self._add_vertices(sorted({cells[spot] for spot in givens}))
+
+        givenVertices = self._add_vertices(givens)
+
+        for bandI, band in self.bands.items():
+            self._add_edge(self.rowOrientation, band)
+        for stackI, stack in self.stacks.items():
+            self._add_edge(self.colOrientation, stack)
+        for rowI, row in self.rows.items():
+            self._add_edge(self.bands[rowI // boxRows], row)
+        for colI, col in self.cols.items():
+            self._add_edge(self.stacks[colI // boxCols], col)
+
+        for spot, given in givenVertices.items():
+            self._add_edge(given, self.rows[spot // size])
+            self._add_edge(given, self.cols[spot % size])
+            self._add_edge(given, self.nums[cells[spot]])
+
+        # classes of vertices which an isomorphism can swap, in a fixed order
+        if self.square:
+            self.classes = [[self.rowOrientation, self.colOrientation],
+                            list(self.bands.values()) + list(self.stacks.values()),
+                            list(self.rows.values()) + list(self.cols.values())]
+        else:
+            self.classes = [[self.rowOrientation], [self.colOrientation],
+                            list(self.bands.values()), list(self.stacks.values()),
+                            list(self.rows.values()), list(self.cols.values())]
+        self.classes += [list(self.nums.values()), list(givenVertices.values())]
+
+        # the lines and nums of full boards look all the same to the refinement, the way every two of them
+        # interlock tells them apart (see _get_pair_type), so the classes are split by it right away
+        invariants = self._get_invariants(cells)
+        self.classes = [[vertex for vertex in vertices if invariants.get(vertex, ()) == invariant]
+                        for vertices in self.classes
+                        for invariant in sorted({invariants.get(vertex, ()) for vertex in vertices})]
+
+    def _get_invariants(self, cells):
+        """
+        Returns:
+            {dict} -- vertex -> its invariant (the same for vertices a symmetry maps onto each other)
+            for the lines and nums
+        """
+
+        size = self.size
+
+        rowNums = [{} for _ in range(size)]
+        colNums = [{} for _ in range(size)]
+        numRows = {num: {} for num in self.nums}
+        numCols = {num: {} for num in self.nums}
+        for spot, num in enumerate(cells):
+            if num:
+                rowI, colI = divmod(spot, size)
+                rowNums[rowI][num] = colI
+                colNums[colI][num] = rowI
+                numRows[num][rowI] = colI
+                numCols[num][colI] = rowI
+
+        # the pair types of every vertex with all the others of its kind (a pair's type is the same both ways)
+        pairTypes = {}
+        for lines, lineNums, groupSize in ((self.rows, rowNums, self.boxRows), (self.cols, colNums, self.boxCols)):
+            lineIs = list(lines)
+            for lineI in lineIs:
+                pairTypes[lines[lineI]] = []
+            for pairI, lineI in enumerate(lineIs):
+                for otherLineI in lineIs[pairI + 1:]:
+                    pairType = (lineI // groupSize == otherLineI // groupSize,
+                                _get_pair_type(lineNums[lineI], lineNums[otherLineI]))
+                    pairTypes[lines[lineI]].append(pairType)
+                    pairTypes[lines[otherLineI]].append(pairType)
+
+        nums = list(self.nums)
+        for num in nums:
+            pairTypes[self.nums[num]] = []
+        for pairI, num in enumerate(nums):
+            for otherNum in nums[pairI + 1:]:
+                # transposing swaps the rows and columns the nums share
+                pairType = tuple(sorted([_get_pair_type(numRows[num], numRows[otherNum]),
+                                         _get_pair_type(numCols[num], numCols[otherNum])]))
+                pairTypes[self.nums[num]].append(pairType)
+                pairTypes[self.nums[otherNum]].append(pairType)
+
+        return {vertex: tuple(sorted(vertexPairTypes)) for vertex, vertexPairTypes in pairTypes.items()}
+
+    def _add_vertices(self, keys):
+        """
+        Returns:
+            {dict} -- key -> new vertex
+        """
+
+        vertices = {}
+        for key in keys:
+            vertices[key] = len(self.neighbors)
+            self.neighbors.append([])
+
+        return vertices
+
+    def _add_edge(self, vertex, otherVertex):
+        self.neighbors[vertex].append(otherVertex)
+        self.neighbors[otherVertex].append(vertex)
+
+    def get_transform(self, positions):
+        """
+        Arguments:
+            positions {list of ints} -- canonical position of every vertex
+
+        Returns:
+            {Transform} -- bands, lines and nums in the order of their positions (the empty ones after them)
+        """
+
+        size = self.size
+
+        transposed = self.square and positions[self.colOrientation] < positions[self.rowOrientation]
+        if transposed:
+            rowOrder = _get_line_order(self.stacks, self.cols, positions, size, self.boxCols)
+            colOrder = _get_line_order(self.bands, self.rows, positions, size, self.boxRows)
+        else:
+            rowOrder = _get_line_order(self.bands, self.rows, positions, size, self.boxRows)
+            colOrder = _get_line_order(self.stacks, self.cols, positions, size, self.boxCols)
+
+        # nums missing from the board get the remaining labels in order
+        numOrder = sorted(self.nums, key=lambda num: positions[self.nums[num]])
+        numOrder += [num for num in range(1, size + 1) if num not in self.nums]
+
+        relabeling = [0] * (size + 1)
+        for label, num in enumerate(numOrder, 1):
+            relabeling[num] = label
+
+        return Transform(size, transposed, rowOrder, colOrder, relabeling)
+
+
+def _get_pair_type(positions, otherPositions):
+    """
+    How two lines (or nums) interlock: the keys they share link a position in one to a position in the other,
+    the links form paths and cycles, and their lengths don't change under any symmetry.
+
+    Arguments:
+        positions {dict} -- key (num or line) -> position in the first line (or of the first num)
+        otherPositions {dict} -- the same for the second one
+
+    Returns:
+        {tuple} -- sorted lengths of the paths and sorted lengths of the cycles
+    """
+
+    links = {positions[key]: otherPositions[key] for key in positions if key in otherPositions}
+    linkedTo = set(links.values())
+
+    paths = []
+    for start in [position for position in links if position not in linkedTo]:
+        length = 0
+        position = start
+        while position in links:
+            position = links.pop(position)
+            length += 1
+        paths.append(length)
+
+    cycles = []
+    while links:
+        position, nextPosition = links.popitem()
+        length = 1
+        while nextPosition != position:
+            nextPosition = links.pop(nextPosition)
+            length += 1
+        cycles.append(length)
+
+    return tuple(sorted(paths)), tuple(sorted(cycles))
+
+
+def _get_line_order(groups, lines, positions, size, groupSize):
+    """
+    Returns:
+        {list of ints} -- the lines band by band (stack by stack), the ones with givens in the order of their
+        positions and the empty ones after them
+    """
+
+    def by_position(vertices, count):
+        used = sorted(vertices, key=lambda key: positions[vertices[key]])
+        return used + [key for key in range(count) if key not in vertices]
+
+    order = []
+    for groupI in by_position(groups, size // groupSize):
+        groupLines = {lineI: line for lineI, line in lines.items() if lineI // groupSize == groupI}
+        order += [groupI * groupSize + lineI for lineI in by_position(
+            {lineI % groupSize: line for lineI, line in groupLines.items()}, groupSize)]
+
+    return order
+
+
+class _CanonicalLabeling:
+    """
+    Canonical labeling of a graph by individualization and refinement.
+
+    A partition is an ordered list of classes (cells) kept as lab (the vertices, cell after cell),
+    cellStarts (the start of every vertex's cell in lab) and cellSizes (by the start).
+    Every leaf of the search (a partition with single vertex cells) orders the vertices, the chosen one
+    is the smallest by the traces of the refinements leading to it and then by the graph in its order.
+
+        Arguments:
+            neighbors {list of lists of ints} -- neighbors of every vertex
+            classes {list of lists of ints} -- vertices which isomorphisms may swap (every vertex in one),
+            in a fixed order
+    """
+
+    def __init__(self, neighbors, classes):
+        self.neighbors = neighbors
+
+        # the best leaf: keys of the path to it, lab and path (the vertices picked out)
+        self.bestKey = None
+        self.bestLab = None
+        self.bestPath = None
+
+        # automorphisms found (as lists vertex -> vertex)
+        self.automorphisms = []
+
+        lab = []
+        cellStarts = [0] * len(neighbors)
+        cellSizes = [0] * len(neighbors)
+        for vertices in classes:
+            if not vertices:
+                continue
+
+            cellSizes[len(lab)] = len(vertices)
+            for vertex in vertices:
+                cellStarts[vertex] = len(lab)
+            lab += vertices
+
+        trace = _refine(neighbors, lab, cellStarts, cellSizes, sorted(set(cellStarts)))
+        self._search(lab, cellStarts, cellSizes, [(0, trace)], [])
+
+    def _search(self, lab, cellStarts, cellSizes, key, path):
+        """
+        Searches the leaves below a partition.
+
+        Arguments:
+            key {list of tuples} -- (0, trace) of every refinement leading to the partition
+            path {list of ints} -- the vertices picked out on the way
+
+        Returns:
+            {int} -- number of vertices on the path of the node the search goes back to
+            (when an automorphism made the rest of the branch pointless), or None
+        """
+
+        target = _get_target_cell(lab, cellSizes)
+        if target is None:
+            return self._reach_leaf(lab, key, path)
+
+        explored = []
+        orbitOf = None
+        automorphismCount = None
+        for vertex in lab[target:target + cellSizes[target]]:
+            if explored:
+                # a vertex an automorphism fixing the path maps onto an explored one leads to the same leaves
+                if automorphismCount != len(self.automorphisms):
+                    automorphismCount = len(self.automorphisms)
+                    orbitOf = self._get_orbits(path)
+                if any(orbitOf(vertex) == orbitOf(exploredVertex) for exploredVertex in explored):
+                    continue
+            explored.append(vertex)
+
+            childLab = lab[:]
+            childStarts = cellStarts[:]
+            childSizes = cellSizes[:]
+            _individualize(vertex, target, childLab, childStarts, childSizes)
+
+            childKey = key + [(0, _refine(self.neighbors, childLab, childStarts, childSizes, [target]))]
+            if self.bestKey is not None and childKey > self.bestKey[:len(childKey)]:
+                continue
+
+            backtrackLevel = self._search(childLab, childStarts, childSizes, childKey, path + [vertex])
+            if backtrackLevel is not None and backtrackLevel < len(path):
+                return backtrackLevel
+
+    def _reach_leaf(self, lab, key, path):
+        positions = [0] * len(lab)
+        for position, vertex in enumerate(lab):
+            positions[vertex] = position
+
+        neighbors = self.neighbors
+        certificate = tuple(sorted([(positions[vertex], positions[neighbor])
+                                    for vertex in range(len(lab))
+                                    for neighbor in neighbors[vertex]
+                                    if positions[vertex] < positions[neighbor]]))
+        leafKey = key + [(1, certificate)]
+
+        if self.bestKey is None or leafKey < self.bestKey:
+            self.bestKey = leafKey
+            self.bestLab = lab
+            self.bestPath = path
+            return
+
+        if leafKey == self.bestKey:
+            # the same graph in both orders, so mapping one order onto the other is an automorphism
+            automorphism = [0] * len(lab)
+            for vertex, bestVertex in zip(lab, self.bestLab):
+                automorphism[vertex] = bestVertex
+            self.automorphisms.append(automorphism)
+
+            # it maps the branch of the best leaf onto this one from the node where the paths part,
+            # so the rest of this branch has nothing new
+            commonLength = 0
+            while (commonLength < len(path) and commonLength < len(self.bestPath)
+                   and path[commonLength] == self.bestPath[commonLength]):
+                commonLength += 1
+
+            return commonLength
+
+    def _get_orbits(self, path):
+        """
+        Returns:
+            {callable} -- vertex -> representative of its orbit under the automorphisms found which fix the path
+        """
+
+        parents = list(range(len(self.neighbors)))
+
+        def find(vertex):
+            while parents[vertex] != vertex:
+                parents[vertex] = parents[parents[vertex]]
+                vertex = parents[vertex]
+            return vertex
+
+        for automorphism in self.automorphisms:
+            if any(automorphism[vertex] != vertex for vertex in path):
+                continue
+
+            for vertex, image in enumerate(automorphism):
+                vertexRoot = find(vertex)
+                imageRoot = find(image)
+                if vertexRoot != imageRoot:
+                    parents[max(vertexRoot, imageRoot)] = min(vertexRoot, imageRoot)
+
+        return find
+
+    def get_positions(self):
+        """
+        Returns:
+            {list of ints} -- canonical position of every vertex
+        """
+
+        positions = [0] * len(self.bestLab)
+        for position, vertex in enumerate(self.bestLab):
+            positions[vertex] = position
+
+        return positions
+
+
+def _get_target_cell(lab, cellSizes):
+    """
+    Returns:
+        {int} -- start of the first largest cell with more than one vertex (None if there's none),
+        picking out one of many vertices tells the most about the rest
+    """
+
+    target = None
+    start = 0
+    while start < len(lab):
+        size = cellSizes[start]
+        if size > 1 and (target is None or size > cellSizes[target]):
+            target = start
+        start += size
+
+    return target
+
+
+def _individualize(vertex, start, lab, cellStarts, cellSizes):
+    """
+    Moves the vertex out of its cell (starting at start) into a cell of its own just before it.
+    """
+
+    size = cellSizes[start]
+    vertexI = lab.index(vertex, start, start + size)
+    lab[start], lab[vertexI] = lab[vertexI], lab[start]
+
+    cellSizes[start] = 1
+    cellSizes[start + 1] = size - 1
+    for otherVertex in lab[start + 1:start + size]:
+        cellStarts[otherVertex] = start + 1
+
+
+def _refine(neighbors, lab, cellStarts, cellSizes, splitters):
+    """
+    Splits the cells by the number of neighbors their vertices have in the splitter cells, until every vertex
+    of a cell has the same number of neighbors in every cell (the partition is equitable). The cells are split
+    in the order of their starts and the fragments are ordered by the counts, so it doesn't depend
+    on the numbering of the vertices.
+
+    Returns:
+        {tuple} -- trace of the splits (the same for partitions an isomorphism maps onto each other)
+    """
+
+    queue = list(splitters)
+    heapq.heapify(queue)
+    queued = set(queue)
+
+    trace = []
+    while queue:
+        splitter = heapq.heappop(queue)
+        queued.discard(splitter)
+
+        counts = {}
+        for vertex in lab[splitter:splitter + cellSizes[splitter]]:
+            for neighbor in neighbors[vertex]:
+                counts[neighbor] = counts.get(neighbor, 0) + 1
+
+        hitCells = {}
+        for vertex in counts:
+            hitCells.setdefault(cellStarts[vertex], []).append(vertex)
+
+        for start in sorted(hitCells):
+            size = cellSizes[start]
+            hitVertices = hitCells[start]
+            if size == 1:
+                trace.append((splitter, start, counts[hitVertices[0]]))
+                continue
+
+            members = lab[start:start + size]
+            members.sort(key=lambda vertex: counts.get(vertex, 0))
+
+            fragments = []
+            fragmentStart = 0
+            for memberI in range(1, size + 1):
+                if memberI == size or counts.get(members[memberI], 0) != counts.get(members[fragmentStart], 0):
+                    fragments.append((start + fragmentStart, memberI - fragmentStart,
+                                      counts.get(members[fragmentStart], 0)))
+                    fragmentStart = memberI
+
+            trace.append((splitter, start, tuple([(count, length) for _, length, count in fragments])))
+            if len(fragments) == 1:
+                continue
+
+            lab[start:start + size] = members
+            for fragmentStart, length, _ in fragments:
+                cellSizes[fragmentStart] = length
+                for vertex in lab[fragmentStart:fragmentStart + length]:
+                    cellStarts[vertex] = fragmentStart
+
+            if start in queued:
+                newSplitters = fragments[1:]
+            else:
+                # the largest fragment follows from the others (the first one if there are more)
+                largest = max(fragments, key=lambda fragment: fragment[1])
+                newSplitters = [fragment for fragment in fragments if fragment is not largest]
+
+            for fragmentStart, _, _ in newSplitters:
+                heapq.heappush(queue, fragmentStart)
+                queued.add(fragmentStart)
+
+    return tuple(trace)
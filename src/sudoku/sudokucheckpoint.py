@@ -0,0 +1,139 @@
+"""
+Module saving the state of a search to a file now and then, so a solve killed halfway can be resumed
+where it was (used by SudokuBoard.solve and gen_solving_step_by_step with checkpointFile)
+
+    A checkpoint is a json file with the board it belongs to (givens, shape, constraints and the kind of search)
+    and the state of the search: the nums placed so far, the stack of untried candidates ('bitmask')
+    or the spot the search is at ('backtrack', the same for solve and gen_solving_step_by_step) and the stats.
+    It's written to a temporary file first and moved over the old one, so a crash while saving can't corrupt it.
+
+    Main methods:
+        save_checkpoint -- writes a checkpoint to a file
+        load_checkpoint -- reads a checkpoint from a file
+        get_checkpoint_name -- returns a file name for a board's checkpoint
+        Checkpointer -- saves the state of a single search every few seconds
+"""
+
+import hashlib
+import json
+import os
+import time
+from sudoku.sudokuexceptions import ArgumentError
+
+_fileVersion = 1
+
+
+def save_checkpoint(path, checkpoint):
+    """
+    Saves a checkpoint to a json file (written to a temporary file first, so a crash can't corrupt it).
+
+    Arguments:
+        path {str}
+        checkpoint {dict} -- json serializable
+    """
+
+    tempPath = path + '.tmp'
+    with open(tempPath, 'w') as checkpointFile:
+        json.dump(dict(checkpoint, version=_fileVersion), checkpointFile)
+
+        # on disk before it replaces the old one, the machine could go down right after
+        checkpointFile.flush()
+        os.fsync(checkpointFile.fileno())
+    os.replace(tempPath, path)
+
+
+def load_checkpoint(path):
+    """
+    Loads a checkpoint saved by save_checkpoint.
+
+    Raises:
+        ArgumentError: Incorrect checkpoint file.
+
+    Returns:
+        {dict} -- the checkpoint or None if there's no such file
+    """
+
+    if not os.path.exists(path):
+        return
+
+    try:
+        with open(path, 'r') as checkpointFile:
+            checkpoint = json.load(checkpointFile)
+
+        if checkpoint.get('version') != _fileVersion or 'search' not in checkpoint:
+            raise ValueError
+    except (OSError, ValueError, AttributeError):
+        raise ArgumentError('Incorrect checkpoint file ({}).'.format(path))
+
+    del checkpoint['version']
+
+    return checkpoint
+
+
+def get_checkpoint_name(cells, strategy):
+    """
+    Returns:
+        {str} -- file name for the checkpoint of a board's search (the same for the same givens and strategy)
+    """
+
+    return 'sudoku-{}-{}.checkpoint'.format(strategy, hashlib.sha1(','.join(map(str, cells)).encode()).hexdigest()[:20])
+
+
+class Checkpointer:
+    """
+    Saves the state of a single search every interval seconds.
+
+        Arguments:
+            path {str} -- checkpoint file
+            board {dict} -- what the search belongs to (kind of the search, givens, shape, constraints...),
+            a checkpoint for anything else isn't resumed
+
+        Keyword Arguments:
+            interval {float} -- seconds between the saves (default: {60})
+    """
+
+    def __init__(self, path, board, interval=60):
+        self.path = path
+        self.board = board
+        self.interval = interval
+        self._nextSave = time.perf_counter() + interval
+
+    def load(self):
+        """
+        Raises:
+            ArgumentError: Incorrect checkpoint file.
+            ArgumentError: Checkpoint file belongs to another board or strategy.
+
+        Returns:
+            {dict} -- the state of the search saved in the file (None if there's no file)
+        """
+
+        checkpoint = load_checkpoint(self.path)
+        if checkpoint is None:
+            return
+
+        search = checkpoint.pop('search')
+        if checkpoint != self.board:
+            raise ArgumentError('Checkpoint file belongs to another board or strategy ({}).'.format(self.path))
+
+        return search
+
+    def is_due(self):
+        return time.perf_counter() >= self._nextSave
+
+    def save(self, search):
+        """
+        Arguments:
+            search {dict} -- the state of the search (json serializable)
+        """
+
+        save_checkpoint(self.path, dict(self.board, search=search))
+        self._nextSave = time.perf_counter() + self.interval
+
+    def remove(self):
+        """
+        Removes the checkpoint file (once the search is over).
+        """
+
+        if os.path.exists(self.path):
+            os.remove(self.path)
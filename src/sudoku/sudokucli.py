@@ -0,0 +1,681 @@
+"""
+Command-line interface of the sudoku package (python -m sudoku), it doesn't need a display
+
+    Commands:
+        solve -- reads boards from files or stdin and writes their solutions to stdout
+        dedupe -- writes the boards which aren't equal up to symmetry to any board before them
+        rate -- rates how hard the boards are for a human
+        count -- counts the solutions of the boards (up to a limit)
+        serve -- runs the HTTP service solving boards (see sudokuservice)
+        loadtest -- sends many concurrent requests to a running service
+        bench -- compares how fast the strategies solve the same boards (see sudokubenchmark)
+
+    Boards can be given as:
+        lines -- one board per line, either a char per spot ('.' or '0' meaning an empty spot,
+                 letters meaning nums above 9) or nums separated by commas or spaces
+        json -- a board (list of lists), a list of boards or objects with a 'board' key (like the suGOku API)
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from sudoku.sudokuboard import SudokuBoard, strategies, checkpointStrategies
+from sudoku.sudokubatch import solve_boards, dedupe_boards, rate_boards, propagate_boards
+from sudoku.sudokubenchmark import benchmarkStrategies, get_sample_boards, run_benchmark, format_benchmark, EXTERNAL
+from sudoku.sudokubenchmark import run_kernel_benchmark, get_speedup, PYTHON_KERNEL, COMPILED_KERNEL
+from sudoku.sudokukernel import is_compiled
+from sudoku.sudokucache import SolutionCache
+from sudoku.sudokuexceptions import ArgumentError, BoardError
+from sudoku.sudokuprofile import SamplingProfiler
+from sudoku.sudokuservice import serve, run_load_test
+
+# chars meaning the spot is empty in the line format
+_emptyChars = ('.', '0', '-', '_', '*')
+
+# chars used for nums in the line format (a char per spot)
+_numChars = '123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+formats = ('line', 'grid', 'json')
+
+
+def main(argv=None):
+    """
+    Runs the command-line interface.
+
+    Keyword Arguments:
+        argv {list of str} -- arguments (default: {None} (sys.argv))
+
+    Returns:
+        {int} -- exit code
+    """
+
+    parser = _create_parser()
+    args = parser.parse_args(argv)
+
+    if not args.command:
+        parser.print_help()
+        return 2
+
+    return args.run(args)
+
+
+def read_boards(text):
+    """
+    Reads boards from text (in the line or json format).
+
+    Arguments:
+        text {str}
+
+    Raises:
+        BoardError: if the text doesn't contain correct boards
+
+    Returns:
+        {list of tuples of lists} -- boards with '0' meaning an empty spot
+    """
+
+    strippedText = text.strip()
+    if strippedText.startswith('[') or strippedText.startswith('{'):
+        try:
+            data = json.loads(strippedText)
+        except json.JSONDecodeError as error:
+            raise BoardError('Incorrect json: {}'.format(error))
+
+        return _read_json_boards(data)
+
+    boards = []
+    for lineI, line in enumerate(text.splitlines()):
+        line = line.strip()
+
+        # empty lines and comments
+        if not line or line.startswith('#'):
+            continue
+
+        try:
+            boards.append(_read_line_board(line))
+        except BoardError as error:
+            raise BoardError('Line {}: {}'.format(lineI + 1, error.message))
+
+    return boards
+
+
+def format_solution(solution, outputFormat='line'):
+    """
+    Returns the solution as a string in the given format (line or grid).
+
+    Arguments:
+        solution {tuple of lists} -- the solved board (or None)
+
+    Keyword Arguments:
+        outputFormat {str} -- 'line' or 'grid' (default: {'line'})
+
+    Returns:
+        {str}
+    """
+
+    if not solution:
+        return 'No Solution'
+
+    if outputFormat == 'grid':
+        return '\n'.join([' '.join(row) for row in solution]) + '\n'
+
+    if len(solution) <= 9:
+        return ''.join([''.join(row) for row in solution])
+
+    return ','.join([','.join(row) for row in solution])
+
+
+def _create_parser():
+    parser = argparse.ArgumentParser(prog='python -m sudoku',
+                                     description='Solves sudoku boards without the GUI.')
+    subparsers = parser.add_subparsers(dest='command')
+
+    solveParser = subparsers.add_parser('solve', help='solve boards from files or stdin')
+    solveParser.add_argument('files', nargs='*', default=['-'],
+                             help="files with boards ('-' or nothing means stdin)")
+    solveParser.add_argument('--workers', type=int, default=1,
+                             help='number of processes solving the boards (default: 1)')
+    solveParser.add_argument('--strategy', choices=strategies, default='bitmask',
+                             help="algorithm used to solve the boards, 'parallel' uses all cores for every board "
+                                  "and can't be used with --workers (default: bitmask)")
+    solveParser.add_argument('--format', choices=formats, default='line', dest='outputFormat',
+                             help='format of the solutions (default: line)')
+    solveParser.add_argument('--stats', action='store_true',
+                             help='print the stats of solving (to stderr, and into the json output)')
+    solveParser.add_argument('--hardest-first', action='store_true', dest='hardestFirst',
+                             help='send the boards estimated to be the most expensive to the workers first')
+    solveParser.add_argument('--cache-file', default=None, dest='cacheFile',
+                             help='file keeping the solutions between runs (boards equal to solved ones up to '
+                                  'symmetry are not solved again)')
+    solveParser.add_argument('--cache-size', type=int, default=100000, dest='cacheSize',
+                             help='max number of solutions kept in the cache file (default: 100000)')
+    solveParser.add_argument('--timeout', type=float, default=None,
+                             help="seconds the search of every board can take, boards over it are reported as "
+                                  "'Budget Exceeded' (default: no limit)")
+    solveParser.add_argument('--max-nodes', type=int, default=None, dest='maxNodes',
+                             help='nums the search of every board can place (default: no limit)')
+    solveParser.add_argument('--checkpoint-dir', default=None, dest='checkpointDir',
+                             help="directory the searches are saved to now and then, running the same command again "
+                                  "resumes the unfinished ones ('backtrack' and 'bitmask' only)")
+    solveParser.add_argument('--checkpoint-interval', type=float, default=60, dest='checkpointInterval',
+                             help='seconds between the saves of every search (default: 60)')
+    solveParser.add_argument('--propagate', action='store_true',
+                             help='place the singles of many boards at once with NumPy first, only the boards '
+                                  'left unsolved are searched (needs numpy)')
+    _add_profile_arguments(solveParser)
+    solveParser.set_defaults(run=_run_solve)
+
+    dedupeParser = subparsers.add_parser('dedupe', help='drop boards equal up to symmetry to an earlier board')
+    dedupeParser.add_argument('files', nargs='*', default=['-'],
+                              help="files with boards ('-' or nothing means stdin)")
+    dedupeParser.add_argument('--workers', type=int, default=1,
+                              help='number of processes hashing the boards (default: 1)')
+    dedupeParser.add_argument('--hashes', action='store_true',
+                              help='write the canonical hash before every board')
+    dedupeParser.add_argument('--stats', action='store_true',
+                              help='print the number of boards read and kept (to stderr)')
+    dedupeParser.set_defaults(run=_run_dedupe)
+
+    rateParser = subparsers.add_parser('rate', help='rate how hard boards are for a human')
+    rateParser.add_argument('files', nargs='*', default=['-'],
+                            help="files with boards ('-' or nothing means stdin)")
+    rateParser.add_argument('--workers', type=int, default=1,
+                            help='number of processes rating the boards (default: 1)')
+    rateParser.add_argument('--format', choices=('line', 'json'), default='line', dest='outputFormat',
+                            help="format of the ratings, line is 'score label hardest technique' (default: line)")
+    rateParser.add_argument('--stats', action='store_true',
+                            help='print how many boards got every label (to stderr)')
+    rateParser.set_defaults(run=_run_rate)
+
+    countParser = subparsers.add_parser('count', help='count the solutions of boards')
+    countParser.add_argument('files', nargs='*', default=['-'],
+                             help="files with boards ('-' or nothing means stdin)")
+    countParser.add_argument('--limit', type=int, default=1000,
+                             help="the counting stops at that many solutions, written as 'limit+' (default: 1000)")
+    countParser.add_argument('--show', action='store_true',
+                             help='write the solutions of every board before its count')
+    countParser.set_defaults(run=_run_count)
+
+    serveParser = subparsers.add_parser('serve', help='run the HTTP service solving boards')
+    serveParser.add_argument('--host', default='127.0.0.1', help='(default: 127.0.0.1)')
+    serveParser.add_argument('--port', type=int, default=8080, help='(default: 8080)')
+    serveParser.add_argument('--workers', type=int, default=None,
+                             help='number of processes solving the boards (default: cpu count)')
+    serveParser.add_argument('--batch-size', type=int, default=64, dest='batchSize',
+                             help='max number of boards solved in a batch (default: 64)')
+    serveParser.add_argument('--batch-window', type=float, default=5, dest='batchWindow',
+                             help='max time (in ms) a board waits for its batch to fill (default: 5)')
+    serveParser.add_argument('--cache-size', type=int, default=0, dest='cacheSize',
+                             help='max number of solutions kept in the cache, 0 turns it off (default: 0)')
+    serveParser.add_argument('--cache-file', default=None, dest='cacheFile',
+                             help='file the cache is loaded from and saved to when the service stops')
+    serveParser.add_argument('--timeout', type=float, default=None,
+                             help='seconds the search of every board can take (default: no limit)')
+    serveParser.add_argument('--max-nodes', type=int, default=None, dest='maxNodes',
+                             help='nums the search of every board can place (default: no limit)')
+    serveParser.set_defaults(run=_run_serve)
+
+    loadTestParser = subparsers.add_parser('loadtest', help='send many concurrent requests to a running service')
+    loadTestParser.add_argument('files', nargs='*', default=['-'],
+                                help="files with boards sent in the requests ('-' or nothing means stdin)")
+    loadTestParser.add_argument('--url', default='http://127.0.0.1:8080', help='(default: http://127.0.0.1:8080)')
+    loadTestParser.add_argument('--requests', type=int, default=1000, dest='requestCount',
+                                help='number of requests (default: 1000)')
+    loadTestParser.add_argument('--concurrency', type=int, default=16,
+                                help='number of requests sent at once (default: 16)')
+    loadTestParser.add_argument('--boards-per-request', type=int, default=1, dest='boardsPerRequest',
+                                help='(default: 1)')
+    loadTestParser.set_defaults(run=_run_load_test)
+
+    benchParser = subparsers.add_parser('bench', help='compare how fast the strategies solve the same boards')
+    benchParser.add_argument('files', nargs='*', default=[],
+                             help="files with boards ('-' means stdin, nothing means the sample boards)")
+    benchParser.add_argument('--strategies', default=','.join(benchmarkStrategies),
+                             help='strategies compared, separated by commas (default: {})'.format(
+                                 ','.join(benchmarkStrategies)))
+    benchParser.add_argument('--repeat', type=int, default=3,
+                             help='times every board is solved by every strategy, the fastest is kept (default: 3)')
+    benchParser.add_argument('--timeout', type=float, default=10,
+                             help='seconds a strategy can take on a single board (default: 10)')
+    benchParser.add_argument('--sat-solver', default=None, dest='satSolver',
+                             help="external SAT solver compared too, 'auto' finds one on the PATH (default: none)")
+    benchParser.add_argument('--format', choices=('line', 'json'), default='line', dest='outputFormat',
+                             help='format of the results, line is a table (default: line)')
+    benchParser.add_argument('--kernel', action='store_true',
+                             help='compare the pure python bitmask kernel with the one compiled by setup_kernel.py '
+                                  'instead of the strategies')
+    _add_profile_arguments(benchParser)
+    benchParser.set_defaults(run=_run_bench)
+
+    return parser
+
+
+def _add_profile_arguments(commandParser):
+    commandParser.add_argument('--profile', default=None, dest='profileFile',
+                               help='sample the solving of every board and write the stacks to the file '
+                                    'in the collapsed format of flamegraph tools (see sudokuprofile)')
+    commandParser.add_argument('--profile-interval', type=float, default=0.001, dest='profileInterval',
+                               help='seconds between the samples (default: 0.001)')
+
+
+def _save_profile(profiler, fileName):
+    """
+    Writes the profile and prints the functions with the most samples of their own to stderr.
+    """
+
+    profiler.save(fileName)
+
+    print('{} samples written to {} (e.g. flamegraph.pl {} > profile.svg)'.format(
+        sum(profiler.samples.values()), fileName, fileName), file=sys.stderr)
+    print('{:>8}{:>8}  function'.format('self', 'total'), file=sys.stderr)
+
+    # the stacks start with the strategy and the board
+    for frameName, selfSamples, totalSamples in profiler.get_top_functions(10, 2):
+        print('{:>8}{:>8}  {}'.format(selfSamples, totalSamples, frameName), file=sys.stderr)
+
+
+def _read_boards_from_files(fileNames):
+    """
+    Reads boards from the given files ('-' meaning stdin), printing the error if it can't.
+
+    Returns:
+        {list of tuples of lists} -- the boards or None if they can't be read
+    """
+
+    boards = []
+    try:
+        for fileName in fileNames:
+            if fileName == '-':
+                boards += read_boards(sys.stdin.read())
+            else:
+                with open(fileName, 'r') as boardsFile:
+                    boards += read_boards(boardsFile.read())
+    except BoardError as error:
+        print('Error: {}'.format(error.message), file=sys.stderr)
+        return
+    except OSError as error:
+        print('Error: {}'.format(error), file=sys.stderr)
+        return
+
+    return boards
+
+
+def _run_dedupe(args):
+    if args.workers < 1:
+        print('--workers must be positive', file=sys.stderr)
+        return 2
+
+    boards = _read_boards_from_files(args.files)
+    if boards is None:
+        return 2
+
+    keptCount = 0
+    for board, boardHash in dedupe_boards(boards, args.workers):
+        keptCount += 1
+
+        line = format_solution(board)
+        if args.hashes:
+            line = '{} {}'.format(boardHash, line)
+        print(line)
+
+    if args.stats:
+        print('boards: {}, kept: {}, duplicates: {}'.format(len(boards), keptCount, len(boards) - keptCount),
+              file=sys.stderr)
+
+    return 0
+
+
+def _run_rate(args):
+    if args.workers < 1:
+        print('--workers must be positive', file=sys.stderr)
+        return 2
+
+    boards = _read_boards_from_files(args.files)
+    if boards is None:
+        return 2
+
+    labelCounts = {}
+
+    if args.outputFormat == 'json':
+        sys.stdout.write('[')
+
+    for boardI, rating in enumerate(rate_boards(boards, args.workers)):
+        if 'error' in rating:
+            print('Board {}: {}'.format(boardI + 1, rating['error']), file=sys.stderr)
+            label = 'error'
+        else:
+            label = rating['label'] or rating['status']
+
+        labelCounts[label] = labelCounts.get(label, 0) + 1
+
+        if args.outputFormat == 'json':
+            sys.stdout.write((',\n' if boardI else '') + json.dumps(rating))
+        elif 'error' in rating:
+            print('error')
+        else:
+            print('{:.1f} {} {}'.format(rating['score'], label, rating['hardest']))
+
+    if args.outputFormat == 'json':
+        sys.stdout.write(']\n')
+
+    if args.stats:
+        print(', '.join(['{}: {}'.format(label, count) for label, count in sorted(labelCounts.items())]),
+              file=sys.stderr)
+
+    return 0
+
+
+def _run_count(args):
+    if args.limit < 1:
+        print('--limit must be positive', file=sys.stderr)
+        return 2
+
+    boards = _read_boards_from_files(args.files)
+    if boards is None:
+        return 2
+
+    for boardI, board in enumerate(boards):
+        try:
+            solutions = SudokuBoard(board).iter_solutions(args.limit)
+
+            solutionCount = 0
+            for solution in solutions:
+                solutionCount += 1
+                if args.show:
+                    print(format_solution(solution))
+        except BoardError as error:
+            print('Board {}: {}'.format(boardI + 1, error.message), file=sys.stderr)
+            print('error')
+            continue
+
+        print('{}+'.format(solutionCount) if solutionCount == args.limit else solutionCount)
+
+    return 0
+
+
+def _run_serve(args):
+    print('Serving on http://{}:{}'.format(args.host, args.port), file=sys.stderr)
+    try:
+        serve(args.host, args.port, args.workers, args.batchSize, args.batchWindow / 1000,
+              args.cacheSize, args.cacheFile, args.timeout, args.maxNodes)
+    except ArgumentError as error:
+        print('Error: {}'.format(error.message), file=sys.stderr)
+        return 2
+
+    return 0
+
+
+def _run_load_test(args):
+    boards = _read_boards_from_files(args.files)
+    if boards is None:
+        return 2
+
+    try:
+        results = run_load_test(args.url, boards, args.requestCount, args.concurrency, args.boardsPerRequest)
+    except ArgumentError as error:
+        print('Error: {}'.format(error.message), file=sys.stderr)
+        return 2
+
+    for key, value in results.items():
+        print('{}: {}'.format(key, round(value, 3) if isinstance(value, float) else value))
+
+    return 0 if not results['errors'] else 1
+
+
+def _run_bench(args):
+    benchStrategies = tuple([strategy.strip() for strategy in args.strategies.split(',') if strategy.strip()])
+    wrongStrategies = [strategy for strategy in benchStrategies if strategy not in strategies]
+    if wrongStrategies or not benchStrategies:
+        print('--strategies must be some of: {}'.format(', '.join(strategies)), file=sys.stderr)
+        return 2
+
+    if args.repeat < 1:
+        print('--repeat must be positive', file=sys.stderr)
+        return 2
+
+    if args.files:
+        boards = _read_boards_from_files(args.files)
+        if boards is None:
+            return 2
+        boards = [('{}'.format(boardI + 1), board) for boardI, board in enumerate(boards)]
+    else:
+        boards = get_sample_boards()
+
+    if args.kernel and args.profileFile:
+        print("--profile can't be used with --kernel", file=sys.stderr)
+        return 2
+
+    profiler = SamplingProfiler(args.profileInterval) if args.profileFile else None
+
+    if args.kernel:
+        columns = (PYTHON_KERNEL, COMPILED_KERNEL) if is_compiled() else (PYTHON_KERNEL,)
+        benchmark = run_kernel_benchmark(boards, args.repeat)
+
+        if not is_compiled():
+            print("sudokukernel isn't compiled (python setup_kernel.py build_ext --inplace in src), "
+                  'only the pure python kernel is timed', file=sys.stderr)
+    else:
+        columns = benchStrategies + ((EXTERNAL,) if args.satSolver else ())
+        benchmark = run_benchmark(boards, benchStrategies, args.repeat, args.timeout, args.satSolver, profiler)
+
+    rows = []
+    try:
+        for row in benchmark:
+            rows.append(row)
+            if args.outputFormat == 'line':
+                # the table is printed once all boards are done, so show the progress meanwhile
+                print('{} done'.format(row['name']), file=sys.stderr)
+    except (ArgumentError, BoardError) as error:
+        print('Error: {}'.format(error.message), file=sys.stderr)
+        return 2
+
+    if args.outputFormat == 'json':
+        print(json.dumps(rows, indent=1))
+    else:
+        print(format_benchmark(rows, columns))
+
+        if COMPILED_KERNEL in columns:
+            speedup = get_speedup(rows, PYTHON_KERNEL, COMPILED_KERNEL)
+            if speedup is not None:
+                print('{} kernel is {:.1f}x faster'.format(COMPILED_KERNEL, speedup))
+
+    if profiler is not None:
+        _save_profile(profiler, args.profileFile)
+
+    return 0
+
+
+def _run_solve(args):
+    if args.workers < 1:
+        print('--workers must be positive', file=sys.stderr)
+        return 2
+
+    if args.workers > 1 and args.strategy == 'parallel':
+        print("--strategy parallel can't be used with --workers", file=sys.stderr)
+        return 2
+
+    if args.checkpointDir and args.strategy not in checkpointStrategies:
+        print('--checkpoint-dir can only be used with --strategy backtrack or bitmask', file=sys.stderr)
+        return 2
+
+    if args.propagate and propagate_boards is None:
+        print('--propagate needs numpy (pip install numpy)', file=sys.stderr)
+        return 2
+
+    if args.workers > 1 and args.profileFile:
+        print("--profile can't be used with --workers", file=sys.stderr)
+        return 2
+
+    boards = _read_boards_from_files(args.files)
+    if boards is None:
+        return 2
+
+    cache = None
+    if args.cacheFile:
+        try:
+            cache = SolutionCache(args.cacheSize, args.cacheFile)
+        except ArgumentError as error:
+            print('Error: {}'.format(error.message), file=sys.stderr)
+            return 2
+
+    if args.checkpointDir:
+        os.makedirs(args.checkpointDir, exist_ok=True)
+
+    profiler = SamplingProfiler(args.profileInterval) if args.profileFile else None
+
+    startTime = time.perf_counter()
+    totals = {'boards': 0, 'solved': 0, 'unsolvable': 0, 'exceeded': 0, 'errors': 0, 'cached': 0, 'nodes': 0,
+              'solveTime': 0}
+
+    if args.outputFormat == 'json':
+        sys.stdout.write('[')
+
+    for boardI, (solution, stats) in enumerate(solve_boards(boards, args.strategy, args.workers, cache=cache,
+                                                            hardestFirst=args.hardestFirst,
+                                                            timeout=args.timeout, maxNodes=args.maxNodes,
+                                                            checkpointDir=args.checkpointDir,
+                                                            checkpointInterval=args.checkpointInterval,
+                                                            propagate=args.propagate, profiler=profiler)):
+        totals['boards'] += 1
+        totals['cached'] += stats.get('cached', False)
+        if 'error' in stats:
+            totals['errors'] += 1
+            status = 'error'
+            print('Board {}: {}'.format(boardI + 1, stats['error']), file=sys.stderr)
+        elif solution:
+            totals['solved'] += 1
+            status = 'solved'
+        elif 'exceeded' in stats:
+            totals['exceeded'] += 1
+            status = 'exceeded'
+        else:
+            totals['unsolvable'] += 1
+            status = 'unsolvable'
+
+        totals['nodes'] += stats.get('nodes', 0)
+        totals['solveTime'] += stats.get('time', 0)
+
+        if args.outputFormat == 'json':
+            result = {'solution': [[int(num) for num in row] for row in solution] if solution else None,
+                      'status': status}
+            if 'error' in stats:
+                result['error'] = stats['error']
+            elif args.stats:
+                result['stats'] = stats
+
+            sys.stdout.write((',\n' if boardI else '') + json.dumps(result))
+        elif status == 'exceeded':
+            print('Budget Exceeded ({})'.format(stats['exceeded']))
+        else:
+            print(format_solution(solution, args.outputFormat))
+
+    if args.outputFormat == 'json':
+        sys.stdout.write(']\n')
+
+    if cache is not None:
+        cache.save()
+
+    if profiler is not None:
+        _save_profile(profiler, args.profileFile)
+
+    if args.stats:
+        wallTime = time.perf_counter() - startTime
+        print('boards: {boards}, solved: {solved}, unsolvable: {unsolvable}, exceeded: {exceeded}, errors: {errors}, '
+              'cached: {cached}, nodes: {nodes}, solve time: {solveTime:.3f}s'.format(**totals), file=sys.stderr)
+        print('wall time: {:.3f}s, {:.1f} boards/s'.format(wallTime, totals['boards'] / wallTime if wallTime else 0),
+              file=sys.stderr)
+
+    return 0
+
+
+def _read_line_board(line):
+    """
+    Reads a single board written in a single line.
+
+    Arguments:
+        line {str}
+
+    Raises:
+        BoardError: if the line isn't a correct board
+
+    Returns:
+        {tuple of lists}
+    """
+
+    if ',' in line or ' ' in line or '\t' in line:
+        elements = [element.strip() for element in line.replace(',', ' ').split()]
+        elements = ['0' if element in _emptyChars else element
+                    for element in elements]
+    else:
+        elements = []
+        for char in line:
+            if char in _emptyChars:
+                elements.append('0')
+            elif char.upper() in _numChars:
+                elements.append(str(_numChars.index(char.upper()) + 1))
+            else:
+                raise BoardError('Unknown char in board ({}).'.format(char))
+
+    return _make_board(elements)
+
+
+def _read_json_boards(data):
+    """
+    Reads boards from json data (a board, a list of boards or objects with a 'board' key).
+
+    Arguments:
+        data {any}
+
+    Raises:
+        BoardError: if the data doesn't contain correct boards
+
+    Returns:
+        {list of tuples of lists}
+    """
+
+    if isinstance(data, dict):
+        data = [data]
+    elif data and isinstance(data, list) and data[0] and isinstance(data[0], list) and not isinstance(data[0][0], list):
+        # a single board
+        data = [data]
+
+    if not isinstance(data, list):
+        raise BoardError('Json must contain a board or a list of boards.')
+
+    boards = []
+    for board in data:
+        if isinstance(board, dict):
+            board = board.get('board')
+
+        if not isinstance(board, list) or not all(isinstance(row, list) for row in board):
+            raise BoardError('Json must contain a board or a list of boards.')
+
+        elements = ['0' if element in (None, '', '.') else str(element)
+                    for row in board
+                    for element in row]
+        boards.append(_make_board(elements))
+
+    return boards
+
+
+def _make_board(elements):
+    """
+    Makes a board out of a flat list of elements.
+
+    Arguments:
+        elements {list of str}
+
+    Raises:
+        BoardError: if the number of elements isn't a square
+
+    Returns:
+        {tuple of lists}
+    """
+
+    size = int(round(len(elements) ** 0.5))
+    if size == 0 or size * size != len(elements):
+        raise BoardError("Board's spot count must be a square (got {}).".format(len(elements)))
+
+    return tuple([elements[rowI * size:(rowI + 1) * size]
+                  for rowI in range(size)])
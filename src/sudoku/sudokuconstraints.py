@@ -0,0 +1,407 @@
+"""
+Module containing extra rules boards can be solved with (SudokuBoard's and KernelSolver's constraints)
+
+    A constraint restricts the nums some spots can take on top of the rows, columns and squares.
+    Every solver binds its own copy of it (see Constraint.bind), which keeps bitmasks of the nums placed
+    so far up to date as the solver places and removes them, so checking a spot never looks at the whole board.
+
+    Main methods:
+        Constraint -- base of the constraints, see it for what a new one has to implement
+        DiagonalConstraint -- both main diagonals contain every num once (X-sudoku)
+        JigsawConstraint -- irregular regions take the place of the squares
+        KillerConstraint -- cages whose nums are all different and add up to a given sum
+        register_constraint -- adds a constraint type to constraintTypes
+        make_constraint -- makes a constraint by its name
+"""
+
+import copy
+import functools
+import itertools
+from sudoku.sudokuexceptions import BoardError, ArgumentError
+
+# name -> constraint type (see register_constraint)
+constraintTypes = {}
+
+
+def register_constraint(constraintType):
+    """
+    Registers a constraint type under its name (can be used as a class decorator).
+
+    Arguments:
+        constraintType {type} -- subclass of Constraint with a name
+
+    Raises:
+        ArgumentError: Constraint type must have a name.
+
+    Returns:
+        {type} -- the constraint type
+    """
+
+    if not getattr(constraintType, 'name', None):
+        raise ArgumentError('Constraint type must have a name.')
+
+    constraintTypes[constraintType.name] = constraintType
+
+    return constraintType
+
+
+def make_constraint(name, *args, **kwargs):
+    """
+    Makes a constraint of a registered type.
+
+    Arguments:
+        name {str} -- e.g. 'diagonal', 'jigsaw' or 'killer'
+        the rest is passed to the constraint's constructor
+
+    Raises:
+        ArgumentError: Unknown constraint.
+
+    Returns:
+        {Constraint}
+    """
+
+    if name not in constraintTypes:
+        raise ArgumentError('Unknown constraint ({}).'.format(', '.join(sorted(constraintTypes))))
+
+    return constraintTypes[name](*args, **kwargs)
+
+
+class Constraint:
+    """
+    Base of the constraints. A constraint given to a solver is only a definition, the solver calls bind
+    to get its own copy with a fresh state, then place and remove for every num it puts in (or takes out of)
+    one of get_spots, and allowed when it looks for the candidates of one of them.
+    """
+
+    name = None
+
+    def bind(self, size):
+        """
+        Returns a copy of the constraint ready to be used by a single solver.
+
+        Arguments:
+            size {int} -- length of the board's side
+
+        Raises:
+            BoardError: if the constraint doesn't fit the board
+
+        Returns:
+            {Constraint}
+        """
+
+        bound = copy.copy(self)
+        bound.setup(size)
+
+        return bound
+
+    def setup(self, size):
+        """
+        Checks the constraint fits the board and makes its (empty) state.
+        """
+
+        self.size = size
+        self.fullMask = (1 << size) - 1
+
+    def get_spots(self):
+        """
+        Returns:
+            {list of ints} -- spots (row * size + column) the constraint restricts
+        """
+
+        return []
+
+    def get_units(self):
+        """
+        Returns:
+            {list of lists} -- groups of spots which have to contain every num once (like rows),
+            the solvers use them to find dead ends and nums with a single place left
+        """
+
+        return []
+
+    def get_regions(self):
+        """
+        Returns:
+            {list of ints} -- region of every spot, taking the place of the squares (or None to keep the squares)
+        """
+
+        return None
+
+    def allowed(self, spot):
+        """
+        Returns:
+            {int} -- bitmask of nums the constraint allows in the given (empty) spot
+        """
+
+        return self.fullMask
+
+    def place(self, spot, bit):
+        pass
+
+    def remove(self, spot, bit):
+        pass
+
+    def find_contradiction(self):
+        """
+        Returns:
+            {str} -- what makes the board unsolvable under the constraint (or None)
+        """
+
+        return None
+
+    def get_clauses(self, variable, add_variable):
+        """
+        Encodes the rules of the constraint which get_units and get_regions don't cover as CNF (see sudokusat).
+
+        Arguments:
+            variable {function} -- variable(spot, num) returns the variable meaning num is in spot
+            (None if num can't be there)
+            add_variable {function} -- add_variable() returns a new variable
+
+        Returns:
+            {list of lists of ints} -- the clauses or None if the constraint can't be encoded
+        """
+
+        return None
+
+    def __repr__(self):
+        return '{}()'.format(type(self).__name__)
+
+
+@register_constraint
+class DiagonalConstraint(Constraint):
+    """
+    Both main diagonals contain every num once (X-sudoku).
+    """
+
+    name = 'diagonal'
+
+    def setup(self, size):
+        super().setup(size)
+
+        self._diagonals = [[rowI * size + rowI for rowI in range(size)],
+                           [rowI * size + size - 1 - rowI for rowI in range(size)]]
+        self._diagonalMasks = [0, 0]
+
+        # diagonals every spot is on (the middle of an odd board is on both)
+        self._diagonalsOf = {}
+        for diagonalI, diagonal in enumerate(self._diagonals):
+            for spot in diagonal:
+                self._diagonalsOf[spot] = self._diagonalsOf.get(spot, ()) + (diagonalI,)
+
+    def get_spots(self):
+        return list(self._diagonalsOf)
+
+    def get_units(self):
+        return self._diagonals
+
+    def allowed(self, spot):
+        mask = self.fullMask
+        for diagonalI in self._diagonalsOf[spot]:
+            mask &= ~self._diagonalMasks[diagonalI]
+
+        return mask
+
+    def place(self, spot, bit):
+        for diagonalI in self._diagonalsOf[spot]:
+            self._diagonalMasks[diagonalI] |= bit
+
+    def remove(self, spot, bit):
+        for diagonalI in self._diagonalsOf[spot]:
+            self._diagonalMasks[diagonalI] &= ~bit
+
+    def get_clauses(self, variable, add_variable):
+        # the diagonals are units
+        return []
+
+
+@register_constraint
+class JigsawConstraint(Constraint):
+    """
+    Irregular regions take the place of the squares.
+
+        Arguments:
+            regions {list} -- region of every spot, either row by row (a list of strings or lists,
+            e.g. ['AAABBBCCC', ...]) or as a flat list; any labels can be used
+
+        Raises:
+            BoardError: Regions must match the board and contain size spots each.
+    """
+
+    name = 'jigsaw'
+
+    def __init__(self, regions):
+        if regions and not isinstance(regions[0], (str, list, tuple)):
+            self.regions = list(regions)
+        else:
+            self.regions = [label for row in regions for label in row]
+
+    def setup(self, size):
+        super().setup(size)
+
+        labels = {}
+        for label in self.regions:
+            labels[label] = labels.get(label, 0) + 1
+
+        if len(self.regions) != size * size or len(labels) != size or any(count != size
+                                                                          for count in labels.values()):
+            raise BoardError('Regions must match the board and contain size spots each.')
+
+        regionIndexes = {label: regionI for regionI, label in enumerate(labels)}
+        self._regionOf = [regionIndexes[label] for label in self.regions]
+
+    def get_regions(self):
+        return self._regionOf
+
+    def get_clauses(self, variable, add_variable):
+        # the regions are units
+        return []
+
+    def __repr__(self):
+        return 'JigsawConstraint({!r})'.format(self.regions)
+
+
+@register_constraint
+class KillerConstraint(Constraint):
+    """
+    Cages whose nums are all different and add up to a given sum.
+
+        Arguments:
+            cages {list of tuples} -- (sum, list of (rowI, elementI)) for every cage
+
+        Raises:
+            BoardError: Cages must be inside the board and can't overlap.
+            BoardError: Cage can't be bigger than the board's side.
+    """
+
+    name = 'killer'
+
+    def __init__(self, cages):
+        self.cages = [(cageSum, [tuple(coords) for coords in spots]) for cageSum, spots in cages]
+
+    def setup(self, size):
+        super().setup(size)
+
+        self._cageOf = {}
+        self._cageSpots = []
+        for cageI, (_, coords) in enumerate(self.cages):
+            if len(coords) > size:
+                raise BoardError("Cage can't be bigger than the board's side.")
+
+            spots = []
+            for rowI, elementI in coords:
+                spot = rowI * size + elementI
+                if not (0 <= rowI < size and 0 <= elementI < size) or spot in self._cageOf:
+                    raise BoardError("Cages must be inside the board and can't overlap.")
+
+                self._cageOf[spot] = cageI
+                spots.append(spot)
+            self._cageSpots.append(spots)
+
+        # nums placed in every cage, what they still have to add up to and how many spots are empty
+        self._usedMasks = [0] * len(self.cages)
+        self._sumsLeft = [cageSum for cageSum, _ in self.cages]
+        self._spotsLeft = [len(spots) for spots in self._cageSpots]
+
+    def get_spots(self):
+        return list(self._cageOf)
+
+    def allowed(self, spot):
+        cageI = self._cageOf[spot]
+
+        return _get_cage_candidates(self.fullMask & ~self._usedMasks[cageI], self._spotsLeft[cageI],
+                                    self._sumsLeft[cageI])
+
+    def place(self, spot, bit):
+        cageI = self._cageOf[spot]
+        self._usedMasks[cageI] |= bit
+        self._sumsLeft[cageI] -= bit.bit_length()
+        self._spotsLeft[cageI] -= 1
+
+    def remove(self, spot, bit):
+        cageI = self._cageOf[spot]
+        self._usedMasks[cageI] &= ~bit
+        self._sumsLeft[cageI] += bit.bit_length()
+        self._spotsLeft[cageI] += 1
+
+    def get_clauses(self, variable, add_variable):
+        clauses = []
+        for (cageSum, _), spots in zip(self.cages, self._cageSpots):
+            cageVariables = [[variable(spot, num) for num in range(1, self.size + 1)] for spot in spots]
+
+            # every num at most once in the cage
+            for num in range(self.size):
+                numVariables = [spotVariables[num] for spotVariables in cageVariables if spotVariables[num]]
+                clauses += [[-numVariable, -otherVariable]
+                            for numVariableI, numVariable in enumerate(numVariables)
+                            for otherVariable in numVariables[numVariableI + 1:]]
+
+            # the cage uses one of the sets of nums adding up to its sum, a variable meaning it's that set
+            # forbids every other num in the cage
+            possibleNums = [num for num in range(1, self.size + 1)
+                            if any(spotVariables[num - 1] for spotVariables in cageVariables)]
+            setVariables = []
+            for nums in itertools.combinations(possibleNums, len(spots)):
+                if sum(nums) != cageSum:
+                    continue
+
+                setVariable = add_variable()
+                setVariables.append(setVariable)
+                clauses += [[-setVariable, -spotVariables[num - 1]]
+                            for spotVariables in cageVariables
+                            for num in possibleNums
+                            if num not in nums and spotVariables[num - 1]]
+
+            clauses.append(setVariables)
+
+        return clauses
+
+    def find_contradiction(self):
+        for cageI, (cageSum, coords) in enumerate(self.cages):
+            if _get_cage_sums(self.fullMask & ~self._usedMasks[cageI], self._spotsLeft[cageI],
+                              self._sumsLeft[cageI]) is None:
+                return "Cage of spot ({}, {}) can't add up to {}.".format(coords[0][0], coords[0][1], cageSum)
+
+    def __repr__(self):
+        return 'KillerConstraint({!r})'.format(self.cages)
+
+
+def _get_cage_candidates(available, spotsLeft, sumLeft):
+    """
+    Returns:
+        {int} -- bitmask of the available nums which are part of some spotsLeft different available nums
+        adding up to sumLeft (0 if there are none)
+    """
+
+    return _get_cage_sums(available, spotsLeft, sumLeft) or 0
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _get_cage_sums(available, spotsLeft, sumLeft):
+    """
+    Returns:
+        {int} -- bitmask of the available nums used by the combinations of spotsLeft different nums
+        adding up to sumLeft, or None if there's no such combination (0 if spotsLeft is 0 and so is sumLeft)
+    """
+
+    if spotsLeft == 0:
+        return 0 if sumLeft == 0 else None
+    if sumLeft <= 0 or not available:
+        return
+
+    # the biggest available num is either used or not
+    num = available.bit_length()
+    bit = 1 << (num - 1)
+    rest = available ^ bit
+
+    used = None
+    if num <= sumLeft:
+        withNum = _get_cage_sums(rest, spotsLeft - 1, sumLeft - num)
+        if withNum is not None:
+            used = withNum | bit
+
+    withoutNum = _get_cage_sums(rest, spotsLeft, sumLeft)
+    if withoutNum is not None:
+        used = (used or 0) | withoutNum
+
+    return used
@@ -0,0 +1,856 @@
+"""
+Module containing the bitmask solver kernel (used by SudokuBoard.solve with strategy 'bitmask')
+
+    The board is a flat list of ints (row by row, 0 meaning an empty spot).
+    Every row, column and square keeps the nums placed in it as a bitmask (num 1 is bit 0),
+    so the candidates of a spot are just the bits missing from its row, column and square.
+    The search always continues from the empty spot with the fewest candidates (or a num which can only go
+    in one spot of a row, column or square), and backtracks as soon as a spot has no candidates
+    or a row, column or square has no spot left for one of its missing nums. Before branching the candidates
+    are narrowed by the box-line reduction, which often forces a num after all (or finds a dead end early),
+    that keeps big boards from getting lost in a wrong branch.
+    Extra rules (diagonals, jigsaw regions, killer cages, see sudokuconstraints) only add their own masks
+    to the spots they restrict.
+
+    Main methods:
+        KernelSolver -- solves a board given as a flat list of ints
+        iter_solutions -- yields every solution of a board, one at a time
+        get_box_shape -- returns the row and column count of a board's squares
+        board_to_cells -- converts a board (tuple of lists of strings) to a flat list of ints
+        cells_to_board -- converts a flat list of ints back to a board
+        is_compiled -- tells whether the module was compiled with mypyc (see setup_kernel.py)
+
+    The module is fully type annotated, so it can be compiled with mypyc (python setup_kernel.py build_ext --inplace
+    in src), the compiled module is imported instead of this one when it's there and this one is used when it isn't.
+"""
+
+import math
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from sudoku.sudokuexceptions import BoardError
+
+# statuses of the solver
+SOLVED = 'solved'
+UNSOLVABLE = 'unsolvable'
+PAUSED = 'paused'
+
+# first state of the random numbers of KernelSolver
+_randomSeed = 0x9E3779B97F4A7C15
+
+
+class KernelSolver:
+    """
+    Stores the state of the search and solves the given board.
+
+        Arguments:
+            cells {list of ints} -- board row by row, 0 meaning an empty spot
+            size {int} -- length of the board's side
+
+        Keyword Arguments:
+            boxRows {int} -- row count of a single square (default: {None} (see get_box_shape))
+            boxCols {int} -- column count of a single square (default: {None} (see get_box_shape))
+            constraints {list of Constraints} -- extra rules of the board (see sudokuconstraints) (default: {None})
+            restartBase {int} -- the search starts over after restartBase times the Luby sequence of backtracks
+            (see solve), None never starts it over (default: {64})
+
+        Raises:
+            BoardError: Board's size doesn't match the cell count.
+            BoardError: Board's size must be divisible into squares.
+            BoardError: Num in board out of range.
+            BoardError: if a constraint doesn't fit the board
+    """
+
+    def __init__(self, cells: Sequence[int], size: int, boxRows: Optional[int]=None, boxCols: Optional[int]=None,
+                 constraints: Optional[Sequence[Any]]=None, restartBase: Optional[int]=64) -> None:
+        if len(cells) != size * size:
+            raise BoardError("Board's size doesn't match the cell count.")
+
+        boxRows, boxCols = get_box_shape(size, boxRows, boxCols)
+
+        self.size = size
+        self.boxRows = boxRows
+        self.boxCols = boxCols
+
+        self.cells = list(cells)
+        self.fullMask = (1 << size) - 1
+
+        # which row, column and square every spot belongs to
+        boxesInRow = size // boxCols
+        self._rowOf = [spot // size for spot in range(size * size)]
+        self._colOf = [spot % size for spot in range(size * size)]
+        self._boxOf = [(spot // size) // boxRows * boxesInRow + (spot % size) // boxCols
+                       for spot in range(size * size)]
+
+        # every solver gets its own copies of the constraints, as they keep the state of the search
+        self.constraints = [constraint.bind(size) for constraint in constraints or ()]
+
+        # constraints restricting every spot and the groups of spots which contain every num once
+        self._spotConstraints: List[Tuple[Any, ...]] = [()] * (size * size)
+        self._extraUnits: List[List[int]] = []
+        for constraint in self.constraints:
+            for spot in constraint.get_spots():
+                self._spotConstraints[spot] += (constraint,)
+            self._extraUnits.extend(constraint.get_units())
+
+            regions = constraint.get_regions()
+            if regions is not None:
+                self._boxOf = list(regions)
+
+        # spots of every row, column and square (in that order)
+        self._unitSpots: List[List[int]] = [[] for _ in range(3 * size)]
+        for spot in range(size * size):
+            self._unitSpots[self._rowOf[spot]].append(spot)
+            self._unitSpots[size + self._colOf[spot]].append(spot)
+            self._unitSpots[2 * size + self._boxOf[spot]].append(spot)
+
+        # the parts rows and columns share with squares (segments) and groups of them covering a row, column
+        # or square (the rows' and columns' parts of a square are two groups), every segment is in a line's group
+        # and in a square's group, _otherGroups tells the other one (see _reduce)
+        segmentOf: Dict[Tuple[int, int], int] = {}
+        self._segmentSpots: List[List[int]] = []
+        for spot in range(size * size):
+            for lineI in (self._rowOf[spot], size + self._colOf[spot]):
+                key = (lineI, self._boxOf[spot])
+                if key not in segmentOf:
+                    segmentOf[key] = len(self._segmentSpots)
+                    self._segmentSpots.append([])
+                self._segmentSpots[segmentOf[key]].append(spot)
+
+        # the row's and the column's segment of every spot
+        self._rowSegmentOf = [segmentOf[(self._rowOf[spot], self._boxOf[spot])] for spot in range(size * size)]
+        self._colSegmentOf = [segmentOf[(size + self._colOf[spot], self._boxOf[spot])] for spot in range(size * size)]
+
+        self._segmentGroups: List[List[int]] = [[] for _ in range(4 * size)]
+        self._otherGroups: List[List[int]] = [[] for _ in range(4 * size)]
+        for key, segmentI in segmentOf.items():
+            lineI, boxI = key
+            boxGroupI = 2 * size + 2 * boxI + (1 if lineI >= size else 0)
+            self._segmentGroups[lineI].append(segmentI)
+            self._otherGroups[lineI].append(boxGroupI)
+            self._segmentGroups[boxGroupI].append(segmentI)
+            self._otherGroups[boxGroupI].append(lineI)
+
+        # candidates of the empty spots, filled by _pick_spot
+        self._candidatesOf = [0] * (size * size)
+
+        self.rowMasks = [0] * size
+        self.colMasks = [0] * size
+        self.boxMasks = [0] * size
+
+        # spots the solver can change
+        self.emptySpots: List[int] = []
+
+        # (spot, candidates not tried yet) for every spot the solver has filled
+        self.stack: List[Tuple[int, int]] = []
+
+        self.nodes = 0
+        self.backtracks = 0
+        self.status: Optional[str] = None
+
+        # the search starts over when backtracks reaches nextRestart, until it finds a solution
+        # (the rest of the solutions are then searched for without restarts, so every one is found once)
+        self.restartBase = restartBase
+        self.restarts = 0
+        self.nextRestart = -1 if restartBase is None else restartBase * _luby(1)
+
+        # state of the random numbers picking the spots and nums after a restart (the same in every search)
+        self.randomState = _randomSeed
+
+        # what makes the board unsolvable, if it's obvious from the givens (see find_contradiction)
+        self.contradiction: Optional[str] = None
+
+        for spot in range(size * size):
+            num = self.cells[spot]
+            if num < 0 or num > size:
+                raise BoardError('Num in board out of range.')
+
+            if num == 0:
+                self.emptySpots.append(spot)
+                continue
+
+            bit = 1 << (num - 1)
+            if (self.rowMasks[self._rowOf[spot]] | self.colMasks[self._colOf[spot]] |
+               self.boxMasks[self._boxOf[spot]]) & bit:
+                # the same num is given twice in a row, column or square
+                self.status = UNSOLVABLE
+                if self.contradiction is None:
+                    self.contradiction = 'Num {} is given twice in the {} of spot ({}, {}).'.format(
+                        num, self._get_unit_name(spot, bit), self._rowOf[spot], self._colOf[spot])
+
+            for constraint in self._spotConstraints[spot]:
+                if not constraint.allowed(spot) & bit:
+                    self.status = UNSOLVABLE
+                    if self.contradiction is None:
+                        self.contradiction = 'Num {} breaks the {} constraint in spot ({}, {}).'.format(
+                            num, constraint.name, self._rowOf[spot], self._colOf[spot])
+
+            self._set_bit(spot, bit)
+
+    def solve(self, nodeLimit: Optional[int]=None) -> str:
+        """
+        Searches for a solution (if the board has been solved already it searches for the next one).
+
+        Keyword Arguments:
+            nodeLimit {int} -- the search pauses when nodes reaches it, calling solve again resumes it
+            (default: {None} (no limit))
+
+        Returns:
+            {str} -- SOLVED (the solution is in cells), UNSOLVABLE or PAUSED
+        """
+
+        if self.status == UNSOLVABLE:
+            return UNSOLVABLE
+
+        if nodeLimit is None:
+            nodeLimit = sys.maxsize
+
+        if self.status == SOLVED:
+            # continue the search after the last solution
+            if not self._backtrack():
+                self.status = UNSOLVABLE
+                return self.status
+
+        cells = self.cells
+        stack = self.stack
+        while True:
+            if self.nodes >= nodeLimit:
+                self.status = PAUSED
+                return self.status
+
+            spot, candidates = self._pick_spot()
+
+            if spot < 0:
+                self.status = SOLVED
+                self.nextRestart = -1
+                return self.status
+
+            if candidates:
+                bit = self._pick_bit(candidates)
+                stack.append((spot, candidates ^ bit))
+                cells[spot] = bit.bit_length()
+                self._set_bit(spot, bit)
+                self.nodes += 1
+
+            elif not self._backtrack():
+                self.status = UNSOLVABLE
+                return self.status
+
+            elif 0 <= self.nextRestart <= self.backtracks:
+                # a wrong num close to the root can take ages to refute, a new run most likely
+                # doesn't place it, the runs get longer and longer, so the search still ends
+                self._restart()
+
+    def candidates(self, spot: int) -> int:
+        """
+        Returns:
+            {int} -- bitmask of nums that can be placed in the given (empty) spot
+        """
+
+        candidates = self.fullMask & ~(self.rowMasks[self._rowOf[spot]] |
+                                       self.colMasks[self._colOf[spot]] |
+                                       self.boxMasks[self._boxOf[spot]])
+        for constraint in self._spotConstraints[spot]:
+            candidates &= constraint.allowed(spot)
+
+        return candidates
+
+    def find_contradiction(self) -> Optional[str]:
+        """
+        Checks the board without searching: the same num given twice in a row, column or square,
+        an empty spot without candidates, a num missing from a row, column or square
+        which can't go anywhere in it, or a constraint which can't be met anymore.
+
+        Returns:
+            {str} -- what's wrong with the board or None if nothing was found (it can still be unsolvable)
+        """
+
+        if self.contradiction is not None:
+            return self.contradiction
+
+        cells = self.cells
+        size = self.size
+        coverMasks = self.rowMasks + self.colMasks + self.boxMasks
+        for spot in self.emptySpots:
+            if cells[spot]:
+                continue
+
+            candidates = self.candidates(spot)
+            if not candidates:
+                self.contradiction = 'Spot ({}, {}) has no candidates.'.format(self._rowOf[spot], self._colOf[spot])
+                return self.contradiction
+
+            coverMasks[self._rowOf[spot]] |= candidates
+            coverMasks[size + self._colOf[spot]] |= candidates
+            coverMasks[2 * size + self._boxOf[spot]] |= candidates
+
+        for unitI, coverMask in enumerate(coverMasks):
+            if coverMask != self.fullMask:
+                missing = self.fullMask & ~coverMask
+                self.contradiction = "Num {} can't be placed anywhere in {} {}.".format(
+                    (missing & -missing).bit_length(), ('row', 'column', 'square')[unitI // size], unitI % size)
+                return self.contradiction
+
+        for constraint in self.constraints:
+            for unit in constraint.get_units():
+                coverMask = 0
+                for spot in unit:
+                    coverMask |= 1 << (cells[spot] - 1) if cells[spot] else self.candidates(spot)
+
+                if coverMask != self.fullMask:
+                    missing = self.fullMask & ~coverMask
+                    self.contradiction = "Num {} can't be placed anywhere in a unit of the {} constraint.".format(
+                        (missing & -missing).bit_length(), constraint.name)
+                    return self.contradiction
+
+            self.contradiction = constraint.find_contradiction()
+            if self.contradiction is not None:
+                return self.contradiction
+
+        return None
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns:
+            {dict} -- nodes (nums placed) and backtracks made so far
+        """
+
+        return {'nodes': self.nodes, 'backtracks': self.backtracks}
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Returns:
+            {dict} -- the state of the search (json serializable), from_state continues it
+            exactly where it is (e.g. after the process was killed, see sudokucheckpoint)
+        """
+
+        return {'cells': list(self.cells), 'stack': [[spot, untried] for spot, untried in self.stack],
+                'nodes': self.nodes, 'backtracks': self.backtracks, 'status': self.status,
+                'restartBase': self.restartBase, 'restarts': self.restarts, 'nextRestart': self.nextRestart,
+                'randomState': self.randomState}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any], size: int, boxRows: Optional[int]=None, boxCols: Optional[int]=None,
+                   constraints: Optional[Sequence[Any]]=None) -> 'KernelSolver':
+        """
+        Makes a solver continuing a search saved by get_state.
+
+        Arguments:
+            state {dict} -- (see get_state)
+            size {int} -- length of the board's side
+
+        Keyword Arguments:
+            boxRows {int} -- row count of a single square (default: {None} (see get_box_shape))
+            boxCols {int} -- column count of a single square (default: {None} (see get_box_shape))
+            constraints {list of Constraints} -- extra rules of the board (see sudokuconstraints) (default: {None})
+
+        Raises:
+            BoardError: Incorrect search state.
+            BoardError: if the board is incorrect (see KernelSolver)
+
+        Returns:
+            {KernelSolver}
+        """
+
+        try:
+            cells = [int(num) for num in state['cells']]
+            stack = [(int(spot), int(untried)) for spot, untried in state['stack']]
+            nodes = int(state['nodes'])
+            backtracks = int(state['backtracks'])
+            status = state['status']
+
+            # states saved before the restarts were added continue without them
+            restartBase = None if state.get('restartBase') is None else int(state['restartBase'])
+            restarts = int(state.get('restarts', 0))
+            nextRestart = int(state.get('nextRestart', -1))
+            randomState = int(state.get('randomState', _randomSeed))
+        except (KeyError, TypeError, ValueError):
+            raise BoardError('Incorrect search state.')
+
+        if len(cells) != size * size or status not in (None, SOLVED, UNSOLVABLE, PAUSED):
+            raise BoardError('Incorrect search state.')
+
+        # the givens, the nums of the stack are placed back one by one (so the constraints follow them)
+        givens = list(cells)
+        for spot, _ in stack:
+            if not 0 <= spot < size * size or not givens[spot]:
+                raise BoardError('Incorrect search state.')
+            givens[spot] = 0
+
+        kernel = cls(givens, size, boxRows, boxCols, constraints, restartBase)
+        for spot, untried in stack:
+            if untried & ~kernel.fullMask:
+                raise BoardError('Incorrect search state.')
+
+            kernel.cells[spot] = cells[spot]
+            kernel._set_bit(spot, 1 << (cells[spot] - 1))
+
+        kernel.stack = stack
+        kernel.nodes = nodes
+        kernel.backtracks = backtracks
+        kernel.restarts = restarts
+        kernel.nextRestart = nextRestart
+        kernel.randomState = randomState
+        if kernel.status != UNSOLVABLE:
+            kernel.status = status
+
+        return kernel
+
+    def _pick_spot(self) -> Tuple[int, int]:
+        """
+        Returns the empty spot with the fewest candidates.
+        If no spot has a single candidate, the rows, columns and squares are checked too:
+        a num missing from one of them which can't go anywhere in it is a dead end,
+        and a num which can only go in one spot of it is placed there first (a hidden single).
+        If there's no single either, the candidates are narrowed by the box-line reduction (see _reduce)
+        and checked the same way again, so the search only branches when nothing is forced.
+
+        Returns:
+            {tuple} -- (spot, its candidates) or (-1, 0) if there are no empty spots
+            (the candidates are 0 if the board can't be solved from here)
+        """
+
+        spot, candidates, onceMasks, twiceMasks = self._scan_spots(False)
+        if spot < 0 or candidates & (candidates - 1) == 0:
+            return spot, candidates
+
+        singleSpot, bit = self._find_unit_single(onceMasks, twiceMasks)
+        if bit >= 0:
+            return (spot, 0) if bit == 0 else (singleSpot, bit)
+
+        if not self._reduce(self._candidatesOf):
+            return spot, candidates
+
+        spot, candidates, onceMasks, twiceMasks = self._scan_spots(True)
+        if candidates & (candidates - 1) == 0:
+            return spot, candidates
+
+        singleSpot, bit = self._find_unit_single(onceMasks, twiceMasks)
+        if bit >= 0:
+            return (spot, 0) if bit == 0 else (singleSpot, bit)
+
+        return spot, candidates
+
+    def _scan_spots(self, reduced: bool) -> Tuple[int, int, List[int], List[int]]:
+        """
+        Goes through the candidates of the empty spots, computed from the masks (and kept in _candidatesOf)
+        or, if reduced, the ones in _candidatesOf (narrowed by _reduce).
+
+        Returns:
+            {tuple} -- the first spot with at most one candidate and its candidates (the masks are empty then),
+            or the spot with the fewest candidates, its candidates and for every row, column and square
+            (in that order) the candidates seen in at least one and in at least two of its empty spots
+        """
+
+        cells = self.cells
+        rowOf = self._rowOf
+        colOf = self._colOf
+        boxOf = self._boxOf
+        rowMasks = self.rowMasks
+        colMasks = self.colMasks
+        boxMasks = self.boxMasks
+        fullMask = self.fullMask
+        spotConstraints = self._spotConstraints
+        candidatesOf = self._candidatesOf
+
+        size = self.size
+        onceMasks = [0] * (3 * size)
+        twiceMasks = [0] * (3 * size)
+
+        bestSpot = -1
+        bestCandidates = 0
+        bestCount = size + 1
+        tieCount = 0
+        for spot in self.emptySpots:
+            if cells[spot]:
+                continue
+
+            if reduced:
+                candidates = candidatesOf[spot]
+            else:
+                candidates = fullMask & ~(rowMasks[rowOf[spot]] | colMasks[colOf[spot]] | boxMasks[boxOf[spot]])
+                for constraint in spotConstraints[spot]:
+                    candidates &= constraint.allowed(spot)
+                candidatesOf[spot] = candidates
+
+            if candidates & (candidates - 1) == 0:
+                # a single candidate (or none, which is a dead end)
+                return spot, candidates, [], []
+
+            rowI = rowOf[spot]
+            colI = size + colOf[spot]
+            boxI = 2 * size + boxOf[spot]
+            twiceMasks[rowI] |= onceMasks[rowI] & candidates
+            onceMasks[rowI] |= candidates
+            twiceMasks[colI] |= onceMasks[colI] & candidates
+            onceMasks[colI] |= candidates
+            twiceMasks[boxI] |= onceMasks[boxI] & candidates
+            onceMasks[boxI] |= candidates
+
+            count = bin(candidates).count('1')
+            if count < bestCount:
+                bestSpot = spot
+                bestCandidates = candidates
+                bestCount = count
+                tieCount = 1
+            elif count == bestCount and self.restarts:
+                # after a restart the spot is picked at random from the ones with the fewest candidates
+                tieCount += 1
+                if self._random_below(tieCount) == 0:
+                    bestSpot = spot
+                    bestCandidates = candidates
+
+        return bestSpot, bestCandidates, onceMasks, twiceMasks
+
+    def _find_unit_single(self, onceMasks: List[int], twiceMasks: List[int]) -> Tuple[int, int]:
+        """
+        Checks the rows, columns, squares and the units of the constraints for a num missing from one of them
+        which can't go anywhere in it (a dead end) or which can only go in one spot of it (a hidden single).
+
+        Arguments:
+            onceMasks {list of ints} -- candidates seen in at least one empty spot of every unit (see _scan_spots)
+            twiceMasks {list of ints} -- candidates seen in at least two
+
+        Returns:
+            {tuple} -- (spot, bit of the num) of a hidden single, (-1, 0) for a dead end
+            or (-1, -1) if there's neither
+        """
+
+        cells = self.cells
+        fullMask = self.fullMask
+        candidatesOf = self._candidatesOf
+
+        unitMasks = self.rowMasks + self.colMasks + self.boxMasks
+        for unitI in range(len(unitMasks)):
+            onceMask = onceMasks[unitI]
+            if onceMask | unitMasks[unitI] != fullMask:
+                return -1, 0
+
+            hiddenSingles = onceMask & ~twiceMasks[unitI]
+            if hiddenSingles:
+                bit = hiddenSingles & -hiddenSingles
+                for spot in self._unitSpots[unitI]:
+                    if not cells[spot] and candidatesOf[spot] & bit:
+                        return spot, bit
+
+        # the same for the units of the constraints (e.g. diagonals)
+        for unit in self._extraUnits:
+            unitMask = onceMask = twiceMask = 0
+            for spot in unit:
+                if cells[spot]:
+                    unitMask |= 1 << (cells[spot] - 1)
+                else:
+                    candidates = candidatesOf[spot]
+                    twiceMask |= onceMask & candidates
+                    onceMask |= candidates
+
+            if onceMask | unitMask != fullMask:
+                return -1, 0
+
+            hiddenSingles = onceMask & ~twiceMask
+            if hiddenSingles:
+                bit = hiddenSingles & -hiddenSingles
+                for spot in unit:
+                    if not cells[spot] and candidatesOf[spot] & bit:
+                        return spot, bit
+
+        return -1, -1
+
+    def _reduce(self, candidatesOf: List[int]) -> bool:
+        """
+        Box-line reduction: a num which can only go in the part of a row or column it shares with a square
+        can't go in the rest of the square, and the other way around. Repeated until nothing changes.
+        Nothing is kept, the candidates are narrowed again from the placed nums at every node.
+
+        Arguments:
+            candidatesOf {list of ints} -- candidates of every empty spot, narrowed in place
+
+        Returns:
+            {bool} -- whether any candidate was removed
+        """
+
+        cells = self.cells
+        segmentSpots = self._segmentSpots
+        segmentGroups = self._segmentGroups
+
+        rowSegmentOf = self._rowSegmentOf
+        colSegmentOf = self._colSegmentOf
+        segmentMasks = [0] * len(segmentSpots)
+        for spot in self.emptySpots:
+            if not cells[spot]:
+                segmentMasks[rowSegmentOf[spot]] |= candidatesOf[spot]
+                segmentMasks[colSegmentOf[spot]] |= candidatesOf[spot]
+
+        reduced = False
+        changed = True
+        while changed:
+            changed = False
+            for groupI in range(len(segmentGroups)):
+                group = segmentGroups[groupI]
+                onceMask = twiceMask = 0
+                for segmentI in group:
+                    twiceMask |= onceMask & segmentMasks[segmentI]
+                    onceMask |= segmentMasks[segmentI]
+
+                # nums which only one part of the group's unit can take
+                confined = onceMask & ~twiceMask
+                if not confined:
+                    continue
+
+                otherGroups = self._otherGroups[groupI]
+                for memberI in range(len(group)):
+                    segmentI = group[memberI]
+                    bits = segmentMasks[segmentI] & confined
+                    if not bits:
+                        continue
+
+                    for otherSegmentI in segmentGroups[otherGroups[memberI]]:
+                        if otherSegmentI != segmentI and segmentMasks[otherSegmentI] & bits:
+                            segmentMasks[otherSegmentI] &= ~bits
+                            for spot in segmentSpots[otherSegmentI]:
+                                candidatesOf[spot] &= ~bits
+                            changed = reduced = True
+
+        return reduced
+
+    def _backtrack(self) -> bool:
+        """
+        Removes nums from the filled spots until one of them can take another candidate.
+
+        Returns:
+            {bool} -- False if there's nothing left to try
+        """
+
+        cells = self.cells
+        stack = self.stack
+        while stack:
+            spot, untried = stack.pop()
+            self._clear_bit(spot, 1 << (cells[spot] - 1))
+            cells[spot] = 0
+            self.backtracks += 1
+
+            if untried:
+                bit = self._pick_bit(untried)
+                stack.append((spot, untried ^ bit))
+                cells[spot] = bit.bit_length()
+                self._set_bit(spot, bit)
+                self.nodes += 1
+                return True
+
+        return False
+
+    def _restart(self) -> None:
+        """
+        Takes every num the search placed off the board and sets when the next run starts over.
+        """
+
+        cells = self.cells
+        stack = self.stack
+        while stack:
+            spot, _ = stack.pop()
+            self._clear_bit(spot, 1 << (cells[spot] - 1))
+            cells[spot] = 0
+
+        self.restarts += 1
+        if self.restartBase is not None:
+            self.nextRestart = self.backtracks + self.restartBase * _luby(self.restarts + 1)
+
+    def _pick_bit(self, candidates: int) -> int:
+        """
+        Returns:
+            {int} -- the candidate tried first, the lowest one in the first run and a random one after a restart
+        """
+
+        if not self.restarts or candidates & (candidates - 1) == 0:
+            return candidates & -candidates
+
+        for _ in range(self._random_below(bin(candidates).count('1'))):
+            candidates &= candidates - 1
+
+        return candidates & -candidates
+
+    def _random_below(self, count: int) -> int:
+        """
+        Returns:
+            {int} -- a random int from 0 to count - 1 (xorshift, so its whole state is the int randomState)
+        """
+
+        state = self.randomState
+        state ^= (state << 13) & 0xFFFFFFFFFFFFFFFF
+        state ^= state >> 7
+        state ^= (state << 17) & 0xFFFFFFFFFFFFFFFF
+        self.randomState = state
+
+        return state % count
+
+    def _get_unit_name(self, spot: int, bit: int) -> str:
+        """
+        Returns:
+            {str} -- 'row', 'column' or 'square', the first unit of the spot already containing the bit
+        """
+
+        if self.rowMasks[self._rowOf[spot]] & bit:
+            return 'row'
+        if self.colMasks[self._colOf[spot]] & bit:
+            return 'column'
+
+        return 'square'
+
+    def _set_bit(self, spot: int, bit: int) -> None:
+        self.rowMasks[self._rowOf[spot]] |= bit
+        self.colMasks[self._colOf[spot]] |= bit
+        self.boxMasks[self._boxOf[spot]] |= bit
+        for constraint in self._spotConstraints[spot]:
+            constraint.place(spot, bit)
+
+    def _clear_bit(self, spot: int, bit: int) -> None:
+        self.rowMasks[self._rowOf[spot]] &= ~bit
+        self.colMasks[self._colOf[spot]] &= ~bit
+        self.boxMasks[self._boxOf[spot]] &= ~bit
+        for constraint in self._spotConstraints[spot]:
+            constraint.remove(spot, bit)
+
+
+def _luby(index: int) -> int:
+    """
+    Returns:
+        {int} -- index-th element (from 1) of the Luby sequence (1 1 2 1 1 2 4 1 1 2 ...)
+    """
+
+    while True:
+        power = 1
+        while (1 << power) - 1 < index:
+            power += 1
+
+        if (1 << power) - 1 == index:
+            return 1 << (power - 1)
+
+        index -= (1 << (power - 1)) - 1
+
+
+def iter_solutions(cells: Sequence[int], size: int, boxRows: Optional[int]=None, boxCols: Optional[int]=None,
+                   constraints: Optional[Sequence[Any]]=None, limit: Optional[int]=None) -> Iterator[List[int]]:
+    """
+    Yields the solutions of a board one at a time. Every next one resumes the same search
+    (KernelSolver.solve continues after the last solution), so only the search's stack is kept between them.
+
+    Arguments:
+        cells {list of ints} -- board row by row, 0 meaning an empty spot
+        size {int} -- length of the board's side
+
+    Keyword Arguments:
+        boxRows {int} -- row count of a single square (default: {None} (see get_box_shape))
+        boxCols {int} -- column count of a single square (default: {None} (see get_box_shape))
+        constraints {list of Constraints} -- extra rules of the board (see sudokuconstraints) (default: {None})
+        limit {int} -- max number of solutions (default: {None} (all of them))
+
+    Raises:
+        BoardError: if the board is incorrect (see KernelSolver)
+
+    Yields:
+        {list of ints} -- a solution (a new list every time)
+    """
+
+    kernel = KernelSolver(cells, size, boxRows, boxCols, constraints)
+
+    solutionCount = 0
+    while limit is None or solutionCount < limit:
+        if kernel.solve() != SOLVED:
+            return
+
+        solutionCount += 1
+        yield list(kernel.cells)
+
+
+def get_box_shape(size: int, boxRows: Optional[int]=None, boxCols: Optional[int]=None) -> Tuple[int, int]:
+    """
+    Returns the shape of a board's squares. If neither boxRows nor boxCols is given, boards with a square size
+    are split into square squares (16x16 into 4x4), other sizes divisible by 3 into squares of 3 rows
+    (12x12 into 3x4) and the rest into the squares closest to a square (10x10 into 2x5).
+
+    Arguments:
+        size {int} -- length of the board's side
+
+    Keyword Arguments:
+        boxRows {int} -- row count of a single square (default: {None})
+        boxCols {int} -- column count of a single square (default: {None})
+
+    Raises:
+        BoardError: Board's size must be divisible into squares.
+
+    Returns:
+        {tuple} -- (boxRows, boxCols)
+    """
+
+    if boxRows is None and boxCols is not None:
+        boxRows = size // boxCols if boxCols > 0 else 0
+    elif boxRows is None:
+        root = math.isqrt(size)
+        if size > 1 and root * root == size:
+            boxRows = root
+        elif size > 3 and size % 3 == 0:
+            boxRows = 3
+        else:
+            boxRows = max([rows for rows in range(2, root + 1) if size % rows == 0], default=0)
+
+    if boxCols is None:
+        boxCols = size // boxRows if boxRows > 0 else 0
+
+    if boxRows < 1 or boxCols < 1 or boxRows * boxCols != size:
+        raise BoardError("Board's size must be divisible into squares.")
+
+    return boxRows, boxCols
+
+
+def board_to_cells(board: Sequence[Sequence[Any]], emptySpotChar: str='0', constMarker: str='$') -> List[int]:
+    """
+    Converts a board to a flat list of ints (row by row, 0 meaning an empty spot).
+
+    Arguments:
+        board {tuple of lists} -- the tuple contains lists(rows), and the lists contain the actual elements
+
+    Keyword Arguments:
+        emptySpotChar {char} -- char meaning the spot is empty (default: {'0'})
+        constMarker {char} -- char marking constant nums, it's ignored (default: {'$'})
+
+    Returns:
+        {list of ints}
+    """
+
+    return [0 if element == emptySpotChar else int(str(element).replace(constMarker, ''))
+            for row in board
+            for element in row]
+
+
+def cells_to_board(cells: Sequence[int], size: int,
+                   board: Optional[Tuple[List[str], ...]]=None) -> Tuple[List[str], ...]:
+    """
+    Converts a flat list of ints to a board of strings.
+
+    Arguments:
+        cells {list of ints} -- board row by row
+        size {int} -- length of the board's side
+
+    Keyword Arguments:
+        board {tuple of lists} -- if given, the nums are written into it (default: {None})
+
+    Returns:
+        {tuple of lists}
+    """
+
+    if board is None:
+        return tuple([[str(num) for num in cells[rowI * size:(rowI + 1) * size]]
+                      for rowI in range(size)])
+
+    for rowI in range(size):
+        board[rowI][:] = [str(num) for num in cells[rowI * size:(rowI + 1) * size]]
+
+    return board
+
+
+def is_compiled() -> bool:
+    """
+    Returns:
+        {bool} -- whether this module was compiled with mypyc (see setup_kernel.py) or it's the pure python one
+    """
+
+    return not __file__.endswith('.py')
@@ -0,0 +1,279 @@
+"""
+Module propagating many boards at once with NumPy (used by solve_boards with propagate=True)
+
+    The boards are kept as an (N, size, size) array of nums and an (N, size, size) array of candidate bitmasks
+    (uint64, num 1 is bit 0, so boards up to 36x36 fit). Every round places the naked singles (spots with a single
+    candidate) and the hidden singles (nums which can only go in one spot of a row, column or square)
+    of all the boards with a few array operations, until no board changes anymore.
+    Most easy and medium boards are solved by that alone, the rest are handed over to the search.
+    NumPy is optional, the rest of the package doesn't need it.
+
+    Main classes:
+        BoardBatch -- many boards of the same size with their candidates
+
+    Main methods:
+        propagate_boards -- places every num which follows from singles in all the given boards
+"""
+
+import numpy
+from sudoku.sudokuexceptions import BoardError
+from sudoku.sudokukernel import get_box_shape
+
+
+class BoardBatch:
+    """
+    Many boards of the same size (and squares) with the candidates of all their spots.
+
+        Arguments:
+            cells {list of lists of ints or array} -- every board row by row, 0 meaning an empty spot
+            size {int} -- length of the boards' side
+
+        Keyword Arguments:
+            boxRows {int} -- row count of a single square (default: {None} (see get_box_shape))
+            boxCols {int} -- column count of a single square (default: {None} (see get_box_shape))
+
+        Raises:
+            BoardError: Board's size doesn't match the cell count.
+            BoardError: Board's size must be divisible into squares.
+            BoardError: Boards up to 36x36 can be propagated.
+            BoardError: Num in board out of range.
+    """
+
+    def __init__(self, cells, size, boxRows=None, boxCols=None):
+        self.size = size
+        self.boxRows, self.boxCols = get_box_shape(size, boxRows, boxCols)
+
+        if size > 36:
+            # the candidates of a spot have to fit in 64 bits (and the box shape in the nums' range)
+            raise BoardError('Boards up to 36x36 can be propagated.')
+
+        try:
+            values = numpy.array(cells, dtype=numpy.int64)
+        except ValueError:
+            raise BoardError("Board's size doesn't match the cell count.")
+
+        if values.size == 0:
+            values = values.reshape(0, size * size)
+        if values.ndim != 2 or values.shape[1] != size * size:
+            raise BoardError("Board's size doesn't match the cell count.")
+        if ((values < 0) | (values > size)).any():
+            raise BoardError('Num in board out of range.')
+
+        self.fullMask = numpy.uint64((1 << size) - 1)
+
+        # (N, size, size) nums, candidates of the empty spots (0 for the taken ones) and the boards found unsolvable
+        self.values = values.reshape(-1, size, size)
+        self.candidates, self.unsolvable = self._get_candidates(self.values)
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def solved(self):
+        """
+        {array of bools} -- the boards without empty spots (which aren't unsolvable)
+        """
+
+        return ~self.unsolvable & (self.values != 0).all(axis=(1, 2))
+
+    def get_cells(self):
+        """
+        Returns:
+            {list of lists of ints} -- every board row by row
+        """
+
+        return self.values.reshape(len(self.values), self.size * self.size).tolist()
+
+    def propagate(self):
+        """
+        Places the naked and hidden singles of all the boards, round after round, until no board changes.
+        Only the boards changed by the last round are looked at in the next one.
+        The boards where a spot runs out of candidates, a num has no spot left in a unit
+        or the same num is forced twice into a unit are marked as unsolvable.
+
+        Returns:
+            {int} -- number of rounds
+        """
+
+        rounds = 0
+        active = numpy.flatnonzero(~self.unsolvable & (self.values == 0).any(axis=(1, 2)))
+        while active.size:
+            values = self.values[active]
+            forced, unsolvable = self._find_singles(values, self.candidates[active])
+            self.unsolvable[active] |= unsolvable
+
+            changed = ~unsolvable & (forced != 0).any(axis=(1, 2))
+            if not changed.any():
+                break
+
+            active = active[changed]
+            values = values[changed]
+            forced = forced[changed]
+
+            # a spot can be forced to two nums at once (which makes the board unsolvable), the lowest one is placed
+            bits = forced & (~forced + numpy.uint64(1))
+            values = numpy.where(bits != 0, _popcount(bits - numpy.uint64(1)) + 1, values)
+
+            candidates, unsolvable = self._get_candidates(values)
+            self.values[active] = values
+            self.candidates[active] = candidates
+            self.unsolvable[active] |= unsolvable
+
+            active = active[~unsolvable & (values == 0).any(axis=(1, 2))]
+            rounds += 1
+
+        return rounds
+
+    def _get_candidates(self, values):
+        """
+        Returns:
+            {tuple} -- candidates of every spot (N, size, size) and which boards have a num twice in a unit (N)
+        """
+
+        size = self.size
+        empty = values == 0
+        bits = numpy.where(empty, numpy.uint64(0),
+                           numpy.left_shift(numpy.uint64(1), numpy.maximum(values - 1, 0).astype(numpy.uint64)))
+
+        rowMasks = numpy.bitwise_or.reduce(bits, axis=2)
+        colMasks = numpy.bitwise_or.reduce(bits, axis=1)
+        boxMasks = numpy.bitwise_or.reduce(self._get_boxes(bits), axis=2)
+
+        # a unit with fewer different nums than taken spots has one of them twice
+        taken = ~empty
+        unsolvable = ((_popcount(rowMasks) != taken.sum(axis=2)).any(axis=1) |
+                      (_popcount(colMasks) != taken.sum(axis=1)).any(axis=1) |
+                      (_popcount(boxMasks) != self._get_boxes(taken).sum(axis=2)).any(axis=1))
+
+        usedMasks = rowMasks[:, :, None] | colMasks[:, None, :] | self._from_boxes(
+            numpy.broadcast_to(boxMasks[:, :, None], (len(values), size, size)))
+        candidates = numpy.where(empty, self.fullMask & ~usedMasks, numpy.uint64(0))
+
+        return candidates, unsolvable
+
+    def _find_singles(self, values, candidates):
+        """
+        Returns:
+            {tuple} -- the nums forced into every spot as bitmasks (N, size, size) and which boards are unsolvable
+            (an empty spot without candidates or a num which can't go anywhere in a unit) (N)
+        """
+
+        empty = values == 0
+        unsolvable = (empty & (candidates == 0)).any(axis=(1, 2))
+
+        # naked singles
+        forced = numpy.where(empty & (candidates & (candidates - numpy.uint64(1)) == 0), candidates,
+                             numpy.uint64(0))
+
+        bits = numpy.where(empty, numpy.uint64(0),
+                           numpy.left_shift(numpy.uint64(1), numpy.maximum(values - 1, 0).astype(numpy.uint64)))
+
+        # hidden singles of the rows, columns and squares (each of them as the rows of an (N, size, size) array)
+        for toUnits, fromUnits in ((_identity, _identity), (_transpose, _transpose),
+                                   (self._get_boxes, self._from_boxes)):
+            hidden, missing = self._find_hidden_singles(toUnits(candidates), toUnits(bits))
+            forced |= fromUnits(hidden)
+            unsolvable |= missing
+
+        return forced, unsolvable
+
+    def _find_hidden_singles(self, units, bits):
+        """
+        Arguments:
+            units {array} -- candidates of the spots of every unit (N, units, spots)
+            bits {array} -- nums placed in the spots of every unit (N, units, spots)
+
+        Returns:
+            {tuple} -- the hidden singles of every spot (N, units, spots) and which boards have a num
+            which can't go anywhere in a unit (N)
+        """
+
+        # candidates seen in at least one and in at least two spots of every unit
+        onceMasks = numpy.zeros(units.shape[:2], dtype=numpy.uint64)
+        twiceMasks = numpy.zeros(units.shape[:2], dtype=numpy.uint64)
+        for spotI in range(units.shape[2]):
+            twiceMasks |= onceMasks & units[:, :, spotI]
+            onceMasks |= units[:, :, spotI]
+
+        missing = ((onceMasks | numpy.bitwise_or.reduce(bits, axis=2)) != self.fullMask).any(axis=1)
+
+        return units & (onceMasks & ~twiceMasks)[:, :, None], missing
+
+    def _get_boxes(self, array):
+        """
+        Returns:
+            {array} -- the (N, size, size) array rearranged so every row is a square (in the order of their spots)
+        """
+
+        boxesDown = self.size // self.boxRows
+        boxesAcross = self.size // self.boxCols
+
+        return (array.reshape(len(array), boxesDown, self.boxRows, boxesAcross, self.boxCols)
+                .transpose(0, 1, 3, 2, 4)
+                .reshape(len(array), self.size, self.size))
+
+    def _from_boxes(self, array):
+        """
+        Returns:
+            {array} -- reverse of _get_boxes
+        """
+
+        boxesDown = self.size // self.boxRows
+        boxesAcross = self.size // self.boxCols
+
+        return (array.reshape(len(array), boxesDown, boxesAcross, self.boxRows, self.boxCols)
+                .transpose(0, 1, 3, 2, 4)
+                .reshape(len(array), self.size, self.size))
+
+
+def propagate_boards(cells, size, boxRows=None, boxCols=None):
+    """
+    Places every num which follows from naked and hidden singles in all the given boards at once.
+
+    Arguments:
+        cells {list of lists of ints} -- every board row by row, 0 meaning an empty spot
+        size {int} -- length of the boards' side
+
+    Keyword Arguments:
+        boxRows {int} -- row count of a single square (default: {None} (see get_box_shape))
+        boxCols {int} -- column count of a single square (default: {None} (see get_box_shape))
+
+    Raises:
+        BoardError: if the boards are incorrect (see BoardBatch)
+
+    Returns:
+        {tuple} -- the boards after propagating (list of lists of ints), which of them are solved
+        and which are unsolvable (lists of bools)
+    """
+
+    batch = BoardBatch(cells, size, boxRows, boxCols)
+    batch.propagate()
+
+    return batch.get_cells(), batch.solved.tolist(), batch.unsolvable.tolist()
+
+
+def _identity(array):
+    return array
+
+
+def _transpose(array):
+    return array.transpose(0, 2, 1)
+
+
+def _popcount(masks):
+    """
+    Returns:
+        {array} -- number of set bits of every mask
+    """
+
+    if hasattr(numpy, 'bitwise_count'):
+        return numpy.bitwise_count(masks).astype(numpy.int64)
+
+    # numpy before 2.0
+    masks = masks.copy()
+    counts = numpy.zeros(masks.shape, dtype=numpy.int64)
+    while masks.any():
+        counts += (masks & numpy.uint64(1)).astype(numpy.int64)
+        masks >>= numpy.uint64(1)
+
+    return counts
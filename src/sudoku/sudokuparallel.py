@@ -0,0 +1,328 @@
+"""
+Module solving a single hard board with many processes (used by SudokuBoard.solve with strategy 'parallel')
+
+    The first few levels of the search tree are expanded into tasks (the nums placed so far),
+    which are put into a queue shared by the processes. A process searches its task in slices
+    of nodes, and whenever some process is idle it gives the untried branches closest to the root
+    of its task back to the queue (so the idle ones steal the biggest pieces of work).
+    The first process to find a solution cancels the others.
+
+    Main methods:
+        solve_parallel -- solves a board given as a flat list of ints
+"""
+
+import multiprocessing
+import os
+import queue
+from sudoku.sudokubudget import NODES
+from sudoku.sudokukernel import KernelSolver, SOLVED, UNSOLVABLE, PAUSED
+
+
+def solve_parallel(cells, size, boxRows=None, boxCols=None, workers=None, tasksPerWorker=8, sliceNodes=2048,
+                   budget=None, constraints=None):
+    """
+    Solves a board searching many parts of the search tree at once.
+
+    Arguments:
+        cells {list of ints} -- board row by row, 0 meaning an empty spot
+        size {int} -- length of the board's side
+
+    Keyword Arguments:
+        boxRows {int} -- row count of a single square (default: {None} (see get_box_shape))
+        boxCols {int} -- column count of a single square (default: {None} (see get_box_shape))
+        workers {int} -- number of processes (default: {None} (cpu count))
+        tasksPerWorker {int} -- number of tasks the search tree is split into at first, per process (default: {8})
+        sliceNodes {int} -- nodes searched between checking for cancellation and idle processes (default: {2048})
+        budget {Budget} -- limits of the search, the time and the token are checked by this process
+        a few times a second, maxNodes counts the nodes of the splitting and of all processes and is never overshot
+        (every slice takes its nodes from what's left of it) (default: {None})
+        constraints {list of Constraints} -- extra rules of the board (see sudokuconstraints) (default: {None})
+
+    Raises:
+        BoardError: if the board is incorrect (see KernelSolver)
+
+    Returns:
+        {tuple} -- status (SOLVED, UNSOLVABLE or PAUSED if the budget was exceeded), the solution
+        (flat list of ints or None) and the stats (nodes, backtracks, workers, tasks (made at first),
+        donatedTasks (given back to the queue) and exceeded (the reason the budget was exceeded, if it was))
+    """
+
+    workers = workers or os.cpu_count() or 1
+
+    maxNodes = None if budget is None else budget.maxNodes
+    if maxNodes is not None:
+        # smaller slices, so the processes don't overshoot the budget by much
+        sliceNodes = max(16, min(sliceNodes, maxNodes // (workers * 4)))
+
+    # checks the board, so errors are raised here and not in the processes
+    rootKernel = KernelSolver(cells, size, boxRows, boxCols, constraints)
+    boxRows = rootKernel.boxRows
+    boxCols = rootKernel.boxCols
+
+    stats = {'nodes': 0, 'backtracks': 0, 'workers': workers, 'tasks': 0, 'donatedTasks': 0}
+
+    # a timeout or a token running out before the search starts stops it (like in the other strategies),
+    # even if splitting the search would solve the board
+    reason = None if budget is None else budget.get_exceeded_reason(0)
+    if reason:
+        stats['exceeded'] = reason
+        return PAUSED, None, stats
+
+    tasks, solution, splitNodes = _split_search(rootKernel, workers * tasksPerWorker, maxNodes)
+    stats['nodes'] = splitNodes
+    stats['tasks'] = len(tasks)
+
+    if solution is not None:
+        return SOLVED, solution, stats
+    if not tasks:
+        return UNSOLVABLE, None, stats
+
+    taskQueue = multiprocessing.Queue()
+    resultQueue = multiprocessing.Queue()
+    cancelEvent = multiprocessing.Event()
+
+    # tasks which haven't been finished (the processes stop when there are none)
+    pendingTasks = multiprocessing.Value('i', len(tasks))
+    idleWorkers = multiprocessing.Value('i', 0)
+    # the nums placed while splitting count towards maxNodes too
+    searchedNodes = multiprocessing.Value('q', splitNodes)
+
+    for task in tasks:
+        taskQueue.put(task)
+
+    processes = [multiprocessing.Process(target=_search_tasks,
+                                         args=(cells, size, boxRows, boxCols, constraints, taskQueue, resultQueue,
+                                               cancelEvent, pendingTasks, idleWorkers, searchedNodes, sliceNodes,
+                                               maxNodes),
+                                         daemon=True)
+                 for _ in range(workers)]
+    for process in processes:
+        process.start()
+
+    try:
+        # every process sends its stats when it stops, the one finding the solution sends it before that
+        reportedWorkers = 0
+        while reportedWorkers < workers:
+            if budget is not None and solution is None and 'exceeded' not in stats:
+                reason = budget.get_exceeded_reason(searchedNodes.value)
+
+                # the processes stop themselves when the nodes run out (the slices taken may still find a solution)
+                if reason and reason != NODES:
+                    stats['exceeded'] = reason
+                    cancelEvent.set()
+
+            try:
+                message = resultQueue.get(timeout=0.1)
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    break
+                continue
+
+            if message[0] == SOLVED:
+                if solution is None:
+                    solution = message[1]
+                cancelEvent.set()
+            else:
+                _, nodes, backtracks, donatedTasks, outOfNodes = message
+                stats['nodes'] += nodes
+                stats['backtracks'] += backtracks
+                stats['donatedTasks'] += donatedTasks
+                reportedWorkers += 1
+
+                if outOfNodes and 'exceeded' not in stats:
+                    stats['exceeded'] = NODES
+    finally:
+        cancelEvent.set()
+        for process in processes:
+            process.join(1)
+            if process.is_alive():
+                process.terminate()
+
+        taskQueue.cancel_join_thread()
+
+    if maxNodes is not None and searchedNodes.value > maxNodes:
+        # a solution found past the budget doesn't count, the same as for the other strategies
+        stats['exceeded'] = NODES
+        solution = None
+
+    if solution is None:
+        return PAUSED if 'exceeded' in stats else UNSOLVABLE, None, stats
+
+    stats.pop('exceeded', None)
+
+    return SOLVED, solution, stats
+
+
+def _split_search(kernel, taskCount, maxNodes=None):
+    """
+    Expands the search tree level by level (always at the spot with the fewest candidates)
+    until there are at least taskCount branches. The nums of every task are placed on the one kernel
+    and taken off it again, so it's left as it was.
+
+    Arguments:
+        kernel {KernelSolver} -- solver of the board
+        taskCount {int} -- number of branches wanted
+
+    Keyword Arguments:
+        maxNodes {int} -- the next level isn't expanded if it would place more nums than that in total
+        (default: {None} (no limit))
+
+    Returns:
+        {tuple} -- list of tasks (lists of (spot, num) placed on the board), a solution
+        (if it was found while splitting, else None) and the nodes (nums placed while splitting)
+    """
+
+    if kernel.status == UNSOLVABLE:
+        return [], None, 0
+
+    nodes = 0
+    tasks = [[]]
+    while len(tasks) < taskCount:
+        newTasks = []
+        for task in tasks:
+            for spot, num in task:
+                kernel.cells[spot] = num
+                kernel._set_bit(spot, 1 << (num - 1))
+
+            spot, candidates = kernel._pick_spot()
+            solution = list(kernel.cells) if spot < 0 else None
+
+            for taskSpot, num in task:
+                kernel._clear_bit(taskSpot, 1 << (num - 1))
+                kernel.cells[taskSpot] = 0
+
+            if solution is not None:
+                return [], solution, nodes
+
+            while candidates:
+                bit = candidates & -candidates
+                candidates ^= bit
+                newTasks.append(task + [(spot, bit.bit_length())])
+
+        if maxNodes is not None and nodes + len(newTasks) > maxNodes:
+            break
+
+        nodes += len(newTasks)
+        tasks = newTasks
+        if not tasks:
+            break
+
+    return tasks, None, nodes
+
+
+def _apply_task(cells, task):
+    cells = list(cells)
+    for spot, num in task:
+        cells[spot] = num
+
+    return cells
+
+
+def _search_tasks(cells, size, boxRows, boxCols, constraints, taskQueue, resultQueue, cancelEvent,
+                  pendingTasks, idleWorkers, searchedNodes, sliceNodes, maxNodes):
+    """
+    Runs in a worker process, searching tasks from the queue until there are none left, the search is cancelled
+    or the nodes of maxNodes (shared by all processes through searchedNodes) run out.
+    """
+
+    nodes = backtracks = donatedTasks = 0
+    idle = False
+    outOfNodes = False
+
+    while not cancelEvent.is_set():
+        try:
+            task = taskQueue.get(timeout=0.01)
+        except queue.Empty:
+            if pendingTasks.value == 0:
+                break
+
+            if not idle:
+                idle = True
+                with idleWorkers.get_lock():
+                    idleWorkers.value += 1
+            continue
+
+        if idle:
+            idle = False
+            with idleWorkers.get_lock():
+                idleWorkers.value -= 1
+
+        # no restarts, the branches left on the stack may be given to other processes
+        kernel = KernelSolver(_apply_task(cells, task), size, boxRows, boxCols, constraints, restartBase=None)
+        while not cancelEvent.is_set():
+            # the nodes of the slice are taken before searching them, so the processes together can't overshoot
+            with searchedNodes.get_lock():
+                sliceLimit = sliceNodes
+                if maxNodes is not None:
+                    sliceLimit = min(sliceNodes, maxNodes - searchedNodes.value)
+                searchedNodes.value += max(sliceLimit, 0)
+
+            if sliceLimit <= 0:
+                outOfNodes = True
+                cancelEvent.set()
+                break
+
+            sliceStartNodes = kernel.nodes
+            status = kernel.solve(kernel.nodes + sliceLimit)
+
+            # the nodes the slice didn't use are given back
+            with searchedNodes.get_lock():
+                searchedNodes.value -= sliceLimit - (kernel.nodes - sliceStartNodes)
+
+            if status == SOLVED:
+                resultQueue.put((SOLVED, kernel.cells))
+                cancelEvent.set()
+                break
+            if status == UNSOLVABLE:
+                break
+
+            if idleWorkers.value > 0:
+                donatedTasks += _donate_work(kernel, task, taskQueue, pendingTasks)
+
+        nodes += kernel.nodes
+        backtracks += kernel.backtracks
+
+        with pendingTasks.get_lock():
+            pendingTasks.value -= 1
+
+    if idle:
+        with idleWorkers.get_lock():
+            idleWorkers.value -= 1
+
+    resultQueue.put(('stats', nodes, backtracks, donatedTasks, outOfNodes))
+
+
+def _donate_work(kernel, task, taskQueue, pendingTasks):
+    """
+    Moves the untried candidates of the shallowest spot of the kernel's search into new tasks.
+
+    Returns:
+        {int} -- number of new tasks
+    """
+
+    for level, (spot, untried) in enumerate(kernel.stack):
+        if not untried:
+            continue
+
+        # the nums placed above the spot stay the same for every new task
+        prefix = task + [(placedSpot, kernel.cells[placedSpot]) for placedSpot, _ in kernel.stack[:level]]
+
+        newTasks = []
+        while untried:
+            bit = untried & -untried
+            untried ^= bit
+            newTasks.append(prefix + [(spot, bit.bit_length())])
+
+        # this kernel won't try them anymore
+        kernel.stack[level] = (spot, 0)
+
+        # counted before they're in the queue, so the pending count can't drop to 0 too early
+        with pendingTasks.get_lock():
+            pendingTasks.value += len(newTasks)
+
+        for newTask in newTasks:
+            taskQueue.put(newTask)
+
+        return len(newTasks)
+
+    return 0
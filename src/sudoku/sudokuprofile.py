@@ -0,0 +1,146 @@
+"""
+Module profiling the solving without changing the solvers (used by the solve and bench commands with --profile)
+
+    A thread samples the stack of the solving thread every few milliseconds. The stacks are kept
+    below a scope (e.g. the strategy and the board), so one file holds the profiles of many solves,
+    and saved in the collapsed format of flamegraph tools (one 'scope;frame;frame count' line per stack,
+    e.g. flamegraph.pl profile.txt > profile.svg, speedscope or inferno read it too).
+    Only the thread calling run is sampled, not the processes of the 'parallel' strategy or the external SAT solvers.
+
+    Main classes:
+        SamplingProfiler -- samples the stacks of the calls it runs
+"""
+
+import collections
+import os
+import sys
+import threading
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of the calls it runs (the samples of every call are added up).
+
+        Keyword Arguments:
+            interval {float} -- seconds between the samples (default: {0.001})
+    """
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+
+        # stack (scope and frames from the outermost one) -> number of samples
+        self.samples = collections.Counter()
+
+        # code object -> its frame name
+        self._frameNames = {}
+
+    def run(self, scope, function, *args, **kwargs):
+        """
+        Calls function(*args, **kwargs) sampling its stack.
+
+        Arguments:
+            scope {tuple of str} -- frames put above the sampled stacks, e.g. ('bitmask', 'board 1')
+            function {callable}
+
+        Returns:
+            the result of the function
+        """
+
+        entryFrame = sys._getframe()
+        stopEvent = threading.Event()
+
+        # ';' separates the frames of the collapsed format
+        scope = tuple([str(frameName).replace(';', ',') for frameName in scope])
+
+        sampler = threading.Thread(target=self._sample, args=(threading.get_ident(), entryFrame, scope, stopEvent),
+                                   daemon=True)
+
+        # the sampler can only take a sample when the solving thread lets go of the GIL
+        switchInterval = sys.getswitchinterval()
+        sys.setswitchinterval(min(switchInterval, self.interval))
+        sampler.start()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stopEvent.set()
+            sampler.join()
+            sys.setswitchinterval(switchInterval)
+
+    def get_collapsed(self):
+        """
+        Returns:
+            {str} -- the samples in the collapsed format (a 'frame;frame;frame count' line per stack)
+        """
+
+        return ''.join(['{} {}\n'.format(';'.join(stack), count) for stack, count in sorted(self.samples.items())])
+
+    def save(self, path):
+        """
+        Writes the samples to a file in the collapsed format (see get_collapsed).
+        """
+
+        with open(path, 'w') as profileFile:
+            profileFile.write(self.get_collapsed())
+
+    def get_top_functions(self, count=10, scopeDepth=0):
+        """
+        Arguments:
+            count {int} -- number of functions
+            scopeDepth {int} -- number of scope frames the stacks start with (they aren't functions)
+
+        Returns:
+            {list of tuples} -- (frame name, samples in the function itself, samples in it or the functions it calls)
+            of the functions with the most samples of their own, the most first
+        """
+
+        selfSamples = collections.Counter()
+        totalSamples = collections.Counter()
+        for stack, samples in self.samples.items():
+            frames = stack[scopeDepth:]
+            if not frames:
+                continue
+
+            selfSamples[frames[-1]] += samples
+            for frameName in set(frames):
+                totalSamples[frameName] += samples
+
+        return [(frameName, samples, totalSamples[frameName]) for frameName, samples in selfSamples.most_common(count)]
+
+    def _sample(self, threadId, entryFrame, scope, stopEvent):
+        """
+        Runs in the sampling thread until stopEvent is set.
+        """
+
+        while not stopEvent.wait(self.interval):
+            frame = sys._current_frames().get(threadId)
+
+            # the frames from the sampled one up to the call of run
+            frames = []
+            while frame is not None and frame is not entryFrame:
+                frames.append(self._get_frame_name(frame.f_code))
+                frame = frame.f_back
+
+            if stopEvent.is_set():
+                # the function may have returned before the sample was taken
+                break
+
+            if frame is None or not frames:
+                # not in the function yet
+                continue
+
+            frames.reverse()
+            self.samples[scope + tuple(frames)] += 1
+
+    def _get_frame_name(self, code):
+        """
+        Returns:
+            {str} -- e.g. '_get_square_num (sudokuboard.py:1121)' (the line where the function starts,
+            so all the samples of a function are counted together)
+        """
+
+        frameName = self._frameNames.get(code)
+        if frameName is None:
+            frameName = '{} ({}:{})'.format(code.co_name, os.path.basename(code.co_filename), code.co_firstlineno)
+            self._frameNames[code] = frameName
+
+        return frameName
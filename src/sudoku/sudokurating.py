@@ -0,0 +1,379 @@
+"""
+Module rating how hard a board is for a human
+
+    The board is solved with a ladder of techniques people use, always with the easiest one that
+    makes progress. The rating is the score of the hardest technique that was needed
+    (similar to the Sudoku Explainer scale). Boards which can't be finished without guessing
+    get the score of guessing.
+
+    Main methods:
+        rate -- rates a board given as a flat list of ints
+        rate_board -- rates a board given as a tuple of lists (like SudokuBoard.board)
+"""
+
+import itertools
+from sudoku.sudokucandidates import CandidateGrid
+from sudoku.sudokuexceptions import BoardError
+from sudoku.sudokukernel import KernelSolver, board_to_cells, get_box_shape, SOLVED
+
+# (name, score) of the techniques, in the order they're tried
+techniques = (('hidden single in square', 1.2),
+              ('hidden single in line', 1.5),
+              ('naked single', 2.3),
+              ('pointing', 2.6),
+              ('box-line reduction', 2.8),
+              ('naked pair', 3.0),
+              ('x-wing', 3.2),
+              ('hidden pair', 3.4),
+              ('naked triple', 3.6),
+              ('swordfish', 3.8),
+              ('hidden triple', 4.0),
+              ('xy-wing', 4.2),
+              ('guessing', 10.0))
+
+# (label, highest score with that label)
+labels = (('easy', 2.3),
+          ('medium', 3.4),
+          ('hard', 4.2),
+          ('expert', 10.0))
+
+
+def rate(cells, size, boxRows=None, boxCols=None):
+    """
+    Rates how hard a board is for a human.
+
+    Arguments:
+        cells {list of ints} -- board row by row, 0 meaning an empty spot
+        size {int} -- length of the board's side
+
+    Keyword Arguments:
+        boxRows {int} -- row count of a single square (default: {None} (see get_box_shape))
+        boxCols {int} -- column count of a single square (default: {None} (see get_box_shape))
+
+    Raises:
+        BoardError: Board's size doesn't match the cell count.
+        BoardError: Board's size must be divisible into squares.
+
+    Returns:
+        {dict} -- score (of the hardest technique needed), label, hardest (name of the technique),
+        techniques (how many times every technique was used) and status ('solved' or 'unsolvable')
+    """
+
+    if len(cells) != size * size:
+        raise BoardError("Board's size doesn't match the cell count.")
+
+    boxRows, boxCols = get_box_shape(size, boxRows, boxCols)
+
+    grid = CandidateGrid(cells, size, boxRows, boxCols)
+
+    usedTechniques = {}
+    hardest = None
+    hardestScore = 0
+    status = 'solved'
+
+    while grid.emptyCount and not grid.contradiction:
+        for (name, score), technique in zip(techniques, _ladder):
+            if technique(grid):
+                break
+        else:
+            name, score = techniques[-1]
+
+            # the rest can only be guessed, so it's just checked whether it can be solved at all
+            kernel = KernelSolver(grid.cells, size, boxRows, boxCols)
+            if kernel.solve() != SOLVED:
+                status = 'unsolvable'
+
+        usedTechniques[name] = usedTechniques.get(name, 0) + 1
+        if score > hardestScore:
+            hardest = name
+            hardestScore = score
+
+        if name == techniques[-1][0]:
+            break
+
+    if grid.contradiction:
+        status = 'unsolvable'
+
+    return {'score': hardestScore,
+            'label': get_label(hardestScore) if status == 'solved' else None,
+            'hardest': hardest,
+            'techniques': usedTechniques,
+            'status': status}
+
+
+def rate_board(board, emptySpotChar='0', constMarker='$'):
+    """
+    Rates how hard a board is for a human (see rate).
+
+    Arguments:
+        board {tuple of lists} -- the tuple contains lists(rows), and the lists contain the actual elements
+
+    Keyword Arguments:
+        emptySpotChar {char} -- char meaning the spot is empty (default: {'0'})
+        constMarker {char} -- char marking constant nums, it's ignored (default: {'$'})
+
+    Returns:
+        {dict} -- see rate
+    """
+
+    return rate(board_to_cells(board, emptySpotChar, constMarker), len(board))
+
+
+def get_label(score):
+    """
+    Returns:
+        {str} -- label of the score ('easy', 'medium', 'hard' or 'expert')
+    """
+
+    for label, maxScore in labels:
+        if score <= maxScore:
+            return label
+
+    return labels[-1][0]
+
+
+def _count_bits(mask):
+    return bin(mask).count('1')
+
+
+def _bits(mask):
+    while mask:
+        bit = mask & -mask
+        yield bit
+        mask ^= bit
+
+
+def _find_hidden_single(grid, units):
+    cells = grid.cells
+    candidates = grid.candidateMasks
+    for unit in units:
+        # nums which are candidates of exactly one spot in the unit
+        once = more = placed = 0
+        for spot in unit:
+            more |= once & candidates[spot]
+            once |= candidates[spot]
+            if cells[spot]:
+                placed |= 1 << (cells[spot] - 1)
+
+        if grid.fullMask & ~(once | placed):
+            # a num can't be placed anywhere in the unit
+            grid.contradiction = True
+            return True
+
+        singles = once & ~more
+        if singles:
+            bit = singles & -singles
+            for spot in unit:
+                if candidates[spot] & bit:
+                    grid.place(spot, bit.bit_length())
+                    return True
+
+    return False
+
+
+def _find_hidden_single_in_square(grid):
+    return _find_hidden_single(grid, grid.boxes)
+
+
+def _find_hidden_single_in_line(grid):
+    return _find_hidden_single(grid, grid.lines)
+
+
+def _find_naked_single(grid):
+    candidates = grid.candidateMasks
+    for spot, spotCandidates in enumerate(candidates):
+        if spotCandidates and not spotCandidates & (spotCandidates - 1):
+            grid.place(spot, spotCandidates.bit_length())
+            return True
+
+    return False
+
+
+def _find_pointing(grid):
+    """
+    A num which can only be in one line of a square can't be anywhere else in that line.
+    """
+
+    candidates = grid.candidateMasks
+    for box in grid.boxes:
+        boxCandidates = 0
+        for spot in box:
+            boxCandidates |= candidates[spot]
+
+        for bit in _bits(boxCandidates):
+            spots = [spot for spot in box if candidates[spot] & bit]
+
+            for lineOf, lines in ((grid.rowOf, grid.rows), (grid.colOf, grid.cols)):
+                lineI = lineOf[spots[0]]
+                if all(lineOf[spot] == lineI for spot in spots):
+                    if grid.eliminate([spot for spot in lines[lineI] if spot not in box], bit):
+                        return True
+
+    return False
+
+
+def _find_box_line_reduction(grid):
+    """
+    A num which can only be in one square of a line can't be anywhere else in that square.
+    """
+
+    candidates = grid.candidateMasks
+    boxOf = grid.boxOf
+    for line in grid.lines:
+        lineCandidates = 0
+        for spot in line:
+            lineCandidates |= candidates[spot]
+
+        for bit in _bits(lineCandidates):
+            spots = [spot for spot in line if candidates[spot] & bit]
+
+            boxI = boxOf[spots[0]]
+            if all(boxOf[spot] == boxI for spot in spots):
+                if grid.eliminate([spot for spot in grid.boxes[boxI] if spot not in line], bit):
+                    return True
+
+    return False
+
+
+def _find_naked_subset(grid, subsetSize):
+    """
+    subsetSize spots of a unit which together only have subsetSize candidates take those nums,
+    so they can't be anywhere else in the unit.
+    """
+
+    candidates = grid.candidateMasks
+    for unit in grid.boxes + grid.lines:
+        emptySpots = [spot for spot in unit if candidates[spot]]
+        if len(emptySpots) <= subsetSize:
+            continue
+
+        smallSpots = [spot for spot in emptySpots if _count_bits(candidates[spot]) <= subsetSize]
+        for subset in itertools.combinations(smallSpots, subsetSize):
+            mask = 0
+            for spot in subset:
+                mask |= candidates[spot]
+
+            if _count_bits(mask) == subsetSize:
+                if grid.eliminate([spot for spot in emptySpots if spot not in subset], mask):
+                    return True
+
+    return False
+
+
+def _find_hidden_subset(grid, subsetSize):
+    """
+    subsetSize nums which together can only be in subsetSize spots of a unit take those spots,
+    so other nums can't be in them.
+    """
+
+    candidates = grid.candidateMasks
+    for unit in grid.boxes + grid.lines:
+        # spots (as bits of their index in the unit) every num can be in
+        numSpots = {}
+        for spotI, spot in enumerate(unit):
+            for bit in _bits(candidates[spot]):
+                numSpots[bit] = numSpots.get(bit, 0) | (1 << spotI)
+
+        if len(numSpots) <= subsetSize:
+            continue
+
+        smallNums = [bit for bit, spots in numSpots.items() if _count_bits(spots) <= subsetSize]
+        for subset in itertools.combinations(smallNums, subsetSize):
+            spotsMask = 0
+            numsMask = 0
+            for bit in subset:
+                spotsMask |= numSpots[bit]
+                numsMask |= bit
+
+            if _count_bits(spotsMask) == subsetSize:
+                subsetSpots = [unit[spotI] for spotI in range(grid.size) if spotsMask & (1 << spotI)]
+                if grid.eliminate(subsetSpots, grid.fullMask & ~numsMask):
+                    return True
+
+    return False
+
+
+def _find_fish(grid, fishSize):
+    """
+    If a num can only be in the same fishSize columns of fishSize rows, it can't be anywhere else in those columns
+    (x-wing for 2, swordfish for 3), and the same with rows and columns swapped.
+    """
+
+    candidates = grid.candidateMasks
+    size = grid.size
+    for baseLines, coverLines in ((grid.rows, grid.cols), (grid.cols, grid.rows)):
+        for num in range(size):
+            bit = 1 << num
+
+            # columns (as bits) every row can have the num in
+            lineSpots = []
+            for lineI, line in enumerate(baseLines):
+                spots = 0
+                for spotI, spot in enumerate(line):
+                    if candidates[spot] & bit:
+                        spots |= 1 << spotI
+
+                if 2 <= _count_bits(spots) <= fishSize:
+                    lineSpots.append((lineI, spots))
+
+            for subset in itertools.combinations(lineSpots, fishSize):
+                coverMask = 0
+                for _, spots in subset:
+                    coverMask |= spots
+
+                if _count_bits(coverMask) != fishSize:
+                    continue
+
+                subsetLines = {lineI for lineI, _ in subset}
+                eliminatedSpots = [spot
+                                   for coverI in range(size) if coverMask & (1 << coverI)
+                                   for baseI, spot in enumerate(coverLines[coverI]) if baseI not in subsetLines]
+                if grid.eliminate(eliminatedSpots, bit):
+                    return True
+
+    return False
+
+
+def _find_xy_wing(grid):
+    """
+    A spot with candidates xy seeing spots with xz and yz: one of those two has to be z,
+    so z can't be in any spot seeing both of them.
+    """
+
+    candidates = grid.candidateMasks
+    peers = grid.peers
+    pairSpots = [spot for spot, spotCandidates in enumerate(candidates) if _count_bits(spotCandidates) == 2]
+
+    for pivot in pairSpots:
+        pivotCandidates = candidates[pivot]
+        wings = [spot for spot in pairSpots
+                 if spot in peers[pivot] and _count_bits(candidates[spot] & pivotCandidates) == 1]
+
+        for firstWing, secondWing in itertools.combinations(wings, 2):
+            firstCandidates = candidates[firstWing]
+            secondCandidates = candidates[secondWing]
+
+            # the wings have to share z (not in the pivot) and differ in x and y
+            zBit = firstCandidates & secondCandidates & ~pivotCandidates
+            if not zBit or (firstCandidates & pivotCandidates) == (secondCandidates & pivotCandidates):
+                continue
+
+            if grid.eliminate(peers[firstWing] & peers[secondWing], zBit):
+                return True
+
+    return False
+
+
+# the techniques in the same order as in techniques (without guessing)
+_ladder = (_find_hidden_single_in_square,
+           _find_hidden_single_in_line,
+           _find_naked_single,
+           _find_pointing,
+           _find_box_line_reduction,
+           lambda grid: _find_naked_subset(grid, 2),
+           lambda grid: _find_fish(grid, 2),
+           lambda grid: _find_hidden_subset(grid, 2),
+           lambda grid: _find_naked_subset(grid, 3),
+           lambda grid: _find_fish(grid, 3),
+           lambda grid: _find_hidden_subset(grid, 3),
+           _find_xy_wing)
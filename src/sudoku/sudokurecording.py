@@ -0,0 +1,333 @@
+"""
+Module containing a compact binary recording of solving a board
+
+    The format:
+        4 bytes -- b'SDKR'
+        1 byte -- version of the format
+        1 byte -- size of the board (n)
+        n * n bytes -- the initial board (row by row, 0 meaning an empty spot)
+        3 bytes per step -- index of the changed spot (2 bytes, little endian) and the num placed in it (0 if it was reset)
+
+    Main methods:
+        record_solving -- solves a board at full speed, writing every step to a file
+        SolveRecording -- loads a recording and plays it back (forwards, backwards or from any step)
+"""
+
+import struct
+from array import array
+from sudoku.sudokuexceptions import BoardError, ArgumentError
+
+# recording header
+_magic = b'SDKR'
+_version = 1
+_header = struct.Struct('<4sBB')
+
+# a single step: index of the spot and the num placed in it
+_step = struct.Struct('<HB')
+
+# steps are written to the file in chunks of this many bytes
+_writeChunkSize = 1 << 16
+
+
+def record_solving(board, file, copyBoard=True):
+    """
+    Solves the board and writes every step of it to the given file.
+
+    Arguments:
+        board {SudokuBoard} -- board to solve
+        file {str or binary file} -- path to the recording or a file opened for writing in binary mode
+
+    Keyword Arguments:
+        copyBoard {bool} -- should the method work on a copied board (True)
+        or just work with the original (False) (default: {True})
+
+    Returns:
+        {int} -- number of recorded steps
+    """
+
+    if isinstance(file, str):
+        with open(file, 'wb') as recordingFile:
+            return record_solving(board, recordingFile, copyBoard)
+
+    size = len(board)
+    file.write(_header.pack(_magic, _version, size))
+    file.write(bytes(_encode_board(board.board, board.emptySpotChar)))
+
+    emptySpotChar = board.emptySpotChar
+    pack = _step.pack
+
+    chunk = bytearray()
+    stepCount = 0
+    for rowI, elementI, num, _ in board.gen_solving_deltas(copyBoard):
+        chunk += pack(rowI * size + elementI, 0 if num == emptySpotChar else int(num))
+        stepCount += 1
+
+        if len(chunk) >= _writeChunkSize:
+            file.write(chunk)
+            chunk = bytearray()
+
+    file.write(chunk)
+
+    return stepCount
+
+
+class SolveRecording:
+    """
+    Recording of solving a board, which can be played back at any speed, in both directions.
+
+        Arguments:
+            initialBoard {bytes} -- the board before the first step (row by row, 0 meaning an empty spot)
+            spots {array} -- index of the spot changed in every step
+            nums {array} -- num placed in every step (0 if the spot was reset)
+
+        Keyword Arguments:
+            emptySpotChar {char} -- char used for empty spots in returned boards (default: {'0'})
+
+        Raises:
+            BoardError: Recorded board's size is incorrect.
+            ArgumentError: spots and nums must be the same length.
+    """
+
+    # a copy of the board is kept every this many steps, so seeking far doesn't replay everything
+    keyframeInterval = 4096
+
+    def __init__(self, initialBoard, spots, nums, emptySpotChar='0'):
+        size = int(len(initialBoard) ** 0.5)
+        if size * size != len(initialBoard) or size == 0:
+            raise BoardError("Recorded board's size is incorrect.")
+        if len(spots) != len(nums):
+            raise ArgumentError('spots and nums must be the same length.')
+
+        self.size = size
+        self.emptySpotChar = emptySpotChar
+
+        self.initialBoard = bytes(initialBoard)
+        self.spots = spots
+        self.nums = nums
+
+        # nums replaced in every step, used to go backwards
+        self._previousNums = array('B', bytes(len(nums)))
+
+        self._keyframes = []
+        current = bytearray(self.initialBoard)
+        for stepI in range(len(spots)):
+            if stepI % self.keyframeInterval == 0:
+                self._keyframes.append(bytes(current))
+
+            self._previousNums[stepI] = current[spots[stepI]]
+            current[spots[stepI]] = nums[stepI]
+
+        self.finalBoard = bytes(current)
+
+        self.position = 0
+        self._current = bytearray(self.initialBoard)
+
+    def __len__(self):
+        return len(self.spots)
+
+    @classmethod
+    def load(cls, file, emptySpotChar='0'):
+        """
+        Loads a recording written by record_solving.
+
+        Arguments:
+            file {str or binary file} -- path to the recording or a file opened for reading in binary mode
+
+        Keyword Arguments:
+            emptySpotChar {char} -- char used for empty spots in returned boards (default: {'0'})
+
+        Returns:
+            {SolveRecording}
+        """
+
+        if isinstance(file, str):
+            with open(file, 'rb') as recordingFile:
+                return cls.from_bytes(recordingFile.read(), emptySpotChar)
+
+        return cls.from_bytes(file.read(), emptySpotChar)
+
+    @classmethod
+    def from_bytes(cls, data, emptySpotChar='0'):
+        """
+        Reads a recording from bytes (in the format written by record_solving).
+
+        Arguments:
+            data {bytes}
+
+        Keyword Arguments:
+            emptySpotChar {char} -- char used for empty spots in returned boards (default: {'0'})
+
+        Raises:
+            ArgumentError: Not a recording of solving a board.
+            ArgumentError: Unsupported recording version.
+            ArgumentError: Recording is truncated.
+
+        Returns:
+            {SolveRecording}
+        """
+
+        if len(data) < _header.size:
+            raise ArgumentError('Not a recording of solving a board.')
+
+        magic, version, size = _header.unpack_from(data)
+        if magic != _magic:
+            raise ArgumentError('Not a recording of solving a board.')
+        if version != _version:
+            raise ArgumentError('Unsupported recording version ({}).'.format(version))
+
+        boardEnd = _header.size + size * size
+        if len(data) < boardEnd or (len(data) - boardEnd) % _step.size != 0:
+            raise ArgumentError('Recording is truncated.')
+
+        spots = array('H')
+        nums = array('B')
+        for spot, num in _step.iter_unpack(memoryview(data)[boardEnd:]):
+            spots.append(spot)
+            nums.append(num)
+
+        return cls(data[_header.size:boardEnd], spots, nums, emptySpotChar)
+
+    def to_bytes(self):
+        """
+        Returns:
+            {bytes} -- the recording in the format written by record_solving
+        """
+
+        data = bytearray(_header.pack(_magic, _version, self.size))
+        data += self.initialBoard
+        for spot, num in zip(self.spots, self.nums):
+            data += _step.pack(spot, num)
+
+        return bytes(data)
+
+    def save(self, file):
+        """
+        Writes the recording in the format written by record_solving.
+
+        Arguments:
+            file {str or binary file} -- path to the recording or a file opened for writing in binary mode
+        """
+
+        if isinstance(file, str):
+            with open(file, 'wb') as recordingFile:
+                recordingFile.write(self.to_bytes())
+        else:
+            file.write(self.to_bytes())
+
+    def seek(self, position):
+        """
+        Moves the playback to the given step (0 is the initial board, len(recording) is the last step).
+        The position is clamped to the recording.
+
+        Arguments:
+            position {int}
+
+        Returns:
+            {dict} -- {(row index, element index): num} every spot that has changed (0 meaning an empty spot)
+        """
+
+        position = max(0, min(position, len(self)))
+
+        if abs(position - self.position) > self.keyframeInterval:
+            return self._jump(position)
+
+        changedSpots = set()
+        current = self._current
+        while self.position < position:
+            spot = self.spots[self.position]
+            current[spot] = self.nums[self.position]
+            changedSpots.add(spot)
+            self.position += 1
+
+        while self.position > position:
+            self.position -= 1
+            spot = self.spots[self.position]
+            current[spot] = self._previousNums[self.position]
+            changedSpots.add(spot)
+
+        return {divmod(spot, self.size): current[spot]
+                for spot in changedSpots}
+
+    def step(self, count=1):
+        """
+        Moves the playback by count steps (backwards if count is negative).
+
+        Keyword Arguments:
+            count {int} (default: {1})
+
+        Returns:
+            {dict} -- {(row index, element index): num} every spot that has changed (0 meaning an empty spot)
+        """
+
+        return self.seek(self.position + count)
+
+    def is_finished(self):
+        return self.position == len(self)
+
+    def board(self):
+        """
+        Returns:
+            {tuple of lists} -- board at the current step
+        """
+
+        return self._decode_board(self._current)
+
+    def initial_board(self):
+        """
+        Returns:
+            {tuple of lists} -- board before the first step
+        """
+
+        return self._decode_board(self.initialBoard)
+
+    def final_board(self):
+        """
+        Returns:
+            {tuple of lists} -- board after the last step
+        """
+
+        return self._decode_board(self.finalBoard)
+
+    def _jump(self, position):
+        """
+        Moves the playback to the given step starting from the nearest keyframe.
+
+        Arguments:
+            position {int}
+
+        Returns:
+            {dict} -- {(row index, element index): num} every spot that has changed (0 meaning an empty spot)
+        """
+
+        previous = bytes(self._current)
+
+        keyframeI = min(position // self.keyframeInterval, len(self._keyframes) - 1)
+        self._current = bytearray(self._keyframes[keyframeI])
+        self.position = keyframeI * self.keyframeInterval
+        self.seek(position)
+
+        return {divmod(spot, self.size): self._current[spot]
+                for spot in range(len(previous))
+                if previous[spot] != self._current[spot]}
+
+    def _decode_board(self, cells):
+        return tuple([[str(num) if num else self.emptySpotChar
+                       for num in cells[rowI * self.size:(rowI + 1) * self.size]]
+                      for rowI in range(self.size)])
+
+
+def _encode_board(board, emptySpotChar):
+    """
+    Returns the board as a bytearray (row by row, 0 meaning an empty spot).
+
+    Arguments:
+        board {tuple of lists}
+        emptySpotChar {char}
+
+    Returns:
+        {bytearray}
+    """
+
+    return bytearray([0 if element == emptySpotChar else int(element)
+                      for row in board
+                      for element in row])
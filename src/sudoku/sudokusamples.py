@@ -3,6 +3,11 @@ Module containing some example sudoku boards
 
     boards9 -- a tuple of 9 boards (9x9)
     boards12 -- a tuple of 2 boards (12x12)
+    boards15 -- a tuple of 2 boards (15x15)
+    boards18 -- a tuple of 1 board (18x18)
+    boards16 -- a tuple of 3 boards (16x16, 40% and 45% of the spots given)
+    boards25 -- a tuple of 3 boards (25x25, 50% of the spots given)
+    boards36 -- a tuple of 2 boards (36x36, 55% of the spots given)
 
     Index 0 of every tuple is an empty board
 """
@@ -231,5 +236,243 @@ boards18=(
                 [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
                 [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
                 [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ]
+            ),
+        )
+
+#16x16 boards
+boards16=(
+            #0
+            (
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ]
+            ),
+
+            #1
+            (
+                ['11',emp ,emp ,'2' ,emp ,emp ,emp ,emp ,'14',emp ,emp ,emp ,emp ,emp ,emp ,'13'],
+                ['1' ,'3' ,'4' ,emp ,'13',emp ,'15','16','2' ,'6' ,emp ,'10',emp ,emp ,emp ,'12'],
+                [emp ,'8' ,emp ,'10','1' ,'2' ,'5' ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,'14'],
+                ['12',emp ,emp ,emp ,'6' ,emp ,emp ,emp ,'1' ,emp ,emp ,emp ,emp ,'5' ,'10',emp ],
+                ['2' ,emp ,'3' ,emp ,emp ,emp ,emp ,emp ,emp ,'14','13',emp ,emp ,'16',emp ,'5' ],
+                ['16','10',emp ,'14','2' ,'1' ,emp ,emp ,emp ,emp ,'8' ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,'8' ,emp ,emp ,emp ,'14',emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,'3' ],
+                [emp ,'5' ,'12',emp ,emp ,emp ,emp ,emp ,'3' ,'1' ,'2' ,emp ,emp ,'14','9' ,emp ],
+                [emp ,emp ,'7' ,emp ,emp ,'13',emp ,emp ,'15',emp ,'11','8' ,'16','12',emp ,'4' ],
+                ['13','16',emp ,'4' ,emp ,emp ,'1' ,emp ,'6' ,emp ,'14',emp ,'5' ,emp ,'3' ,emp ],
+                ['8' ,emp ,emp ,'11','14',emp ,emp ,emp ,emp ,emp ,emp ,'12',emp ,emp ,emp ,'7' ],
+                [emp ,emp ,emp ,emp ,'4' ,'6' ,'11','7' ,'13',emp ,'16',emp ,emp ,'10',emp ,'8' ],
+                [emp ,'2' ,emp ,'8' ,emp ,emp ,'12',emp ,'7' ,emp ,emp ,emp ,'10',emp ,'4' ,'16'],
+                [emp ,emp ,'1' ,emp ,emp ,emp ,'10',emp ,'8' ,'4' ,emp ,'13',emp ,'3' ,'15',emp ],
+                ['10','4' ,emp ,'6' ,emp ,emp ,'7' ,emp ,'16',emp ,emp ,emp ,'13',emp ,emp ,'1' ],
+                ['15',emp ,emp ,'3' ,'8' ,emp ,'13',emp ,emp ,emp ,'10',emp ,emp ,emp ,emp ,emp ]
+            ),
+
+            #2
+            (
+                ['11',emp ,emp ,'2' ,emp ,emp ,emp ,emp ,'14','8' ,emp ,emp ,emp ,emp ,emp ,'13'],
+                ['1' ,'3' ,'4' ,emp ,'13',emp ,'15','16','2' ,'6' ,emp ,'10',emp ,emp ,emp ,'12'],
+                [emp ,'8' ,emp ,'10','1' ,'2' ,'5' ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,'14'],
+                ['12',emp ,emp ,emp ,'6' ,emp ,emp ,'9' ,'1' ,emp ,emp ,emp ,'2' ,'5' ,'10',emp ],
+                ['2' ,emp ,'3' ,emp ,emp ,emp ,'6' ,emp ,emp ,'14','13',emp ,emp ,'16',emp ,'5' ],
+                ['16','10',emp ,'14','2' ,'1' ,emp ,emp ,emp ,emp ,'8' ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,'8' ,emp ,'7' ,emp ,'14',emp ,emp ,emp ,emp ,'15',emp ,emp ,emp ,'3' ],
+                [emp ,'5' ,'12','7' ,emp ,emp ,emp ,emp ,'3' ,'1' ,'2' ,emp ,emp ,'14','9' ,emp ],
+                [emp ,emp ,'7' ,emp ,emp ,'13','2' ,emp ,'15',emp ,'11','8' ,'16','12',emp ,'4' ],
+                ['13','16',emp ,'4' ,'12',emp ,'1' ,emp ,'6' ,emp ,'14',emp ,'5' ,emp ,'3' ,emp ],
+                ['8' ,emp ,emp ,'11','14',emp ,emp ,emp ,emp ,emp ,emp ,'12',emp ,emp ,emp ,'7' ],
+                [emp ,emp ,'5' ,emp ,'4' ,'6' ,'11','7' ,'13',emp ,'16',emp ,emp ,'10','1' ,'8' ],
+                [emp ,'2' ,emp ,'8' ,emp ,emp ,'12',emp ,'7' ,emp ,emp ,emp ,'10','11','4' ,'16'],
+                [emp ,emp ,'1' ,emp ,emp ,emp ,'10',emp ,'8' ,'4' ,emp ,'13','14','3' ,'15',emp ],
+                ['10','4' ,emp ,'6' ,emp ,emp ,'7' ,emp ,'16',emp ,emp ,emp ,'13',emp ,emp ,'1' ],
+                ['15',emp ,emp ,'3' ,'8' ,emp ,'13',emp ,emp ,emp ,'10',emp ,emp ,emp ,emp ,emp ]
+            )
+        )
+
+
+#25x25 boards
+boards25=(
+            #0
+            (
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ]
+            ),
+
+            #1
+            (
+                ['7' ,emp ,emp ,emp ,emp ,emp ,'23',emp ,'6' ,'17','5' ,'18',emp ,'11','4' ,emp ,'21',emp ,emp ,'8' ,'14','10','24','16',emp ],
+                [emp ,'3' ,emp ,'5' ,'6' ,emp ,'12',emp ,'14',emp ,emp ,emp ,emp ,emp ,'22','18','19',emp ,emp ,'25','2' ,'7' ,'8' ,emp ,'11'],
+                [emp ,'9' ,emp ,emp ,'12','18',emp ,emp ,'21',emp ,'1' ,emp ,'3' ,'6' ,'7' ,emp ,emp ,'13','14','16',emp ,emp ,'22',emp ,emp ],
+                ['14',emp ,'16','17','18','1' ,emp ,emp ,emp ,emp ,'8' ,emp ,'10','23','24',emp ,emp ,emp ,'20','22','3' ,emp ,'13','19','21'],
+                [emp ,emp ,emp ,'23','24','7' ,'8' ,'9' ,'11',emp ,'12','13',emp ,'15','25','2' ,'3' ,'6' ,'10',emp ,'1' ,emp ,emp ,'18','20'],
+                ['2' ,emp ,emp ,emp ,emp ,emp ,emp ,'18',emp ,emp ,emp ,emp ,'12',emp ,emp ,emp ,emp ,emp ,emp ,'11',emp ,'25','17',emp ,emp ],
+                ['21','22',emp ,emp ,emp ,'24','1' ,'25','10',emp ,'15',emp ,emp ,emp ,'11',emp ,emp ,emp ,'9' ,emp ,'19','20',emp ,emp ,'8' ],
+                [emp ,'24',emp ,'8' ,emp ,emp ,'6' ,'19',emp ,emp ,'20','1' ,emp ,emp ,emp ,emp ,'10',emp ,emp ,emp ,emp ,'22','11',emp ,emp ],
+                ['10',emp ,'19',emp ,emp ,emp ,'3' ,'17','23','11','24','5' ,emp ,'13',emp ,emp ,emp ,emp ,'25',emp ,emp ,'14',emp ,'6' ,emp ],
+                ['11','5' ,emp ,emp ,'9' ,emp ,emp ,'8' ,'22',emp ,'25','6' ,'23',emp ,emp ,'13','7' ,emp ,'18','19','12','2' ,emp ,'21','1' ],
+                ['3' ,'11',emp ,'13','1' ,'9' ,'21','14',emp ,emp ,emp ,'24','5' ,'18','20',emp ,'25',emp ,emp ,emp ,emp ,emp ,'12','8' ,'17'],
+                [emp ,'10',emp ,emp ,emp ,emp ,emp ,emp ,'19',emp ,emp ,emp ,emp ,emp ,'15','6' ,emp ,emp ,'11',emp ,emp ,emp ,'9' ,emp ,emp ],
+                ['20','19',emp ,'7' ,'15',emp ,emp ,emp ,emp ,emp ,'13','12','6' ,'2' ,'16',emp ,'4' ,'9' ,emp ,'21','10','18',emp ,'22','24'],
+                [emp ,'25','12',emp ,'22',emp ,'15',emp ,emp ,'7' ,emp ,emp ,'8' ,'3' ,'19',emp ,'17','18',emp ,emp ,emp ,emp ,'16',emp ,'4' ],
+                [emp ,'4' ,'18','16','8' ,emp ,'20',emp ,emp ,emp ,emp ,emp ,emp ,emp ,'23','5' ,emp ,'19',emp ,'10','7' ,'21','14','3' ,emp ],
+                [emp ,emp ,'11','1' ,emp ,'23',emp ,'5' ,'8' ,'18',emp ,'15',emp ,'20',emp ,'24',emp ,emp ,'21',emp ,emp ,emp ,'19',emp ,'7' ],
+                [emp ,emp ,'15','21',emp ,emp ,emp ,emp ,emp ,'4' ,emp ,emp ,'1' ,emp ,'12','3' ,'13','20',emp ,emp ,emp ,'23','6' ,'24','5' ],
+                ['17',emp ,emp ,emp ,emp ,'20',emp ,emp ,'3' ,'9' ,emp ,emp ,'13',emp ,emp ,'25',emp ,'14',emp ,'4' ,emp ,emp ,emp ,'15',emp ],
+                [emp ,emp ,'9' ,emp ,'5' ,'6' ,'10','24',emp ,emp ,emp ,emp ,'25','14','21','1' ,'23','15',emp ,'2' ,emp ,'13','4' ,'20','3' ],
+                ['25',emp ,'24',emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,'7' ,emp ,'16','17','11',emp ,emp ,'8' ,emp ,emp ,emp ,emp ,emp ,'14'],
+                [emp ,'1' ,'3' ,'2' ,emp ,'8' ,'4' ,emp ,emp ,emp ,emp ,'16',emp ,'10','13','19',emp ,'11',emp ,'20',emp ,'15','23','14',emp ],
+                ['9' ,'8' ,'7' ,emp ,'10','3' ,emp ,emp ,emp ,emp ,'23','11',emp ,'12','1' ,emp ,'18','25',emp ,emp ,emp ,'24',emp ,emp ,'19'],
+                ['13','12','20','24','11','21',emp ,emp ,emp ,'10','2' ,emp ,'17',emp ,emp ,'16',emp ,'3' ,'23',emp ,'5' ,'8' ,emp ,emp ,emp ],
+                [emp ,'17',emp ,'22','14',emp ,'11','16',emp ,'23',emp ,emp ,emp ,'5' ,emp ,'21',emp ,'8' ,emp ,emp ,emp ,emp ,'20',emp ,'10'],
+                ['18',emp ,'21',emp ,emp ,emp ,'24','15','12','13',emp ,'20','22','25','8' ,emp ,emp ,'4' ,'5' ,emp ,'9' ,'3' ,'7' ,emp ,emp ]
+            ),
+
+            #2
+            (
+                [emp ,'22','21','12',emp ,'19',emp ,emp ,'16',emp ,emp ,'7' ,'3' ,'17',emp ,'14',emp ,'23','8' ,'6' ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,'3' ,'18','22','12','17','7' ,'4' ,'2' ,emp ,'23','15',emp ,emp ,'1' ,emp ,emp ,emp ,'25',emp ,emp ,emp ],
+                [emp ,'23',emp ,emp ,'16',emp ,emp ,emp ,emp ,'25','6' ,'20','9' ,'1' ,emp ,emp ,emp ,emp ,'24',emp ,'11',emp ,emp ,'10',emp ],
+                [emp ,'25',emp ,emp ,'9' ,'2' ,'10','15',emp ,'20','18',emp ,'5' ,emp ,'24','17',emp ,'22','16',emp ,emp ,'21',emp ,'12',emp ],
+                [emp ,'15',emp ,'18','1' ,'4' ,'23',emp ,'24',emp ,'19',emp ,'22','14','16',emp ,emp ,emp ,emp ,emp ,'3' ,'9' ,emp ,'13','7' ],
+                [emp ,'6' ,emp ,'19','14',emp ,'13','4' ,emp ,'8' ,emp ,'1' ,emp ,emp ,'3' ,'25','12','11',emp ,emp ,emp ,'16',emp ,emp ,emp ],
+                ['15','18','12',emp ,emp ,'22','25',emp ,emp ,'17',emp ,'19','7' ,'16',emp ,'9' ,emp ,'13',emp ,'8' ,'21','10',emp ,emp ,'11'],
+                ['5' ,'20',emp ,emp ,'8' ,'15',emp ,'7' ,'19',emp ,emp ,emp ,emp ,emp ,emp ,'10',emp ,emp ,'22','16','4' ,emp ,emp ,'2' ,'25'],
+                [emp ,'4' ,'22',emp ,'21',emp ,'2' ,emp ,'3' ,'5' ,'9' ,emp ,emp ,emp ,emp ,'23',emp ,'18','6' ,'14',emp ,emp ,emp ,emp ,'8' ],
+                [emp ,emp ,'10',emp ,emp ,emp ,'14','23','11',emp ,'25','22','8' ,'12',emp ,emp ,'17','4' ,'5' ,'19',emp ,'20','18','1' ,'9' ],
+                [emp ,emp ,'16','23','12','3' ,emp ,emp ,'7' ,'14','15','24','6' ,'4' ,'21',emp ,'13',emp ,'25',emp ,emp ,'11',emp ,emp ,'20'],
+                [emp ,emp ,'19','9' ,'4' ,emp ,'8' ,emp ,emp ,emp ,'16',emp ,emp ,'2' ,emp ,emp ,'6' ,emp ,emp ,'20','24','14','17',emp ,'18'],
+                ['14','17',emp ,'6' ,'10',emp ,'4' ,'20','21','2' ,emp ,emp ,emp ,emp ,'13','5' ,'11',emp ,'3' ,emp ,'7' ,'1' ,'23',emp ,emp ],
+                ['2' ,emp ,'13','20',emp ,'17','24',emp ,'6' ,emp ,emp ,emp ,'18',emp ,'11',emp ,'4' ,emp ,emp ,emp ,'15',emp ,emp ,'8' ,'12'],
+                ['1' ,emp ,emp ,'22',emp ,emp ,emp ,'18',emp ,emp ,'3' ,emp ,emp ,emp ,emp ,emp ,emp ,'8' ,'14','12',emp ,emp ,emp ,emp ,'6' ],
+                ['11','12','23','8' ,'22','7' ,emp ,'17','10','18',emp ,'25',emp ,'9' ,'5' ,emp ,'2' ,emp ,emp ,emp ,'19','4' ,'24',emp ,emp ],
+                ['7' ,'13',emp ,'17','24',emp ,'11','21','23','9' ,'2' ,'15',emp ,'18',emp ,'22','5' ,emp ,emp ,'10',emp ,'12','8' ,'20',emp ],
+                [emp ,'21','4' ,emp ,'5' ,'25','12',emp ,emp ,'3' ,emp ,'6' ,emp ,emp ,'8' ,emp ,emp ,'17',emp ,'15','9' ,emp ,emp ,'23',emp ],
+                ['20',emp ,'25',emp ,emp ,emp ,'16','1' ,emp ,'22',emp ,'23','4' ,emp ,emp ,'12','21',emp ,'13','9' ,emp ,emp ,'11','18',emp ],
+                ['3' ,'9' ,emp ,'16',emp ,emp ,emp ,'19','2' ,emp ,emp ,'21',emp ,emp ,emp ,emp ,emp ,emp ,'11',emp ,'17',emp ,'10',emp ,'15'],
+                [emp ,emp ,'8' ,'21',emp ,emp ,emp ,emp ,emp ,emp ,'11','4' ,emp ,'25',emp ,emp ,'18',emp ,'12',emp ,'16','17','20','9' ,emp ],
+                ['12',emp ,emp ,emp ,emp ,'9' ,emp ,'2' ,'5' ,'10','21',emp ,emp ,emp ,emp ,emp ,emp ,'14',emp ,'1' ,emp ,'8' ,emp ,'11',emp ],
+                [emp ,emp ,emp ,emp ,'17','13',emp ,'14',emp ,'21',emp ,emp ,emp ,emp ,emp ,emp ,emp ,'6' ,'9' ,emp ,emp ,'19',emp ,'15',emp ],
+                [emp ,'1' ,emp ,emp ,emp ,emp ,'18',emp ,emp ,'16','20',emp ,'15',emp ,'14',emp ,'23','21','17','7' ,emp ,'5' ,emp ,emp ,emp ],
+                [emp ,'11','18','5' ,emp ,'6' ,emp ,emp ,emp ,'23',emp ,'12',emp ,'13',emp ,'19','16','10',emp ,emp ,'14','7' ,emp ,'3' ,emp ]
+            )
+        )
+
+
+#36x36 boards
+boards36=(
+            #0
+            (
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ]
+            ),
+
+            #1
+            (
+                [emp ,'26','29','34',emp ,'23',emp ,emp ,emp ,'15','31','13','27','30','10','20',emp ,emp ,emp ,'7' ,emp ,emp ,emp ,emp ,'12','24',emp ,'16','19',emp ,'5' ,'1' ,emp ,'17','32',emp ],
+                ['2' ,'3' ,emp ,emp ,emp ,'11','32',emp ,'27',emp ,'19',emp ,emp ,emp ,emp ,'12','33',emp ,emp ,'6' ,emp ,'29','10','21',emp ,'28','35','30','13','31','20',emp ,'25','9' ,emp ,'15'],
+                ['27',emp ,emp ,emp ,emp ,'13',emp ,'23','24','25',emp ,emp ,'8' ,emp ,emp ,emp ,'7' ,'11',emp ,'20','31','22',emp ,'2' ,'33',emp ,emp ,emp ,emp ,'4' ,'34','10','12',emp ,'26','28'],
+                [emp ,'4' ,'24','28','6' ,'20','34','7' ,'26','18',emp ,'16','29','22','15','14',emp ,'13',emp ,'32','12',emp ,'27',emp ,emp ,emp ,'9' ,'8' ,'10',emp ,'36','35','31','21','23',emp ],
+                [emp ,'15',emp ,emp ,'35',emp ,'12','22','14','28','29','17','3' ,'25','32',emp ,emp ,emp ,'4' ,emp ,'8' ,emp ,'1' ,emp ,emp ,emp ,emp ,'34',emp ,emp ,'24','30',emp ,emp ,emp ,'11'],
+                ['18','17','25','7' ,emp ,emp ,'20','35','11','4' ,emp ,emp ,'28',emp ,emp ,'1' ,'34','2' ,'24','30',emp ,'19',emp ,'5' ,emp ,'21',emp ,emp ,'36',emp ,emp ,emp ,emp ,emp ,'22','14'],
+                [emp ,'12',emp ,emp ,'33','32','16',emp ,'13',emp ,'17',emp ,'14','24','34','8' ,emp ,'10','22','21',emp ,'31',emp ,'27',emp ,emp ,emp ,emp ,'15','9' ,'2' ,emp ,'5' ,'7' ,'30',emp ],
+                ['15',emp ,emp ,'3' ,emp ,'25','14','20','33','35','32','19',emp ,emp ,emp ,'28',emp ,'27','9' ,'10','4' ,emp ,emp ,'1' ,'23','17',emp ,'11','7' ,'34','26',emp ,'21',emp ,emp ,emp ],
+                [emp ,'21',emp ,'9' ,'7' ,emp ,emp ,'18','15',emp ,emp ,emp ,emp ,'12',emp ,emp ,emp ,'36','25','23',emp ,'24',emp ,'17','4' ,emp ,emp ,emp ,'32','20',emp ,emp ,emp ,emp ,'1' ,'35'],
+                [emp ,'19',emp ,'29','18','1' ,'5' ,emp ,emp ,'23','21','8' ,'15',emp ,'7' ,emp ,'35',emp ,emp ,emp ,'3' ,'16','6' ,emp ,'27',emp ,emp ,emp ,'12',emp ,'22',emp ,emp ,emp ,'36','25'],
+                ['24',emp ,emp ,emp ,'13','17',emp ,'2' ,emp ,'12','26','31',emp ,'3' ,emp ,'16','25',emp ,emp ,'11','7' ,emp ,'32','35','19','30','8' ,emp ,emp ,'21',emp ,emp ,emp ,'4' ,'29',emp ],
+                ['31','27',emp ,'2' ,'4' ,'16','24','36',emp ,emp ,'22','29','32',emp ,emp ,'9' ,emp ,'33','30',emp ,'5' ,'15',emp ,emp ,emp ,'25',emp ,emp ,'3' ,emp ,emp ,'17','11','8' ,emp ,emp ],
+                [emp ,emp ,emp ,emp ,'3' ,emp ,'2' ,'26','29',emp ,emp ,emp ,emp ,emp ,'31',emp ,'22','7' ,emp ,emp ,emp ,'33',emp ,emp ,'5' ,'6' ,emp ,'28','27','17','15','24','8' ,emp ,'21',emp ],
+                ['13','33',emp ,emp ,emp ,emp ,'25','34','7' ,emp ,'36',emp ,'18','9' ,emp ,emp ,emp ,'24','16','29','20','27','26','14','21',emp ,'10',emp ,'8' ,'15','1' ,'32','4' ,'30','6' ,emp ],
+                [emp ,emp ,emp ,'11',emp ,emp ,emp ,'15','35',emp ,'3' ,'4' ,'2' ,'23','29','21',emp ,'20',emp ,'25','10','13',emp ,'22',emp ,'9' ,emp ,emp ,'16','30',emp ,emp ,emp ,'27',emp ,'34'],
+                [emp ,emp ,emp ,'22','34',emp ,'27',emp ,'30','5' ,emp ,'21',emp ,emp ,'36',emp ,'26','12','6' ,emp ,'1' ,'17',emp ,emp ,'29',emp ,'23',emp ,'2' ,'19','3' ,emp ,'20','13',emp ,emp ],
+                ['8' ,'36',emp ,emp ,emp ,emp ,emp ,'16','12','10','13','6' ,emp ,'33','1' ,emp ,'11',emp ,emp ,'15','18','21','5' ,emp ,emp ,'32','22','20','24','3' ,'7' ,'26','9' ,'23',emp ,emp ],
+                [emp ,emp ,emp ,emp ,emp ,'30',emp ,emp ,emp ,'20',emp ,'33',emp ,emp ,'27',emp ,'6' ,emp ,'7' ,emp ,emp ,'32','23','3' ,'13','18','11','1' ,emp ,'14','25','5' ,emp ,'16',emp ,emp ],
+                ['33',emp ,emp ,'35',emp ,'34','29','9' ,'6' ,'22','12','15','36',emp ,'17',emp ,emp ,'26','13',emp ,emp ,emp ,'30','7' ,emp ,emp ,'24',emp ,emp ,'2' ,'14','31','18','11',emp ,'1' ],
+                [emp ,emp ,emp ,emp ,'19',emp ,emp ,emp ,emp ,'26','11','2' ,emp ,emp ,emp ,emp ,'29','30','31','5' ,'17','12',emp ,'24','25',emp ,'15',emp ,emp ,emp ,emp ,emp ,emp ,'34','7' ,'32'],
+                [emp ,'8' ,'2' ,emp ,emp ,'24',emp ,emp ,'16','27',emp ,'10',emp ,emp ,emp ,'18','14','3' ,'26','22','19','35','36','6' ,'28','29',emp ,emp ,emp ,'1' ,'4' ,'12','30',emp ,emp ,'5' ],
+                ['23','22','7' ,'13','11','29','21',emp ,emp ,'3' ,emp ,'34',emp ,emp ,'5' ,'2' ,'10','15','8' ,emp ,'16','20','25','28','30','35','32','9' ,emp ,'12','33','6' ,'26',emp ,'27','17'],
+                [emp ,emp ,emp ,'31',emp ,'6' ,'17',emp ,'28','19',emp ,emp ,'24',emp ,emp ,'35','32','16',emp ,emp ,'21',emp ,'14','29','11',emp ,'26',emp ,'23',emp ,'8' ,emp ,emp ,'3' ,emp ,'9' ],
+                ['26',emp ,emp ,'16',emp ,'15',emp ,emp ,emp ,'13',emp ,'32','25','7' ,emp ,emp ,'1' ,emp ,emp ,emp ,'27',emp ,'34',emp ,'14',emp ,emp ,emp ,emp ,'8' ,'35',emp ,emp ,'28','24','19'],
+                ['3' ,'34','16',emp ,emp ,'18',emp ,'12',emp ,'32','15','23',emp ,emp ,'28',emp ,'36',emp ,'21',emp ,'35',emp ,'7' ,'33',emp ,'4' ,'17','24','25',emp ,'27',emp ,'10',emp ,'8' ,emp ],
+                ['9' ,emp ,'10','30',emp ,emp ,emp ,emp ,'17','29',emp ,'22',emp ,'26',emp ,'32','16','14',emp ,emp ,'25',emp ,emp ,'20','1' ,'36',emp ,'2' ,'34',emp ,emp ,emp ,emp ,emp ,'31',emp ],
+                [emp ,'28',emp ,emp ,emp ,'4' ,'9' ,'11',emp ,emp ,'33','20',emp ,emp ,'18',emp ,emp ,emp ,'23',emp ,'6' ,emp ,'15',emp ,'8' ,'14','16',emp ,'22','7' ,'21','2' ,'36',emp ,'17','13'],
+                ['5' ,'11','33',emp ,'21','8' ,'36',emp ,'10','16','2' ,'27','7' ,emp ,'25',emp ,emp ,emp ,'1' ,'24','13',emp ,'17',emp ,'9' ,'19','12','15','26',emp ,emp ,'28',emp ,'22','35','3' ],
+                ['20','7' ,'17',emp ,'32',emp ,emp ,emp ,emp ,'14','34','24','10',emp ,'21','23','15','9' ,emp ,emp ,'2' ,'28',emp ,'19',emp ,emp ,emp ,emp ,'30','33','12','25',emp ,'6' ,emp ,emp ],
+                ['6' ,emp ,'31',emp ,'14',emp ,emp ,'30','4' ,emp ,'18','35',emp ,emp ,'33','24',emp ,'19','3' ,'27',emp ,'34','22','8' ,'20','23',emp ,emp ,'11',emp ,'16','29','7' ,emp ,'15',emp ],
+                ['28','31',emp ,'27',emp ,emp ,'6' ,emp ,'32','34','5' ,emp ,'23',emp ,emp ,emp ,'3' ,emp ,emp ,emp ,emp ,'25','24',emp ,emp ,'8' ,'13',emp ,emp ,'10',emp ,'18','15',emp ,'9' ,'7' ],
+                [emp ,'6' ,'23',emp ,emp ,emp ,'8' ,emp ,emp ,'9' ,emp ,'7' ,emp ,'5' ,'16',emp ,emp ,'31','28','19',emp ,emp ,'20',emp ,emp ,'33','30',emp ,'29','25','32',emp ,emp ,emp ,'34','21'],
+                [emp ,emp ,emp ,emp ,emp ,emp ,emp ,'10',emp ,'36','16','28','21','15','26',emp ,'24',emp ,'29',emp ,'11',emp ,'3' ,'12','31',emp ,emp ,'23','5' ,emp ,'17',emp ,emp ,emp ,emp ,emp ],
+                ['32','16','4' ,emp ,emp ,emp ,'30','17',emp ,'2' ,emp ,emp ,'20',emp ,emp ,'29',emp ,'28','27','13',emp ,'6' ,emp ,emp ,emp ,emp ,'3' ,emp ,'14','18',emp ,emp ,'22','26','5' ,'8' ],
+                ['21','2' ,emp ,emp ,'29','3' ,'15',emp ,'23','33',emp ,emp ,emp ,'10',emp ,'34',emp ,'6' ,'32',emp ,emp ,'5' ,emp ,'30','7' ,emp ,emp ,'17','9' ,emp ,emp ,'16','35','25','28','31'],
+                ['22','14','15',emp ,emp ,emp ,emp ,'27','21',emp ,emp ,emp ,emp ,emp ,emp ,emp ,emp ,'25','10',emp ,emp ,emp ,'31','9' ,'32',emp ,emp ,emp ,'28',emp ,emp ,emp ,'24',emp ,emp ,emp ]
             )
         )
\ No newline at end of file
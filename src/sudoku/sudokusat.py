@@ -0,0 +1,755 @@
+"""
+Module solving boards as a SAT problem (used by SudokuBoard.solve with strategy 'sat')
+
+    The board is encoded as CNF: variable (spot * size + num) means num is in spot, every spot has exactly one num
+    and every row, column, square (and unit of a constraint) has every num exactly once. The nums a spot
+    can't take next to the givens are just false, so the CNF of a board with many givens stays small.
+    The CNF can be written in the DIMACS format and solved by any SAT solver found on the PATH,
+    or by the small CDCL solver below (watched literals, learning the first UIP clause of every conflict,
+    jumping back to the level it asserts at, VSIDS, phase saving and Luby restarts), which learns
+    why a branch failed instead of trying it again under every num it backtracks over.
+
+    Main methods:
+        encode_board -- encodes a board given as a flat list of ints as CNF
+        decode_model -- converts a model of the CNF back to a flat list of ints
+        to_dimacs -- writes CNF in the DIMACS format
+        read_dimacs -- reads CNF written in the DIMACS format
+        CDCLSolver -- solves CNF
+        find_sat_solver -- finds an external SAT solver on the PATH
+        solve_sat -- solves a board given as a flat list of ints
+"""
+
+import heapq
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from sudoku.sudokuexceptions import ArgumentError, BoardError
+from sudoku.sudokukernel import KernelSolver, SOLVED, UNSOLVABLE, PAUSED, _luby
+
+# external solvers solve_sat looks for with solver='auto' (in that order)
+satSolverNames = ('kissat', 'cadical', 'cryptominisat5', 'glucose', 'minisat')
+
+# external solvers which write the model into a file given after the CNF instead of printing it
+_resultFileSolvers = ('minisat', 'glucose')
+
+
+def encode_board(cells, size, boxRows=None, boxCols=None, constraints=None):
+    """
+    Encodes a board as CNF.
+
+    Arguments:
+        cells {list of ints} -- board row by row, 0 meaning an empty spot
+        size {int} -- length of the board's side
+
+    Keyword Arguments:
+        boxRows {int} -- row count of a single square (default: {None} (see get_box_shape))
+        boxCols {int} -- column count of a single square (default: {None} (see get_box_shape))
+        constraints {list of Constraints} -- extra rules of the board (see sudokuconstraints) (default: {None})
+
+    Raises:
+        BoardError: if the board is incorrect (see KernelSolver)
+        ArgumentError: The constraint can't be encoded as CNF.
+
+    Returns:
+        {tuple} -- list of clauses (lists of non-zero ints, negative meaning negated) and the variable count
+    """
+
+    kernel = KernelSolver(cells, size, boxRows, boxCols, constraints)
+
+    # nums every spot can take (just the given one for givens)
+    spotMasks = [1 << (num - 1) if num else kernel.candidates(spot)
+                 for spot, num in enumerate(kernel.cells)]
+
+    def variable(spot, num):
+        if spotMasks[spot] >> (num - 1) & 1:
+            return spot * size + num
+
+    clauses = []
+    for spot, mask in enumerate(spotMasks):
+        spotVariables = [variable(spot, num) for num in range(1, size + 1) if mask >> (num - 1) & 1]
+        _add_exactly_one(clauses, spotVariables)
+
+        # the other nums are false, so no solver can set them to anything
+        clauses += [[-(spot * size + num)] for num in range(1, size + 1) if not mask >> (num - 1) & 1]
+
+    for unit in kernel._unitSpots + kernel._extraUnits:
+        for num in range(1, size + 1):
+            _add_exactly_one(clauses, [variable(spot, num) for spot in unit if variable(spot, num)])
+
+    variableCount = size * size * size
+    for constraint in kernel.constraints:
+        def add_variable():
+            nonlocal variableCount
+            variableCount += 1
+            return variableCount
+
+        constraintClauses = constraint.get_clauses(variable, add_variable)
+        if constraintClauses is None:
+            raise ArgumentError("The {} constraint can't be encoded as CNF.".format(constraint.name))
+        clauses.extend(constraintClauses)
+
+    return clauses, variableCount
+
+
+def decode_model(model, size):
+    """
+    Converts a model of a board's CNF back to the board.
+
+    Arguments:
+        model {list of ints} -- variables which are true (others can be given too, negative ones are skipped)
+        size {int} -- length of the board's side
+
+    Returns:
+        {list of ints} -- board row by row
+    """
+
+    cells = [0] * (size * size)
+    for literal in model:
+        if 0 < literal <= size * size * size:
+            spot, num = divmod(literal - 1, size)
+            cells[spot] = num + 1
+
+    return cells
+
+
+def to_dimacs(clauses, variableCount, comments=()):
+    """
+    Returns:
+        {str} -- the CNF in the DIMACS format
+    """
+
+    lines = ['c {}'.format(comment) for comment in comments]
+    lines.append('p cnf {} {}'.format(variableCount, len(clauses)))
+    lines += [' '.join(map(str, clause)) + ' 0' for clause in clauses]
+
+    return '\n'.join(lines) + '\n'
+
+
+def read_dimacs(text):
+    """
+    Reads CNF written in the DIMACS format.
+
+    Arguments:
+        text {str}
+
+    Raises:
+        BoardError: Incorrect DIMACS.
+
+    Returns:
+        {tuple} -- list of clauses and the variable count
+    """
+
+    variableCount = None
+    clauses = []
+    clause = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] in 'c%':
+            continue
+
+        if line.startswith('p'):
+            parts = line.split()
+            if len(parts) != 4 or parts[1] != 'cnf':
+                raise BoardError('Incorrect DIMACS.')
+            variableCount = int(parts[2])
+            continue
+
+        try:
+            literals = [int(literal) for literal in line.split()]
+        except ValueError:
+            raise BoardError('Incorrect DIMACS.')
+
+        for literal in literals:
+            if literal == 0:
+                clauses.append(clause)
+                clause = []
+            else:
+                clause.append(literal)
+
+    if variableCount is None:
+        raise BoardError('Incorrect DIMACS.')
+    if clause:
+        clauses.append(clause)
+
+    return clauses, variableCount
+
+
+class CDCLSolver:
+    """
+    Solves CNF with conflict-driven clause learning.
+
+        Arguments:
+            clauses {list of lists of ints} -- (see encode_board)
+            variableCount {int}
+
+        Keyword Arguments:
+            restartBase {int} -- conflicts between restarts are restartBase times the Luby sequence (default: {64})
+            variableDecay {float} -- how fast the activity of variables not in recent conflicts fades
+            (default: {0.95})
+    """
+
+    def __init__(self, clauses, variableCount, restartBase=64, variableDecay=0.95):
+        self.variableCount = variableCount
+        self.restartBase = restartBase
+        self.variableDecay = variableDecay
+
+        # values of literals, indexed by literal + variableCount (1 true, -1 false, 0 unassigned)
+        self._values = [0] * (2 * variableCount + 1)
+        self._levels = [0] * (variableCount + 1)
+        self._reasons = [None] * (variableCount + 1)
+        # last value of every variable, decisions start with true (placing a num propagates more than ruling it out)
+        self._phases = [True] * (variableCount + 1)
+        self._activities = [0.0] * (variableCount + 1)
+        self._activityStep = 1.0
+        self._heap = [(0.0, variable) for variable in range(1, variableCount + 1)]
+
+        # clauses watching every literal (the first two literals of a clause are watched)
+        self._watches = [[] for _ in range(2 * variableCount + 1)]
+
+        self._trail = []
+        self._trailLimits = []
+        self._propagated = 0
+
+        self._clauses = []
+        self._learnts = []
+        self.maxLearnts = max(1000, len(clauses) // 3)
+
+        self.decisions = 0
+        self.conflicts = 0
+        self.propagations = 0
+        self.restarts = 0
+        self.status = None
+
+        # conflicts left until the next restart
+        self._conflictsLeft = restartBase * _luby(1)
+
+        for clause in clauses:
+            if not self._add_input_clause(clause):
+                self.status = UNSOLVABLE
+                break
+
+    def solve(self, decisionLimit=None):
+        """
+        Searches for a model.
+
+        Keyword Arguments:
+            decisionLimit {int} -- the search pauses when decisions reaches it, calling solve again resumes it
+            (default: {None} (no limit))
+
+        Returns:
+            {str} -- SOLVED (see get_model), UNSOLVABLE or PAUSED
+        """
+
+        if self.status in (SOLVED, UNSOLVABLE):
+            return self.status
+
+        if decisionLimit is None:
+            decisionLimit = float('inf')
+
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                if not self._trailLimits:
+                    self.status = UNSOLVABLE
+                    return self.status
+
+                learnt, backLevel = self._analyze(conflict)
+                self._cancel_until(backLevel)
+                self._learn(learnt)
+                self._decay_activities()
+
+                self._conflictsLeft -= 1
+                if self._conflictsLeft <= 0:
+                    self._restart()
+                continue
+
+            if self.decisions >= decisionLimit:
+                self.status = PAUSED
+                return self.status
+
+            variable = self._pick_variable()
+            if variable == 0:
+                self.status = SOLVED
+                return self.status
+
+            self.decisions += 1
+            self._trailLimits.append(len(self._trail))
+            literal = variable if self._phases[variable] else -variable
+            self._assign(literal, None)
+
+    def get_model(self):
+        """
+        Returns:
+            {list of ints} -- the value of every variable (v if it's true, -v if it's false)
+        """
+
+        offset = self.variableCount
+        return [variable if self._values[variable + offset] > 0 else -variable
+                for variable in range(1, self.variableCount + 1)]
+
+    def get_stats(self):
+        """
+        Returns:
+            {dict} -- decisions, conflicts, propagations, restarts and learnt clauses kept so far
+        """
+
+        return {'decisions': self.decisions, 'conflicts': self.conflicts, 'propagations': self.propagations,
+                'restarts': self.restarts, 'learnts': len(self._learnts)}
+
+    def _add_input_clause(self, clause):
+        """
+        Adds a clause before the search (at level 0).
+
+        Returns:
+            {bool} -- False if it makes the CNF unsolvable
+        """
+
+        values = self._values
+        offset = self.variableCount
+
+        literals = []
+        for literal in clause:
+            value = values[literal + offset]
+            if value > 0 or -literal in literals:
+                # satisfied already (or always)
+                return True
+            if value == 0 and literal not in literals:
+                literals.append(literal)
+
+        if not literals:
+            return False
+
+        if len(literals) == 1:
+            self._assign(literals[0], None)
+            return self._propagate() is None
+
+        self._clauses.append(literals)
+        self._watches[literals[0] + offset].append(literals)
+        self._watches[literals[1] + offset].append(literals)
+
+        return True
+
+    def _assign(self, literal, reason):
+        offset = self.variableCount
+        variable = abs(literal)
+
+        self._values[literal + offset] = 1
+        self._values[offset - literal] = -1
+        self._levels[variable] = len(self._trailLimits)
+        self._reasons[variable] = reason
+        self._trail.append(literal)
+
+    def _propagate(self):
+        """
+        Assigns the literals which are the last unassigned one of a clause with every other literal false.
+
+        Returns:
+            {list of ints} -- clause with every literal false or None if there's none
+        """
+
+        values = self._values
+        levels = self._levels
+        reasons = self._reasons
+        watches = self._watches
+        trail = self._trail
+        offset = self.variableCount
+        level = len(self._trailLimits)
+
+        propagated = self._propagated
+        while propagated < len(trail):
+            falseLiteral = -trail[propagated]
+            propagated += 1
+            self.propagations += 1
+
+            watchers = watches[falseLiteral + offset]
+            keptWatchers = []
+            for clauseI, clause in enumerate(watchers):
+                # the false literal is kept second
+                if clause[0] == falseLiteral:
+                    clause[0] = clause[1]
+                    clause[1] = falseLiteral
+
+                first = clause[0]
+                if values[first + offset] > 0:
+                    keptWatchers.append(clause)
+                    continue
+
+                for literalI in range(2, len(clause)):
+                    literal = clause[literalI]
+                    if values[literal + offset] >= 0:
+                        clause[1] = literal
+                        clause[literalI] = falseLiteral
+                        watches[literal + offset].append(clause)
+                        break
+                else:
+                    keptWatchers.append(clause)
+
+                    if values[first + offset] < 0:
+                        keptWatchers.extend(watchers[clauseI + 1:])
+                        watches[falseLiteral + offset] = keptWatchers
+                        self._propagated = len(trail)
+                        return clause
+
+                    # inlined _assign
+                    variable = abs(first)
+                    values[first + offset] = 1
+                    values[offset - first] = -1
+                    levels[variable] = level
+                    reasons[variable] = clause
+                    trail.append(first)
+
+            watches[falseLiteral + offset] = keptWatchers
+
+        self._propagated = propagated
+
+    def _analyze(self, conflict):
+        """
+        Finds the first unique implication point of the conflict.
+
+        Returns:
+            {tuple} -- the learnt clause (its first literal is the one it asserts) and the level to jump back to
+        """
+
+        levels = self._levels
+        reasons = self._reasons
+        trail = self._trail
+        level = len(self._trailLimits)
+
+        seen = set()
+        learnt = [0]
+        pathCount = 0
+        literal = None
+        trailI = len(trail) - 1
+        clause = conflict
+
+        while True:
+            for clauseLiteral in (clause if literal is None else clause[1:]):
+                variable = abs(clauseLiteral)
+                if variable in seen or levels[variable] == 0:
+                    continue
+
+                seen.add(variable)
+                self._bump_activity(variable)
+                if levels[variable] == level:
+                    pathCount += 1
+                else:
+                    learnt.append(clauseLiteral)
+
+            while abs(trail[trailI]) not in seen:
+                trailI -= 1
+
+            literal = trail[trailI]
+            trailI -= 1
+            pathCount -= 1
+            if pathCount == 0:
+                break
+
+            clause = reasons[abs(literal)]
+
+        learnt[0] = -literal
+
+        backLevel = 0
+        if len(learnt) > 1:
+            # the literal of the highest level is watched second, so it's the first to be unassigned
+            highestI = max(range(1, len(learnt)), key=lambda learntI: levels[abs(learnt[learntI])])
+            learnt[1], learnt[highestI] = learnt[highestI], learnt[1]
+            backLevel = levels[abs(learnt[1])]
+
+        return learnt, backLevel
+
+    def _learn(self, learnt):
+        if len(learnt) > 1:
+            offset = self.variableCount
+            self._learnts.append(learnt)
+            self._watches[learnt[0] + offset].append(learnt)
+            self._watches[learnt[1] + offset].append(learnt)
+            self._assign(learnt[0], learnt)
+        else:
+            self._assign(learnt[0], None)
+
+    def _cancel_until(self, level):
+        if len(self._trailLimits) <= level:
+            return
+
+        values = self._values
+        phases = self._phases
+        activities = self._activities
+        heap = self._heap
+        offset = self.variableCount
+
+        trailLimit = self._trailLimits[level]
+        for literal in self._trail[trailLimit:]:
+            variable = abs(literal)
+            values[literal + offset] = 0
+            values[offset - literal] = 0
+            phases[variable] = literal > 0
+            self._reasons[variable] = None
+            heapq.heappush(heap, (-activities[variable], variable))
+
+        del self._trail[trailLimit:]
+        del self._trailLimits[level:]
+        self._propagated = len(self._trail)
+
+    def _pick_variable(self):
+        """
+        Returns:
+            {int} -- the unassigned variable with the highest activity or 0 if every variable is assigned
+        """
+
+        values = self._values
+        activities = self._activities
+        heap = self._heap
+        offset = self.variableCount
+
+        while heap:
+            negativeActivity, variable = heapq.heappop(heap)
+            if values[variable + offset] == 0 and -negativeActivity == activities[variable]:
+                return variable
+
+        return 0
+
+    def _bump_activity(self, variable):
+        activities = self._activities
+        activities[variable] += self._activityStep
+
+        if activities[variable] > 1e100:
+            for otherVariable in range(1, self.variableCount + 1):
+                activities[otherVariable] *= 1e-100
+            self._activityStep *= 1e-100
+            self._rebuild_heap()
+        elif self._values[variable + self.variableCount] == 0:
+            heapq.heappush(self._heap, (-activities[variable], variable))
+
+    def _decay_activities(self):
+        self._activityStep /= self.variableDecay
+
+    def _rebuild_heap(self):
+        offset = self.variableCount
+        self._heap = [(-self._activities[variable], variable) for variable in range(1, self.variableCount + 1)
+                      if self._values[variable + offset] == 0]
+        heapq.heapify(self._heap)
+
+    def _restart(self):
+        self.restarts += 1
+        self._conflictsLeft = self.restartBase * _luby(self.restarts + 1)
+        self._cancel_until(0)
+
+        if len(self._learnts) > self.maxLearnts:
+            self._reduce_learnts()
+
+        # variables with equal activity keep piling up outdated entries
+        if len(self._heap) > 4 * self.variableCount:
+            self._rebuild_heap()
+
+    def _reduce_learnts(self):
+        """
+        Drops the longer half of the learnt clauses and simplifies every clause by the level 0 assignments
+        (only called at level 0, so no learnt clause is the reason of an assignment anymore).
+        """
+
+        values = self._values
+        offset = self.variableCount
+
+        self._learnts.sort(key=len)
+        del self._learnts[len(self._learnts) // 2:]
+        self.maxLearnts = int(self.maxLearnts * 1.1)
+
+        self._watches = [[] for _ in range(2 * self.variableCount + 1)]
+        for clauses in (self._clauses, self._learnts):
+            keptClauses = []
+            for clause in clauses:
+                if any(values[literal + offset] > 0 for literal in clause):
+                    continue
+
+                # level 0 propagation is complete, so at least two literals are left unassigned
+                clause[:] = [literal for literal in clause if values[literal + offset] == 0]
+                self._watches[clause[0] + offset].append(clause)
+                self._watches[clause[1] + offset].append(clause)
+                keptClauses.append(clause)
+            clauses[:] = keptClauses
+
+
+def find_sat_solver(names=satSolverNames):
+    """
+    Returns:
+        {str} -- path of the first of the given SAT solvers found on the PATH or None
+    """
+
+    for name in names:
+        path = shutil.which(name)
+        if path:
+            return path
+
+
+def solve_sat(cells, size, boxRows=None, boxCols=None, constraints=None, budget=None, solver=None):
+    """
+    Solves a board as a SAT problem.
+
+    Arguments:
+        cells {list of ints} -- board row by row, 0 meaning an empty spot
+        size {int} -- length of the board's side
+
+    Keyword Arguments:
+        boxRows {int} -- row count of a single square (default: {None} (see get_box_shape))
+        boxCols {int} -- column count of a single square (default: {None} (see get_box_shape))
+        constraints {list of Constraints} -- extra rules of the board (see sudokuconstraints) (default: {None})
+        budget {Budget} -- limits of the search (maxNodes counts the decisions, an external solver is only
+        stopped by the timeout and the cancel token) (default: {None})
+        solver {str} -- None (CDCLSolver), name or path of an external SAT solver reading DIMACS,
+        or 'auto' (the first of satSolverNames found on the PATH, else CDCLSolver) (default: {None})
+
+    Raises:
+        BoardError: if the board is incorrect (see KernelSolver)
+        ArgumentError: The constraint can't be encoded as CNF.
+        ArgumentError: SAT solver not found.
+        ArgumentError: SAT solver failed.
+
+    Returns:
+        {tuple} -- status (SOLVED, UNSOLVABLE or PAUSED if the budget was exceeded), the solution
+        (flat list of ints or None) and the stats (nodes (decisions), backtracks (conflicts), variables, clauses,
+        solver (path of the external solver or 'cdcl'), exceeded (the reason the budget was exceeded, if it was)
+        and the stats of CDCLSolver)
+    """
+
+    clauses, variableCount = encode_board(cells, size, boxRows, boxCols, constraints)
+
+    solverPath = None
+    if solver == 'auto':
+        solverPath = find_sat_solver()
+    elif solver is not None:
+        solverPath = shutil.which(solver)
+        if solverPath is None:
+            raise ArgumentError('SAT solver not found ({}).'.format(solver))
+
+    stats = {'nodes': 0, 'backtracks': 0, 'variables': variableCount, 'clauses': len(clauses),
+             'solver': solverPath or 'cdcl'}
+
+    if solverPath is not None:
+        status, model = _run_external_solver(solverPath, clauses, variableCount, budget, stats)
+    else:
+        status, model = _run_cdcl_solver(clauses, variableCount, budget, stats)
+
+    if status != SOLVED:
+        return status, None, stats
+
+    return SOLVED, decode_model(model, size), stats
+
+
+def _add_exactly_one(clauses, variables):
+    variables = [variable for variable in variables if variable]
+
+    clauses.append(variables)
+    for variableI, variable in enumerate(variables):
+        for otherVariable in variables[variableI + 1:]:
+            clauses.append([-variable, -otherVariable])
+
+
+def _run_cdcl_solver(clauses, variableCount, budget, stats):
+    cdclSolver = CDCLSolver(clauses, variableCount)
+
+    if budget is None:
+        status = cdclSolver.solve()
+    else:
+        # the solver pauses every few decisions, so the budget is checked between the pauses
+        while True:
+            reason = budget.get_exceeded_reason(cdclSolver.decisions)
+            if reason:
+                stats['exceeded'] = reason
+                status = PAUSED
+                break
+
+            status = cdclSolver.solve(budget.get_node_limit(cdclSolver.decisions))
+            if status != PAUSED:
+                break
+
+    stats.update(cdclSolver.get_stats())
+    stats['nodes'] = cdclSolver.decisions
+    stats['backtracks'] = cdclSolver.conflicts
+
+    return status, cdclSolver.get_model() if status == SOLVED else None
+
+
+def _run_external_solver(solverPath, clauses, variableCount, budget, stats):
+    """
+    Runs an external SAT solver on the CNF (SAT competition output, or minisat's result file).
+
+    Returns:
+        {tuple} -- status and the model (or None)
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        cnfPath = os.path.join(directory, 'board.cnf')
+        outputPath = os.path.join(directory, 'output.txt')
+        resultPath = os.path.join(directory, 'result.txt')
+        with open(cnfPath, 'w') as cnfFile:
+            cnfFile.write(to_dimacs(clauses, variableCount))
+
+        command = [solverPath, cnfPath]
+        if any(name in os.path.basename(solverPath) for name in _resultFileSolvers):
+            command.append(resultPath)
+
+        startTime = time.perf_counter()
+
+        # the output goes to a file, as a killed solver's children could keep a pipe open
+        with open(outputPath, 'w') as outputFile:
+            try:
+                process = subprocess.Popen(command, stdout=outputFile, stderr=subprocess.DEVNULL)
+            except OSError as error:
+                raise ArgumentError('SAT solver failed ({}).'.format(error))
+
+            while True:
+                try:
+                    process.wait(timeout=0.05)
+                    break
+                except subprocess.TimeoutExpired:
+                    reason = budget and budget.get_exceeded_reason(0)
+                    if reason:
+                        process.kill()
+                        process.wait()
+                        stats['exceeded'] = reason
+                        return PAUSED, None
+
+        stats['solverTime'] = time.perf_counter() - startTime
+
+        with open(resultPath if os.path.exists(resultPath) else outputPath) as resultFile:
+            output = resultFile.read()
+
+    return _read_solver_output(output)
+
+
+def _read_solver_output(output):
+    """
+    Returns:
+        {tuple} -- status and the model (or None) read from the output of a SAT solver
+
+    Raises:
+        ArgumentError: SAT solver failed.
+    """
+
+    status = None
+    model = []
+    for line in output.splitlines():
+        parts = line.split()
+        if not parts:
+            continue
+
+        if parts[0] == 's':
+            parts = parts[1:]
+        elif parts[0] == 'v':
+            model += [int(literal) for literal in parts[1:]]
+            continue
+
+        if parts and parts[0] in ('SATISFIABLE', 'SAT'):
+            status = SOLVED
+        elif parts and parts[0] in ('UNSATISFIABLE', 'UNSAT'):
+            status = UNSOLVABLE
+        elif status == SOLVED and parts[0].lstrip('-').isdigit():
+            model += [int(literal) for literal in parts]
+
+    if status is None:
+        raise ArgumentError('SAT solver failed (no result in its output).')
+
+    return status, model if status == SOLVED else None
@@ -0,0 +1,492 @@
+"""
+Module containing a small HTTP service solving boards (python -m sudoku serve)
+
+    POST /solve -- body is a board in the shape the suGOku API uses ({"board": [[...], ...]}),
+                   a board (list of lists) or a list of either of them.
+                   Returns {"solution": [[...], ...] or null, "status": "solved", "unsolvable", "exceeded" or "error",
+                   "stats": {...}} (or a list of those if a list of boards was posted).
+                   Query params: strategy (default: bitmask), timeout (seconds) and maxNodes (limits of every board's
+                   search, they can only lower the limits the service was started with)
+    GET /health -- returns {"status": "ok"} and the batching stats
+
+    Boards posted at the same time are collected into small batches, which are solved in a pool of processes.
+
+    Main methods:
+        SolveService -- collects boards into batches and solves them in a pool of processes
+        serve -- runs the HTTP service
+        run_load_test -- sends many concurrent requests to a running service and measures it
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+import urllib.request
+from functools import partial
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from sudoku.sudokuboard import strategies
+from sudoku.sudokubatch import solve_board
+from sudoku.sudokucache import SolutionCache
+from sudoku.sudokuexceptions import ArgumentError, BoardError
+from sudoku.sudokukernel import board_to_cells, cells_to_board
+
+# boards are already solved in many processes at once, so every one of them is solved by a single process
+serviceStrategies = tuple([strategy for strategy in strategies if strategy != 'parallel'])
+
+
+class SolveService:
+    """
+    Collects boards submitted by many threads into batches and solves them in a pool of processes.
+    A batch is dispatched when it has batchSize boards or batchWindow seconds have passed since its first board.
+
+        Keyword Arguments:
+            workers {int} -- number of processes solving the boards (default: {None} (cpu count))
+            batchSize {int} -- max number of boards in a batch (default: {64})
+            batchWindow {float} -- max time (in seconds) a board waits for its batch to fill (default: {0.005})
+            cacheSize {int} -- max number of solutions kept in the cache, 0 turns it off (default: {0})
+            cachePath {str} -- file the cache is loaded from and saved to when the service stops (default: {None})
+            solveTimeout {float} -- seconds the search of every board can take (default: {None} (no limit))
+            maxNodes {int} -- nums the search of every board can place (default: {None} (no limit))
+
+        Raises:
+            ArgumentError: batchSize must be positive.
+    """
+
+    def __init__(self, workers=None, batchSize=64, batchWindow=0.005, cacheSize=0, cachePath=None,
+                 solveTimeout=None, maxNodes=None):
+        if batchSize < 1:
+            raise ArgumentError('batchSize must be positive.')
+
+        self.batchSize = batchSize
+        self.batchWindow = batchWindow
+        self.solveTimeout = solveTimeout
+        self.maxNodes = maxNodes
+
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(self.workers)
+
+        self._jobs = queue.Queue()
+        self._batcher = threading.Thread(target=self._run_batcher, daemon=True)
+
+        self.stats = {'boards': 0, 'batches': 0, 'cached': 0}
+        self._statsLock = threading.Lock()
+
+        # boards found in the cache never reach the batcher
+        self.cache = SolutionCache(cacheSize, cachePath) if cacheSize else None
+        self._cacheLock = threading.Lock()
+
+    def start(self):
+        self._batcher.start()
+
+    def stop(self):
+        """
+        Stops the batcher and the pool of processes (boards already submitted are still solved).
+        """
+
+        self._jobs.put(None)
+        self._batcher.join()
+        self._pool.shutdown()
+
+        if self.cache is not None and self.cache.path:
+            with self._cacheLock:
+                self.cache.save()
+
+    def submit(self, boards, strategy='bitmask', solveTimeout=None, maxNodes=None):
+        """
+        Submits boards to be solved.
+
+        Arguments:
+            boards {list of tuples of lists}
+
+        Keyword Arguments:
+            strategy {str} -- strategy used by SudokuBoard.solve (default: {'bitmask'})
+            solveTimeout {float} -- seconds the search of every board can take, it can't exceed the service's limit
+            (default: {None} (the service's limit))
+            maxNodes {int} -- nums the search of every board can place, it can't exceed the service's limit
+            (default: {None} (the service's limit))
+
+        Raises:
+            ArgumentError: Incorrect strategy.
+
+        Returns:
+            {list of Futures} -- every future's result is a tuple of the solved board (or None) and the stats
+        """
+
+        if strategy not in serviceStrategies:
+            raise ArgumentError('Incorrect strategy ({}).'.format(', '.join(serviceStrategies)))
+
+        solveTimeout = _lower_limit(self.solveTimeout, solveTimeout)
+        maxNodes = _lower_limit(self.maxNodes, maxNodes)
+
+        futures = []
+        for board in boards:
+            future = Future()
+            futures.append(future)
+
+            if self.cache is not None:
+                try:
+                    cells = board_to_cells(board)
+                except ValueError:
+                    # incorrect boards get their error from the solver
+                    cells = None
+
+                if cells is not None:
+                    with self._cacheLock:
+                        solution = self.cache.lookup(cells, len(board))
+
+                    if solution is not None:
+                        with self._statsLock:
+                            self.stats['cached'] += 1
+                        future.set_result((cells_to_board(solution, len(board)) if solution else None,
+                                           {'nodes': 0, 'backtracks': 0, 'strategy': strategy, 'cached': True}))
+                        continue
+
+                    future.add_done_callback(partial(self._store_in_cache, cells, len(board)))
+
+            self._jobs.put((board, strategy, solveTimeout, maxNodes, future))
+
+        return futures
+
+    def solve(self, boards, strategy='bitmask', timeout=None, solveTimeout=None, maxNodes=None):
+        """
+        Submits boards and waits for their solutions (timeout is the time waited for every result,
+        see submit for the rest).
+
+        Returns:
+            {list of tuples} -- the solved board (or None) and the stats for every board
+        """
+
+        return [future.result(timeout)
+                for future in self.submit(boards, strategy, solveTimeout, maxNodes)]
+
+    def _store_in_cache(self, cells, size, future):
+        if future.exception():
+            return
+
+        solution, stats = future.result()
+        if 'error' in stats or 'exceeded' in stats:
+            return
+
+        with self._cacheLock:
+            self.cache.store(cells, size, solution and board_to_cells(solution))
+
+    def _run_batcher(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+
+            batch = [job]
+            deadline = time.perf_counter() + self.batchWindow
+            stopping = False
+            while len(batch) < self.batchSize:
+                try:
+                    job = self._jobs.get(timeout=max(0, deadline - time.perf_counter()))
+                except queue.Empty:
+                    break
+
+                if job is None:
+                    stopping = True
+                    break
+
+                batch.append(job)
+
+            self._dispatch(batch)
+
+            if stopping:
+                return
+
+    def _dispatch(self, batch):
+        """
+        Splits the batch between the processes.
+
+        Arguments:
+            batch {list of tuples} -- (board, strategy, solveTimeout, maxNodes, future)
+        """
+
+        with self._statsLock:
+            self.stats['boards'] += len(batch)
+            self.stats['batches'] += 1
+
+        chunkCount = min(self.workers, len(batch))
+        for chunkI in range(chunkCount):
+            chunk = batch[chunkI::chunkCount]
+
+            poolFuture = self._pool.submit(_solve_chunk, [job[:-1] for job in chunk])
+            poolFuture.add_done_callback(_ChunkCallback([job[-1] for job in chunk]))
+
+
+class _ChunkCallback:
+    """
+    Passes the results of a solved chunk to the futures of its boards
+    """
+
+    def __init__(self, futures):
+        self.futures = futures
+
+    def __call__(self, poolFuture):
+        error = poolFuture.exception()
+        if error:
+            for future in self.futures:
+                future.set_exception(error)
+            return
+
+        for future, result in zip(self.futures, poolFuture.result()):
+            future.set_result(result)
+
+
+def _lower_limit(limit, requestedLimit):
+    """
+    Returns:
+        {number} -- the lower of the two limits (None meaning no limit)
+    """
+
+    if limit is None:
+        return requestedLimit
+    if requestedLimit is None:
+        return limit
+
+    return min(limit, requestedLimit)
+
+
+def _solve_chunk(jobs):
+    """
+    Solves boards in a worker process.
+
+    Arguments:
+        jobs {list of tuples} -- (board, strategy, solveTimeout, maxNodes)
+
+    Returns:
+        {list of tuples} -- the solved board (or None) and the stats (or the error) for every board
+    """
+
+    results = []
+    for board, strategy, solveTimeout, maxNodes in jobs:
+        try:
+            results.append(solve_board(board, strategy, timeout=solveTimeout, maxNodes=maxNodes))
+        except BoardError as error:
+            results.append((None, {'error': error.message}))
+
+    return results
+
+
+class SolveRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles the requests of the service (the SolveService is stored in the server).
+    """
+
+    def do_GET(self):
+        if urlparse(self.path).path == '/health':
+            self._send_json(200, {'status': 'ok', 'stats': self.server.solveService.stats})
+        else:
+            self._send_json(404, {'error': 'Not found.'})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != '/solve':
+            self._send_json(404, {'error': 'Not found.'})
+            return
+
+        query = parse_qs(url.query)
+        strategy = query.get('strategy', ['bitmask'])[0]
+
+        try:
+            solveTimeout = float(query['timeout'][0]) if 'timeout' in query else None
+            maxNodes = int(query['maxNodes'][0]) if 'maxNodes' in query else None
+
+            length = int(self.headers.get('Content-Length', 0))
+            data = json.loads(self.rfile.read(length))
+            boards, isList = read_request_boards(data)
+            results = self.server.solveService.solve(boards, strategy, solveTimeout=solveTimeout, maxNodes=maxNodes)
+        except (ValueError, BoardError, ArgumentError) as error:
+            self._send_json(400, {'error': getattr(error, 'message', None) or str(error)})
+            return
+
+        responses = [make_response(solution, stats) for solution, stats in results]
+        self._send_json(200, responses if isList else responses[0])
+
+    def log_message(self, format, *args):
+        # a request per line would slow down the service under load
+        pass
+
+    def _send_json(self, code, data):
+        body = json.dumps(data).encode()
+
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def read_request_boards(data):
+    """
+    Reads boards from the body of a request.
+
+    Arguments:
+        data {any} -- {"board": [...]}, a board or a list of either of them
+
+    Raises:
+        BoardError: Request must contain a board or a list of boards.
+
+    Returns:
+        {tuple} -- list of boards (with '0' meaning an empty spot) and whether a list was posted
+    """
+
+    isList = isinstance(data, list) and bool(data) and (isinstance(data[0], dict) or
+                                                       (isinstance(data[0], list) and bool(data[0]) and
+                                                        isinstance(data[0][0], list)))
+    if not isList:
+        data = [data]
+
+    boards = []
+    for board in data:
+        if isinstance(board, dict):
+            board = board.get('board')
+
+        if not isinstance(board, list) or not board or not all(isinstance(row, list) for row in board):
+            raise BoardError('Request must contain a board or a list of boards.')
+
+        boards.append(tuple([['0' if element in (None, '', '.') else str(element) for element in row]
+                             for row in board]))
+
+    return boards, isList
+
+
+def make_response(solution, stats):
+    """
+    Returns the response for a single board (solution in the suGOku API shape).
+
+    Arguments:
+        solution {tuple of lists} -- the solved board or None
+        stats {dict} -- stats of solving it (or the error)
+
+    Returns:
+        {dict}
+    """
+
+    if 'error' in stats:
+        return {'solution': None, 'status': 'error', 'error': stats['error']}
+    if 'exceeded' in stats:
+        return {'solution': None, 'status': 'exceeded', 'stats': stats}
+
+    return {'solution': [[int(num) for num in row] for row in solution] if solution else None,
+            'status': 'solved' if solution else 'unsolvable',
+            'stats': stats}
+
+
+def serve(host='127.0.0.1', port=8080, workers=None, batchSize=64, batchWindow=0.005, cacheSize=0, cachePath=None,
+          solveTimeout=None, maxNodes=None):
+    """
+    Runs the HTTP service until it's interrupted.
+
+    Keyword Arguments:
+        host {str} -- (default: {'127.0.0.1'})
+        port {int} -- (default: {8080})
+        workers {int} -- number of processes solving the boards (default: {None} (cpu count))
+        batchSize {int} -- max number of boards in a batch (default: {64})
+        batchWindow {float} -- max time (in seconds) a board waits for its batch to fill (default: {0.005})
+        cacheSize {int} -- max number of solutions kept in the cache, 0 turns it off (default: {0})
+        cachePath {str} -- file the cache is loaded from and saved to when the service stops (default: {None})
+        solveTimeout {float} -- seconds the search of every board can take (default: {None} (no limit))
+        maxNodes {int} -- nums the search of every board can place (default: {None} (no limit))
+    """
+
+    service = SolveService(workers, batchSize, batchWindow, cacheSize, cachePath, solveTimeout, maxNodes)
+    service.start()
+
+    server = ThreadingHTTPServer((host, port), SolveRequestHandler)
+    server.daemon_threads = True
+    server.solveService = service
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
+
+
+def run_load_test(url, boards, requestCount=1000, concurrency=16, boardsPerRequest=1):
+    """
+    Sends requests to a running service from many threads at once and measures it.
+
+    Arguments:
+        url {str} -- url of the service (e.g. 'http://127.0.0.1:8080')
+        boards {list of tuples of lists} -- boards sent in the requests (round robin)
+
+    Keyword Arguments:
+        requestCount {int} -- number of requests (default: {1000})
+        concurrency {int} -- number of threads sending the requests (default: {16})
+        boardsPerRequest {int} -- number of boards in every request (default: {1})
+
+    Raises:
+        ArgumentError: No boards to send.
+
+    Returns:
+        {dict} -- requests, errors, seconds, requestsPerSecond, boardsPerSecond and latency percentiles (in ms)
+    """
+
+    if not boards:
+        raise ArgumentError('No boards to send.')
+
+    solveURL = url.rstrip('/') + '/solve'
+    bodies = []
+    for requestI in range(min(requestCount, len(boards))):
+        requestBoards = [{'board': [[int(element) for element in row] for row in boards[(requestI + boardI) % len(boards)]]}
+                         for boardI in range(boardsPerRequest)]
+        bodies.append(json.dumps(requestBoards if boardsPerRequest > 1 else requestBoards[0]).encode())
+
+    latencies = []
+    errors = [0]
+    counter = iter(range(requestCount))
+    lock = threading.Lock()
+
+    def send_requests():
+        while True:
+            with lock:
+                requestI = next(counter, None)
+            if requestI is None:
+                return
+
+            request = urllib.request.Request(solveURL, bodies[requestI % len(bodies)],
+                                             {'Content-Type': 'application/json'})
+            startTime = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request) as response:
+                    response.read()
+            except OSError:
+                with lock:
+                    errors[0] += 1
+                continue
+
+            with lock:
+                latencies.append(time.perf_counter() - startTime)
+
+    startTime = time.perf_counter()
+    threads = [threading.Thread(target=send_requests) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - startTime
+
+    latencies.sort()
+
+    def percentile(fraction):
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000
+
+    return {'requests': requestCount,
+            'errors': errors[0],
+            'seconds': seconds,
+            'requestsPerSecond': len(latencies) / seconds,
+            'boardsPerSecond': len(latencies) * boardsPerRequest / seconds,
+            'latencyP50': percentile(0.5),
+            'latencyP95': percentile(0.95),
+            'latencyP99': percentile(0.99)}
@@ -0,0 +1,185 @@
+"""
+Module containing Board, a small immutable board which can be hashed (used in sets and as dict keys)
+
+    The spots are kept in a single bytes object (row by row, 0 meaning an empty spot),
+    so a 9x9 board takes around a hundred bytes instead of a tuple of lists of strings.
+    SudokuBoard accepts a Board in place of a tuple of lists, and SudokuBoard.to_value converts it back.
+"""
+
+from sudoku.sudokuexceptions import BoardError
+from sudoku.sudokukernel import board_to_cells
+
+
+class Board:
+    """
+    Immutable board kept as bytes.
+
+        Arguments:
+            cells {bytes or iterable of ints} -- board row by row, 0 meaning an empty spot
+
+        Keyword Arguments:
+            size {int} -- length of the board's side (default: {None} (computed from the cell count))
+
+        Raises:
+            BoardError: Board's spot count must be a square.
+            BoardError: Num in board out of range.
+    """
+
+    __slots__ = ('_cells', '_size', '_hash')
+
+    def __init__(self, cells, size=None):
+        try:
+            cells = bytes(cells)
+        except ValueError:
+            # a negative num or one that doesn't fit a byte
+            raise BoardError('Num in board out of range.')
+
+        if size is None:
+            size = int(round(len(cells) ** 0.5))
+        if size * size != len(cells):
+            raise BoardError("Board's spot count must be a square.")
+        if cells and max(cells) > size:
+            raise BoardError('Num in board out of range.')
+
+        object.__setattr__(self, '_cells', cells)
+        object.__setattr__(self, '_size', size)
+        object.__setattr__(self, '_hash', None)
+
+    @classmethod
+    def from_rows(cls, rows, emptySpotChar='0', constMarker='$'):
+        """
+        Makes a Board out of a tuple of lists of strings (like SudokuBoard.board).
+
+        Arguments:
+            rows {tuple of lists} -- the tuple contains lists(rows), and the lists contain the actual elements
+
+        Keyword Arguments:
+            emptySpotChar {char} -- char meaning the spot is empty (default: {'0'})
+            constMarker {char} -- char marking constant nums, it's ignored (default: {'$'})
+
+        Returns:
+            {Board}
+        """
+
+        return cls(board_to_cells(rows, emptySpotChar, constMarker), len(rows))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('Board is immutable.')
+
+    def __delattr__(self, name):
+        raise AttributeError('Board is immutable.')
+
+    def __reduce__(self):
+        return Board, (self._cells, self._size)
+
+    def __eq__(self, other):
+        if not isinstance(other, Board):
+            return NotImplemented
+
+        return self._size == other._size and self._cells == other._cells
+
+    def __hash__(self):
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hash((self._size, self._cells)))
+
+        return self._hash
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        """
+        Yields the rows as tuples of ints.
+        """
+
+        size = self._size
+        for rowI in range(size):
+            yield tuple(self._cells[rowI * size:(rowI + 1) * size])
+
+    def __repr__(self):
+        return 'Board({!r}, {})'.format(self._cells, self._size)
+
+    def __str__(self):
+        return '\n'.join([' '.join([str(num) for num in row]) for row in self])
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def cells(self):
+        """
+        {bytes} -- the board row by row, 0 meaning an empty spot
+        """
+
+        return self._cells
+
+    def cell(self, rowI, elementI):
+        """
+        Raises:
+            BoardError: Spot out of board.
+
+        Returns:
+            {int} -- num in the given spot (0 if it's empty)
+        """
+
+        return self._cells[self._get_spot(rowI, elementI)]
+
+    def with_cell(self, rowI, elementI, num):
+        """
+        Returns a copy of the board with a different num in the given spot (the board itself doesn't change).
+
+        Arguments:
+            rowI {int}
+            elementI {int}
+            num {int} -- 0 empties the spot
+
+        Raises:
+            BoardError: Spot out of board.
+            BoardError: Num in board out of range.
+
+        Returns:
+            {Board}
+        """
+
+        spot = self._get_spot(rowI, elementI)
+
+        if num < 0 or num > self._size:
+            raise BoardError('Num in board out of range.')
+
+        if self._cells[spot] == num:
+            return self
+
+        cells = bytearray(self._cells)
+        cells[spot] = num
+
+        board = Board.__new__(Board)
+        object.__setattr__(board, '_cells', bytes(cells))
+        object.__setattr__(board, '_size', self._size)
+        object.__setattr__(board, '_hash', None)
+
+        return board
+
+    def _get_spot(self, rowI, elementI):
+        """
+        Returns:
+            {int} -- index of the spot in the cells (a too big elementI would be in the next row
+            and a negative one at the other end, so both are refused)
+        """
+
+        if not (0 <= rowI < self._size and 0 <= elementI < self._size):
+            raise BoardError('Spot out of board.')
+
+        return rowI * self._size + elementI
+
+    def empty_spot_count(self):
+        return self._cells.count(0)
+
+    def to_rows(self, emptySpotChar='0'):
+        """
+        Returns:
+            {tuple of lists} -- the board as a tuple of lists of strings (like SudokuBoard.board)
+        """
+
+        return tuple([[str(num) if num else emptySpotChar for num in row]
+                      for row in self])
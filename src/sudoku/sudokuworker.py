@@ -0,0 +1,279 @@
+"""
+Module containing the class SolveWorker used to solve a board in the background
+and stream the steps through a bounded queue
+"""
+
+import time
+import queue
+import threading
+import multiprocessing
+from collections import deque
+from sudoku.sudokuboard import SudokuBoard
+from sudoku.sudokuexceptions import ArgumentError
+
+
+# how many steps a frame of solving step by step makes (see frame_is_over)
+stepPolicies = ('steps', 'time', 'forward')
+
+
+class SolveWorker:
+    """
+    Solves a board in a separate thread or process and puts its steps into a bounded queue.
+    When the queue is full the worker doesn't wait, it merges the steps (only the last change of
+    every spot is kept) and keeps solving at full speed.
+
+        Arguments:
+            board {SudokuBoard} -- board to solve (it's copied, the original isn't changed)
+
+        Keyword Arguments:
+            mode {str} -- 'thread' or 'process' (default: {'thread'})
+            queueSize {int} -- max number of batches waiting in the queue (default: {64})
+            batchSize {int} -- steps made before the worker tries to put a batch into the queue (default: {256})
+
+        Raises:
+            ArgumentError: Incorrect mode ('thread' or 'process').
+            ArgumentError: queueSize and batchSize must be positive.
+            ArgumentError: Solving step by step doesn't support constraints.
+    """
+
+    def __init__(self, board, mode='thread', queueSize=64, batchSize=256):
+        if mode not in ('thread', 'process'):
+            raise ArgumentError("Incorrect mode ('thread' or 'process').")
+        if queueSize < 1 or batchSize < 1:
+            raise ArgumentError('queueSize and batchSize must be positive.')
+
+        # checked here, so it doesn't just end the worker without a step
+        if board.constraints:
+            raise ArgumentError("Solving step by step doesn't support constraints.")
+
+        self.mode = mode
+        self.batchSize = batchSize
+        self.finished = False
+
+        # only plain data is sent to the worker (the whole board definition, so it solves the same board)
+        self._boardArgs = board.to_args()
+
+        # steps taken from the queue, but not given to the GUI yet
+        self._steps = deque()
+        self._queueEnded = False
+
+        if mode == 'process':
+            self._stepQueue = multiprocessing.Queue(queueSize)
+            self._stopEvent = multiprocessing.Event()
+            self._worker = multiprocessing.Process(target=_solve_into_queue,
+                                                   args=(self._boardArgs, self._stepQueue,
+                                                         self._stopEvent, batchSize),
+                                                   daemon=True)
+        else:
+            self._stepQueue = queue.Queue(queueSize)
+            self._stopEvent = threading.Event()
+            self._worker = threading.Thread(target=_solve_into_queue,
+                                            args=(self._boardArgs, self._stepQueue,
+                                                  self._stopEvent, batchSize),
+                                            daemon=True)
+
+    def start(self):
+        """
+        Starts solving in the background
+        """
+
+        self._worker.start()
+
+    def stop(self, timeout=1):
+        """
+        Stops the worker and waits for it to finish.
+
+        Keyword Arguments:
+            timeout {float} -- how long to wait for the worker (in seconds) (default: {1})
+        """
+
+        self._stopEvent.set()
+
+        # the worker might be waiting for a free spot in the queue
+        self._drain_queue()
+        self._worker.join(timeout)
+
+        if self.mode == 'process' and self._worker.is_alive():
+            self._worker.terminate()
+
+        self._steps.clear()
+        self.finished = True
+
+    def is_alive(self):
+        return self._worker.is_alive()
+
+    def get_steps(self, policy=None, steps=1, timeBudget=15):
+        """
+        Takes the steps the worker has made (it never blocks), as many as the policy allows in a single frame,
+        the same way the GUI advances a solver running inline (see frame_is_over).
+        finished is set once the last step is taken.
+
+        Keyword Arguments:
+            policy {str} -- 'steps', 'time' or 'forward' (default: {None} (every step waiting))
+            steps {int} -- steps taken with the 'steps' policy (default: {1})
+            timeBudget {float} -- ms spent taking steps with the 'time' policy (default: {15})
+
+        Raises:
+            ArgumentError: Incorrect stepPolicy ('steps', 'time' or 'forward').
+
+        Returns:
+            {dict} -- {(row index, element index): (num or emptySpotChar, isValid)} the last change of every spot
+        """
+
+        if policy is not None and policy not in stepPolicies:
+            raise ArgumentError("Incorrect stepPolicy ('steps', 'time' or 'forward').")
+
+        deadline = time.perf_counter() + timeBudget / 1000
+
+        changes = {}
+        stepCount = 0
+        while self._steps or self._take_batch():
+            rowI, elementI, num, isValid = self._steps.popleft()
+            changes[(rowI, elementI)] = (num, isValid)
+            stepCount += 1
+
+            if policy is not None and frame_is_over(policy, stepCount, steps, deadline, isValid):
+                break
+
+        if self._queueEnded and not self._steps:
+            self.finished = True
+
+        return changes
+
+    def _take_batch(self):
+        """
+        Takes the next batch of steps waiting in the queue.
+
+        Returns:
+            {bool} -- whether there was one
+        """
+
+        while not self._queueEnded:
+            # checked before taking the batch, so everything a dead worker has put is already in the queue
+            workerDead = not self._worker.is_alive()
+
+            try:
+                batch = self._stepQueue.get_nowait()
+            except queue.Empty:
+                # the worker died without sending None (e.g. its process was killed)
+                if workerDead:
+                    self._queueEnded = True
+                return False
+
+            # the worker has finished
+            if batch is None:
+                self._queueEnded = True
+                return False
+
+            # the last batch can be empty
+            if batch:
+                self._steps.extend(batch)
+                return True
+
+        return False
+
+    def _drain_queue(self):
+        while True:
+            try:
+                self._stepQueue.get_nowait()
+            except queue.Empty:
+                return
+
+
+def frame_is_over(policy, stepCount, steps, deadline, isValid):
+    """
+    Tells whether a frame of solving step by step has made enough steps. Used by the GUI for a solver
+    running inline and by SolveWorker.get_steps, so every solverMode keeps to the policy the same way.
+
+    Policies:
+        steps -- the given number of steps
+        time -- steps until the deadline passes (always at least one)
+        forward -- steps until the solver places a num (skips the backtracking)
+
+    Arguments:
+        policy {str} -- 'steps', 'time' or 'forward'
+        stepCount {int} -- steps made in the frame so far
+        steps {int} -- steps of a frame with the 'steps' policy
+        deadline {float} -- time.perf_counter() at which a frame with the 'time' policy ends
+        isValid {bool} -- whether the last step went forward
+
+    Returns:
+        {bool}
+    """
+
+    if policy == 'steps':
+        return stepCount >= steps
+    elif policy == 'time':
+        return time.perf_counter() >= deadline
+    else:
+        return isValid
+
+
+def _solve_into_queue(boardArgs, stepQueue, stopEvent, batchSize):
+    """
+    Solves the board and puts its steps (in batches) into stepQueue, used as the worker's target.
+    The last item put into the queue is None (also if the solving raises), unless the worker was stopped.
+
+    Arguments:
+        boardArgs {tuple} -- arguments of SudokuBoard (see SudokuBoard.to_args)
+        stepQueue {queue} -- bounded queue for the steps
+        stopEvent {event} -- when set, the worker stops
+        batchSize {int} -- steps made before trying to put a batch into the queue
+    """
+
+    try:
+        board = SudokuBoard(*boardArgs)
+
+        pending = []
+        stepCount = 0
+        for step in board.gen_solving_deltas():
+            pending.append(step)
+            stepCount += 1
+
+            if stepCount % batchSize == 0:
+                if stopEvent.is_set():
+                    return
+
+                try:
+                    stepQueue.put_nowait(tuple(pending))
+                except queue.Full:
+                    # the GUI fell behind, only the last change of every spot is kept and the solving goes on
+                    pending = list({(rowI, elementI): (rowI, elementI, num, isValid)
+                                    for rowI, elementI, num, isValid in pending}.values())
+                    continue
+                else:
+                    pending = []
+
+        _put_until_stopped(stepQueue, tuple(pending), stopEvent)
+    finally:
+        # the GUI waits for None to leave the solving mode
+        _put_until_stopped(stepQueue, None, stopEvent)
+
+        if stopEvent.is_set():
+            _cancel_queue(stepQueue)
+
+
+def _put_until_stopped(stepQueue, item, stopEvent):
+    """
+    Puts the item into the queue, waiting for a free spot until stopEvent is set.
+    """
+
+    while not stopEvent.is_set():
+        try:
+            stepQueue.put(item, timeout=0.1)
+        except queue.Full:
+            continue
+        else:
+            return
+
+
+def _cancel_queue(stepQueue):
+    """
+    Makes a stopped process exit without waiting for its queue to be emptied.
+
+    Arguments:
+        stepQueue {queue}
+    """
+
+    if hasattr(stepQueue, 'cancel_join_thread'):
+        stepQueue.cancel_join_thread()
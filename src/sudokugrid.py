@@ -1,4 +1,5 @@
 import pygame
+from array import array
 from sudoku.sudokuboard import SudokuBoard
 from sudoku.sudokuexceptions import ArgumentError
 from grid import Grid, Cell
@@ -40,6 +41,8 @@ class SudokuGrid(Grid):
             board = tuple([[] for _ in range(9)])
         self.board = board
 
+        self.gridSnapshot = self.take_snapshot()
+
 
     @staticmethod
     def create_grid(position: list, size: list,
@@ -103,6 +106,31 @@ class SudokuGrid(Grid):
 
                 pygame.draw.rect(display, outlineColor, rect, 1)
 
+    def take_snapshot(self) -> tuple:
+        """
+        Returns the mutable state of every cell (its color, text and text color) in a compact form,
+        which can be restored in place with restore_snapshot
+        """
+
+        colors = super().take_snapshot()[0]
+        textColors = array('B')
+        for row in self:
+            for cell in row:
+                textColors.extend(cell.textColor[:3])
+
+        texts = tuple([cell.text
+                       for row in self
+                       for cell in row])
+
+        return (colors, texts, textColors)
+
+    def restore_cell_snapshot(self, cell: Cell, cellI: int, snapshot: tuple):
+        super().restore_cell_snapshot(cell, cellI, snapshot)
+
+        texts = snapshot[1]
+        textColors = snapshot[2]
+        cell.change_text(texts[cellI], list(textColors[cellI * 3:cellI * 3 + 3]))
+
     def update_board(self):
         self.change_board(self.board)
 
@@ -156,6 +184,12 @@ class SudokuCell(Cell):
         if len(newText) > self.maxTextLength:
             raise ArgumentError('Text length higher than max text length ({})'.format(self.maxTextLength))
 
+        # rendering is the expensive part, so nothing is done if nothing changes
+        if (hasattr(self, 'renderedText') and newText == self.text and
+           (not newTextColor or list(newTextColor) == list(self.textColor)) and
+           (not newAlign or newAlign == self.align)):
+            return
+
         self.text = newText
         if newTextColor:
             self.textColor = newTextColor
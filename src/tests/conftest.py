@@ -0,0 +1,9 @@
+"""
+Configuration of the tests (python -m pytest tests, run from /src)
+"""
+
+import os
+import sys
+
+# the sudoku package is next to this directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
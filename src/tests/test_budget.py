@@ -0,0 +1,98 @@
+"""
+Tests of the budgets of SudokuBoard.solve: every strategy stops with a falsy BudgetExceeded for every reason
+and leaves the board as it was
+"""
+
+import random
+import threading
+
+import pytest
+
+from sudoku import sudokusamples
+from sudoku.sudokubudget import CANCELLED, NODES, TIMEOUT, BudgetExceeded, CancelToken
+from sudoku.sudokuboard import SudokuBoard, strategies
+from sudoku.sudokukernel import iter_solutions
+
+
+def _copy_board(board):
+    return tuple([list(row) for row in board])
+
+
+def _cancelled_token():
+    cancelToken = CancelToken()
+    cancelToken.cancel()
+
+    return cancelToken
+
+
+# limits of solve exceeded right away, by the reason they give
+limits = {NODES: lambda: {'maxNodes': 3}, TIMEOUT: lambda: {'timeout': 0},
+          CANCELLED: lambda: {'cancelToken': _cancelled_token()}}
+
+
+@pytest.fixture(scope='module')
+def hardBoard():
+    """
+    Returns:
+        {tuple of lists} -- a 36x36 board with half the spots given, no strategy solves it in seconds
+    """
+
+    size = 36
+    rng = random.Random(0)
+
+    firstRow = list(range(1, size + 1))
+    rng.shuffle(firstRow)
+    solution = next(iter_solutions(firstRow + [0] * (size * size - size), size))
+    clueSpots = set(rng.sample(range(size * size), size * size // 2))
+
+    return tuple([[str(solution[rowI * size + colI]) if rowI * size + colI in clueSpots else '0'
+                   for colI in range(size)] for rowI in range(size)])
+
+
+def _assert_exceeded(sudokuBoard, board, solution, reason):
+    assert not solution
+    assert isinstance(solution, BudgetExceeded)
+    assert solution.reason == reason
+    assert solution.stats is sudokuBoard.solveStats
+    assert sudokuBoard.solveStats['exceeded'] == reason
+
+    # the board is left as it was
+    assert sudokuBoard.board == board
+
+
+# boards every strategy needs more than a few nodes for (SAT solves some by propagation alone)
+@pytest.mark.parametrize('name', ['boards9[0]', 'boards9[4]', 'boards12[0]'])
+@pytest.mark.parametrize('reason', list(limits))
+@pytest.mark.parametrize('strategy', strategies)
+def test_budget_exceeded(strategy, reason, name):
+    samples, boardI = name[:-1].split('[')
+    board = getattr(sudokusamples, samples)[int(boardI)]
+
+    sudokuBoard = SudokuBoard(_copy_board(board))
+    _assert_exceeded(sudokuBoard, board, sudokuBoard.solve(strategy=strategy, **limits[reason]()), reason)
+
+
+@pytest.mark.parametrize('strategy', strategies)
+def test_cancel_while_solving(strategy, hardBoard):
+    cancelToken = CancelToken()
+    timer = threading.Timer(0.2, cancelToken.cancel)
+    timer.start()
+
+    sudokuBoard = SudokuBoard(_copy_board(hardBoard))
+    try:
+        solution = sudokuBoard.solve(strategy=strategy, cancelToken=cancelToken)
+    finally:
+        timer.cancel()
+
+    _assert_exceeded(sudokuBoard, hardBoard, solution, CANCELLED)
+
+
+def test_budget_not_exceeded():
+    board = sudokusamples.boards9[1]
+
+    sudokuBoard = SudokuBoard(_copy_board(board))
+    solution = sudokuBoard.solve(True, 'bitmask', timeout=60, maxNodes=10 ** 6, cancelToken=CancelToken())
+
+    assert solution
+    assert 'exceeded' not in sudokuBoard.solveStats
+    assert sudokuBoard.board == board
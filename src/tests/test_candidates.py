@@ -0,0 +1,125 @@
+"""
+Tests of CandidateGrid: after any sequence of place, remove and eliminate its candidates must be the ones
+computed from scratch
+"""
+
+import random
+
+import pytest
+
+from sudoku.sudokucandidates import CandidateGrid
+from sudoku.sudokuexceptions import BoardError
+from sudoku.sudokukernel import iter_solutions
+
+# operations made on every grid
+operationCount = 400
+
+
+def _assert_candidates(grid, eliminatedMasks):
+    size = grid.size
+    cells = grid.cells
+
+    def nums_in(unit):
+        return {cells[spot] for spot in unit} - {0}
+
+    candidateMasks = []
+    for spot in range(size * size):
+        if cells[spot]:
+            candidateMasks.append(0)
+            continue
+
+        placed = nums_in(grid.rows[grid.rowOf[spot]]) | nums_in(grid.cols[grid.colOf[spot]]) | \
+            nums_in(grid.boxes[grid.boxOf[spot]])
+        candidateMasks.append(sum(1 << (num - 1) for num in range(1, size + 1)
+                                  if num not in placed and not eliminatedMasks[spot] >> (num - 1) & 1))
+
+    assert grid.candidateMasks == candidateMasks
+    assert grid.emptyCount == cells.count(0)
+
+    for unitI, unit in enumerate(grid.units):
+        assert grid.unitMasks[unitI] == sum(1 << (num - 1) for num in nums_in(unit))
+
+        for num in range(1, size + 1):
+            assert grid.cells_with_candidate(unitI, num) == sum(
+                1 << spotI for spotI, spot in enumerate(unit) if candidateMasks[spot] >> (num - 1) & 1)
+
+    if any(not cells[spot] and not candidateMasks[spot] for spot in range(size * size)):
+        assert grid.contradiction
+
+
+def _allowed_nums(grid, spot):
+    # nums no peer holds (a num twice in a unit is a contradiction, which the grid only flags)
+    return [num for num in range(1, grid.size + 1) if all(grid.cells[peer] != num for peer in grid.peers[spot])]
+
+
+@pytest.mark.parametrize('size, seed', [(4, 0), (6, 1), (9, 2), (9, 3), (12, 4)])
+def test_random_operations(size, seed):
+    rng = random.Random(seed)
+
+    firstRow = list(range(1, size + 1))
+    rng.shuffle(firstRow)
+    solution = next(iter_solutions(firstRow + [0] * (size * size - size), size))
+    cells = [num if rng.random() < 0.3 else 0 for num in solution]
+
+    grid = CandidateGrid(cells, size)
+    eliminatedMasks = [0] * (size * size)
+    _assert_candidates(grid, eliminatedMasks)
+
+    for _ in range(operationCount):
+        operation = rng.choice(('place', 'set', 'remove', 'clear', 'eliminate'))
+        spot = rng.randrange(size * size)
+        rowI, elementI = divmod(spot, size)
+
+        if operation in ('place', 'set'):
+            if operation == 'place' and grid.cells[spot]:
+                continue
+
+            if operation == 'set':
+                # set takes the num out first, so it doesn't count against the new one
+                grid.remove(spot)
+
+            nums = _allowed_nums(grid, spot)
+            if not nums:
+                continue
+
+            if operation == 'place':
+                grid.place(spot, rng.choice(nums))
+            else:
+                grid.set(rowI, elementI, rng.choice(nums))
+
+        elif operation == 'remove':
+            grid.remove(spot)
+
+        elif operation == 'clear':
+            grid.clear(rowI, elementI)
+
+        else:
+            spots = rng.sample(range(size * size), rng.randint(1, size))
+            mask = rng.randrange(1, 1 << size)
+
+            # only the candidates stay eliminated, a num of a peer comes back once it's removed
+            removedMasks = [grid.candidateMasks[spot] & mask for spot in spots]
+            assert grid.eliminate(spots, mask) == any(removedMasks)
+
+            for spot, removed in zip(spots, removedMasks):
+                eliminatedMasks[spot] |= removed
+
+        _assert_candidates(grid, eliminatedMasks)
+
+
+def test_place_on_taken_spot():
+    grid = CandidateGrid([1, 0, 0, 0] + [0] * 12, 4)
+    candidateMasks = list(grid.candidateMasks)
+
+    with pytest.raises(BoardError):
+        grid.place(0, 2)
+
+    assert grid.cells[0] == 1
+    assert grid.emptyCount == 15
+    assert grid.candidateMasks == candidateMasks
+
+    # set takes the old num out first
+    grid.set(0, 0, 2)
+    assert grid.cells[0] == 2
+    assert grid.emptyCount == 15
+    assert grid.candidates(0, 1) == 0b1101
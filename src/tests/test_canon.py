@@ -0,0 +1,119 @@
+"""
+Tests of the canonical form: boards transformed by random sudoku symmetries must share it
+"""
+
+import random
+
+import pytest
+
+from sudoku import sudokusamples
+from sudoku.sudokucanon import Transform, apply_transform, canonical_form, canonical_hash, invert_transform
+from sudoku.sudokukernel import board_to_cells, get_box_shape, iter_solutions
+
+# transforms tried for every board
+transformCount = 8
+
+
+def _random_transform(size, rng):
+    boxRows, boxCols = get_box_shape(size)
+
+    def random_order(groupSize):
+        groups = list(range(size // groupSize))
+        rng.shuffle(groups)
+
+        order = []
+        for groupI in groups:
+            lines = list(range(groupI * groupSize, (groupI + 1) * groupSize))
+            rng.shuffle(lines)
+            order += lines
+
+        return order
+
+    relabeling = list(range(1, size + 1))
+    rng.shuffle(relabeling)
+
+    return Transform(size, boxRows == boxCols and rng.random() < 0.5, random_order(boxRows), random_order(boxCols),
+                     [0] + relabeling)
+
+
+def _random_full_board(size, rng):
+    # a random first row makes the solver fill a different grid every time
+    firstRow = list(range(1, size + 1))
+    rng.shuffle(firstRow)
+
+    return next(iter_solutions(firstRow + [0] * (size * size - size), size))
+
+
+def _shifted_full_board(size):
+    # the most symmetric full grid, every band and stack is a shift of the first one
+    boxRows, boxCols = get_box_shape(size)
+
+    return [((rowI % boxRows) * boxCols + rowI // boxRows + colI) % size + 1
+            for rowI in range(size) for colI in range(size)]
+
+
+def _sparse_board(size, clueCount, rng):
+    fullBoard = apply_transform(_random_full_board(size, rng), _random_transform(size, rng))
+    clueSpots = set(rng.sample(range(size * size), clueCount))
+
+    return [num if spot in clueSpots else 0 for spot, num in enumerate(fullBoard)]
+
+
+def _assert_same_hash(cells, size, rng):
+    hashes = {canonical_hash(list(apply_transform(cells, _random_transform(size, rng))), size)
+              for _ in range(transformCount)}
+
+    assert hashes == {canonical_hash(cells, size)}
+
+
+@pytest.mark.parametrize('size', (4, 6, 9, 12, 16, 25))
+def test_full_boards(size):
+    rng = random.Random(size)
+
+    for _ in range(3):
+        _assert_same_hash(_random_full_board(size, rng), size, rng)
+
+
+@pytest.mark.parametrize('size', (9, 12, 16, 25))
+def test_shifted_full_boards(size):
+    _assert_same_hash(_shifted_full_board(size), size, random.Random(size))
+
+
+@pytest.mark.parametrize('size, clueCount', [(9, 3), (9, 17), (12, 5), (12, 30), (12, 60),
+                                             (16, 2), (16, 8), (16, 60), (16, 120)])
+def test_sparse_boards(size, clueCount):
+    rng = random.Random(size * 1000 + clueCount)
+
+    for _ in range(3):
+        _assert_same_hash(_sparse_board(size, clueCount, rng), size, rng)
+
+
+@pytest.mark.parametrize('name', ['boards9', 'boards12'])
+def test_sample_boards(name):
+    rng = random.Random(0)
+
+    for board in getattr(sudokusamples, name):
+        _assert_same_hash(board_to_cells(board), len(board), rng)
+
+
+def test_different_boards():
+    rng = random.Random(1)
+    cells = _sparse_board(9, 20, rng)
+
+    # one more clue can't be undone by any symmetry
+    emptySpot = cells.index(0)
+    fullBoard = next(iter_solutions(cells, 9))
+    moreCells = list(cells)
+    moreCells[emptySpot] = fullBoard[emptySpot]
+
+    assert canonical_hash(cells, 9) != canonical_hash(moreCells, 9)
+
+
+def test_invert_transform():
+    rng = random.Random(2)
+    cells = _sparse_board(16, 40, rng)
+
+    canonicalCells, transform = canonical_form(cells, 16)
+
+    assert canonicalCells == apply_transform(cells, transform)
+    assert invert_transform(canonicalCells, transform) == tuple(cells)
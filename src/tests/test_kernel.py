@@ -0,0 +1,89 @@
+"""
+Tests of the search kernel: the restarts mustn't lose or repeat solutions, and a saved search continues exactly
+"""
+
+import json
+import random
+
+import pytest
+
+from sudoku import sudokusamples
+from sudoku.sudokukernel import (KernelSolver, PAUSED, SOLVED, UNSOLVABLE, board_to_cells, get_box_shape,
+                                 iter_solutions)
+
+
+def _assert_solution(solution, cells, size):
+    boxRows, boxCols = get_box_shape(size)
+    nums = set(range(1, size + 1))
+
+    assert all(num == solution[spot] for spot, num in enumerate(cells) if num)
+    for lineI in range(size):
+        assert set(solution[lineI * size:(lineI + 1) * size]) == nums
+        assert set(solution[lineI::size]) == nums
+
+        rowI = lineI // (size // boxCols) * boxRows
+        colI = lineI % (size // boxCols) * boxCols
+        assert {solution[(rowI + i) * size + colI + j] for i in range(boxRows) for j in range(boxCols)} == nums
+
+
+def _all_solutions(cells, size, restartBase):
+    kernel = KernelSolver(cells, size, restartBase=restartBase)
+
+    solutions = []
+    while kernel.solve() == SOLVED:
+        solutions.append(tuple(kernel.cells))
+
+    return solutions
+
+
+@pytest.mark.parametrize('name', ['boards9', 'boards12', 'boards16', 'boards25'])
+def test_sample_boards(name):
+    for board in getattr(sudokusamples, name):
+        cells = board_to_cells(board)
+        kernel = KernelSolver(cells, len(board))
+
+        assert kernel.solve() == SOLVED
+        _assert_solution(kernel.cells, cells, len(board))
+
+
+def test_restarts_keep_every_solution():
+    rng = random.Random(0)
+    fullBoard = next(iter_solutions([0] * 81, 9))
+    clueSpots = set(rng.sample(range(81), 24))
+    cells = [num if spot in clueSpots else 0 for spot, num in enumerate(fullBoard)]
+
+    solutions = _all_solutions(cells, 9, None)
+    restartedSolutions = _all_solutions(cells, 9, 1)
+
+    assert len(solutions) > 1
+    assert len(set(restartedSolutions)) == len(restartedSolutions)
+    assert set(restartedSolutions) == set(solutions)
+
+
+def test_restarts_unsolvable():
+    cells = board_to_cells(sudokusamples.boards9[1])
+
+    # a num no solution has there, the search has to refute it
+    solution = next(iter_solutions(cells, 9))
+    spot = cells.index(0)
+    cells[spot] = solution[spot] % 9 + 1
+
+    kernel = KernelSolver(cells, 9, restartBase=1)
+    assert kernel.solve() == UNSOLVABLE
+
+
+def test_state_round_trip():
+    # the 25x25 sample is restarted a few times on the way
+    cells = board_to_cells(sudokusamples.boards25[1])
+
+    kernel = KernelSolver(cells, 25)
+    assert kernel.solve() == SOLVED
+    assert kernel.restarts
+
+    pausedKernel = KernelSolver(cells, 25)
+    while pausedKernel.solve(pausedKernel.nodes + 50) == PAUSED:
+        pausedKernel = KernelSolver.from_state(json.loads(json.dumps(pausedKernel.get_state())), 25)
+
+    assert pausedKernel.cells == kernel.cells
+    assert pausedKernel.get_stats() == kernel.get_stats()
+    assert pausedKernel.restarts == kernel.restarts
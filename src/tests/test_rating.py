@@ -0,0 +1,41 @@
+"""
+Tests of SudokuBoard.rate: it only returns the rating, the board and its difficulty stay as they were
+"""
+
+import pytest
+
+from sudoku import sudokusamples
+from sudoku.sudokuboard import SudokuBoard
+
+
+def _copy_board(board):
+    return tuple([list(row) for row in board])
+
+
+@pytest.mark.parametrize('boardI, label, hardest', [(1, 'easy', 'hidden single in line'),
+                                                    (3, 'medium', 'naked pair'),
+                                                    (4, 'expert', 'guessing')])
+@pytest.mark.parametrize('difficulty', ['N/A', 'easy', 'hard'])
+def test_rate(difficulty, boardI, label, hardest):
+    board = sudokusamples.boards9[boardI]
+    sudokuBoard = SudokuBoard(_copy_board(board), difficulty)
+
+    rating = sudokuBoard.rate()
+
+    assert rating['label'] == label
+    assert rating['hardest'] == hardest
+    assert rating['status'] == 'solved'
+    assert rating['techniques'][hardest] >= 1
+
+    assert sudokuBoard.difficulty == difficulty
+    assert sudokuBoard.board == board
+
+
+def test_rate_unsolvable():
+    board = _copy_board(sudokusamples.boards9[1])
+    board[0][0] = '1'
+    board[0][1] = '6'
+
+    sudokuBoard = SudokuBoard(board)
+    assert sudokuBoard.rate()['status'] == 'unsolvable'
+    assert sudokuBoard.difficulty == 'N/A'
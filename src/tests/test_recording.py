@@ -0,0 +1,136 @@
+"""
+Tests of the solving recordings: they must survive being written and read, and seeking anywhere (across
+the keyframes too) must show the board the solving had at that step
+"""
+
+import io
+import random
+
+import pytest
+
+from sudoku import sudokusamples
+from sudoku.sudokuboard import SudokuBoard
+from sudoku.sudokuexceptions import ArgumentError
+from sudoku.sudokukernel import board_to_cells
+from sudoku.sudokurecording import SolveRecording, record_solving
+
+
+def _copy_board(board):
+    return tuple([list(row) for row in board])
+
+
+@pytest.fixture(scope='module')
+def solving():
+    """
+    Returns:
+        {tuple} -- bytes of the recording of solving the empty 12x12 sample (over 14000 steps, so a few
+        keyframes) and the live board after every step (cells, the first one before any step)
+    """
+
+    board = sudokusamples.boards12[0]
+
+    recordingFile = io.BytesIO()
+    stepCount = record_solving(SudokuBoard(_copy_board(board)), recordingFile)
+
+    sudokuBoard = SudokuBoard(_copy_board(board))
+    liveBoards = [board_to_cells(sudokuBoard.board)]
+    for _ in sudokuBoard.gen_solving_deltas():
+        liveBoards.append(board_to_cells(sudokuBoard.board))
+
+    assert stepCount == len(liveBoards) - 1
+    assert stepCount > 3 * SolveRecording.keyframeInterval
+
+    return recordingFile.getvalue(), liveBoards
+
+
+def _assert_board(recording, liveBoards):
+    assert board_to_cells(recording.board()) == liveBoards[recording.position]
+
+
+def test_round_trip(solving, tmp_path):
+    data, liveBoards = solving
+
+    recording = SolveRecording.from_bytes(data)
+    assert len(recording) == len(liveBoards) - 1
+    assert recording.to_bytes() == data
+
+    path = str(tmp_path / 'solving.sdkr')
+    recording.save(path)
+    loadedRecording = SolveRecording.load(path)
+    assert loadedRecording.to_bytes() == data
+
+    assert board_to_cells(loadedRecording.initial_board()) == liveBoards[0]
+    assert board_to_cells(loadedRecording.final_board()) == liveBoards[-1]
+    assert board_to_cells(loadedRecording.final_board()) == board_to_cells(
+        SudokuBoard(_copy_board(sudokusamples.boards12[0])).solve(True, 'backtrack'))
+
+
+def test_seek(solving):
+    data, liveBoards = solving
+    recording = SolveRecording.from_bytes(data)
+    interval = SolveRecording.keyframeInterval
+
+    # around the keyframes, jumping far forwards and backwards, and a few random steps
+    positions = [1, interval - 1, interval, interval + 1, 3 * interval - 1, 3 * interval, len(recording),
+                 2 * interval + 1, 2 * interval - 1, 5, 0, 3 * interval + 7, interval + 3]
+    positions += random.Random(0).sample(range(len(recording) + 1), 30)
+
+    for position in positions:
+        previousBoard = board_to_cells(recording.board())
+        changes = recording.seek(position)
+
+        assert recording.position == position
+        _assert_board(recording, liveBoards)
+
+        # the changes lead from the previous board to this one
+        for (rowI, elementI), num in changes.items():
+            previousBoard[rowI * recording.size + elementI] = num
+        assert previousBoard == liveBoards[position]
+
+
+def test_seek_clamps(solving):
+    data, liveBoards = solving
+    recording = SolveRecording.from_bytes(data)
+
+    recording.seek(len(recording) + 10)
+    assert recording.position == len(recording)
+    assert recording.is_finished()
+    _assert_board(recording, liveBoards)
+
+    recording.seek(-10)
+    assert recording.position == 0
+    _assert_board(recording, liveBoards)
+
+
+def test_step(solving):
+    data, liveBoards = solving
+    recording = SolveRecording.from_bytes(data)
+    interval = SolveRecording.keyframeInterval
+
+    # step by step over a keyframe and back
+    recording.seek(interval - 3)
+    for _ in range(6):
+        recording.step()
+        _assert_board(recording, liveBoards)
+    for _ in range(6):
+        recording.step(-1)
+        _assert_board(recording, liveBoards)
+
+    recording.step(2 * interval)
+    assert recording.position == 3 * interval - 3
+    _assert_board(recording, liveBoards)
+
+
+def test_incorrect_recordings(solving):
+    data, _ = solving
+
+    with pytest.raises(ArgumentError):
+        SolveRecording.from_bytes(b'SDK')
+    with pytest.raises(ArgumentError):
+        SolveRecording.from_bytes(b'XXXX' + data[4:])
+    with pytest.raises(ArgumentError):
+        SolveRecording.from_bytes(data[:4] + bytes([data[4] + 1]) + data[5:])
+    with pytest.raises(ArgumentError):
+        SolveRecording.from_bytes(data[:-1])
+    with pytest.raises(ArgumentError):
+        SolveRecording.from_bytes(data[:6 + 12 * 12 - 1])
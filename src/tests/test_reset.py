@@ -0,0 +1,59 @@
+"""
+Tests of SudokuBoard.reset_board: the board given is restored in place, a board of another shape is refused
+"""
+
+import pytest
+
+from sudoku import sudokusamples
+from sudoku.sudokuboard import SudokuBoard
+from sudoku.sudokuexceptions import BoardError
+
+
+def _copy_board(board):
+    return tuple([list(row) for row in board])
+
+
+@pytest.mark.parametrize('strategy', ['backtrack', 'bitmask'])
+def test_reset_after_solve(strategy):
+    board = sudokusamples.boards9[1]
+    sudokuBoard = SudokuBoard(_copy_board(board))
+    rows = sudokuBoard.board
+    firstRow = rows[0]
+
+    sudokuBoard.solve(strategy=strategy)
+    assert sudokuBoard.board != board
+
+    assert sudokuBoard.reset_board() is rows
+    assert sudokuBoard.board is rows
+    assert rows[0] is firstRow
+    assert rows == board
+
+
+def test_reset_after_steps():
+    board = sudokusamples.boards12[1]
+    sudokuBoard = SudokuBoard(_copy_board(board))
+
+    for _, _ in zip(range(500), sudokuBoard.gen_solving_deltas()):
+        pass
+    assert sudokuBoard.board != board
+
+    sudokuBoard.reset_board()
+    assert sudokuBoard.board == board
+
+    # the backup is never changed, so it can be reset again
+    sudokuBoard.board[0][0] = '5'
+    sudokuBoard.reset_board()
+    assert sudokuBoard.board == board
+
+
+@pytest.mark.parametrize('newBoard', [tuple([['0'] * 9 for _ in range(8)]),
+                                      tuple([['0'] * 9 for _ in range(8)] + [['0'] * 8]),
+                                      tuple([['0'] * 4 for _ in range(4)])])
+def test_reset_different_shape(newBoard):
+    sudokuBoard = SudokuBoard(_copy_board(sudokusamples.boards9[1]))
+    sudokuBoard.board = newBoard
+
+    with pytest.raises(BoardError):
+        sudokuBoard.reset_board()
+
+    assert sudokuBoard.board is newBoard
@@ -0,0 +1,130 @@
+"""
+Tests of the HTTP service: reading the boards of a request, the responses, and both through a running server
+(incorrect boards get an error of their own, incorrect requests a 400)
+"""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from sudoku import sudokusamples
+from sudoku.sudokuboard import SudokuBoard
+from sudoku.sudokuexceptions import BoardError
+from sudoku.sudokuservice import SolveRequestHandler, SolveService, make_response, read_request_boards
+
+board9 = [[int(element) for element in row] for row in sudokusamples.boards9[1]]
+rows9 = tuple([list(row) for row in sudokusamples.boards9[1]])
+
+
+@pytest.mark.parametrize('data, boards, isList', [
+    ({'board': board9}, [rows9], False),
+    (board9, [rows9], False),
+    ([{'board': board9}, {'board': board9}], [rows9, rows9], True),
+    ([board9, {'board': board9}], [rows9, rows9], True),
+    ({'board': [[None, '', '.', 0], [1, '2', 3, 4]]}, [(['0', '0', '0', '0'], ['1', '2', '3', '4'])], False),
+])
+def test_read_request_boards(data, boards, isList):
+    assert read_request_boards(data) == (boards, isList)
+
+
+@pytest.mark.parametrize('data', [None, 5, 'board', {}, {'board': None}, {'board': []}, {'board': [1, 2]},
+                                  {'board': [[1], 2]}, {'board': 'x'}, [], [{'board': board9}, 5],
+                                  [{'board': board9}, {'board': []}], [{'boards': board9}]])
+def test_read_request_boards_incorrect(data):
+    with pytest.raises(BoardError):
+        read_request_boards(data)
+
+
+@pytest.mark.parametrize('board', [[[]], [[1, 2], [3]], [[0] * 9] * 8 + [[0] * 8], [[0] * 9] * 10, [[0] * 5] * 5])
+def test_read_request_boards_wrong_size(board):
+    # the solver refuses them, so the other boards of the request are still solved
+    boards, isList = read_request_boards([{'board': board9}, {'board': board}])
+
+    assert isList
+    assert boards[1] == tuple([[str(element) for element in row] for row in board])
+
+    with pytest.raises(BoardError):
+        SudokuBoard(boards[1]).solve(True, 'bitmask')
+
+
+def test_make_response():
+    solution = tuple([[str((rowI * 3 + rowI // 3 + colI) % 9 + 1) for colI in range(9)] for rowI in range(9)])
+    stats = {'nodes': 5, 'backtracks': 0}
+
+    assert make_response(solution, stats) == {
+        'solution': [[int(num) for num in row] for row in solution], 'status': 'solved', 'stats': stats}
+    assert make_response(None, stats) == {'solution': None, 'status': 'unsolvable', 'stats': stats}
+
+    exceededStats = {'nodes': 10, 'backtracks': 3, 'exceeded': 'nodes'}
+    assert make_response(None, exceededStats) == {'solution': None, 'status': 'exceeded', 'stats': exceededStats}
+
+    assert make_response(None, {'error': 'Unknown char in board'}) == {
+        'solution': None, 'status': 'error', 'error': 'Unknown char in board'}
+
+    json.dumps(make_response(solution, stats))
+
+
+@pytest.fixture(scope='module')
+def serviceURL():
+    service = SolveService(workers=1, batchWindow=0)
+    service.start()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SolveRequestHandler)
+    server.daemon_threads = True
+    server.solveService = service
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    yield 'http://127.0.0.1:{}'.format(server.server_address[1])
+
+    server.shutdown()
+    server.server_close()
+    service.stop()
+
+
+def _request(url, body=None):
+    request = urllib.request.Request(url, body, {'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def test_service_solves(serviceURL):
+    code, response = _request(serviceURL + '/solve', json.dumps({'board': board9}).encode())
+
+    assert code == 200
+    assert response['status'] == 'solved'
+    assert all(num == response['solution'][rowI][colI] for rowI, row in enumerate(board9)
+               for colI, num in enumerate(row) if num)
+
+
+def test_service_wrong_size(serviceURL):
+    body = json.dumps([{'board': board9}, {'board': [[0] * 9] * 8 + [[0] * 8]}, {'board': [[0] * 5] * 5}])
+    code, responses = _request(serviceURL + '/solve', body.encode())
+
+    assert code == 200
+    assert [response['status'] for response in responses] == ['solved', 'error', 'error']
+    assert responses[1] == {'solution': None, 'status': 'error',
+                            'error': "Board's row count and row length must be uniform."}
+
+
+@pytest.mark.parametrize('path, body', [('/solve', b'{"board": [[1, 2'), ('/solve', b'not json'),
+                                        ('/solve', b'[]'), ('/solve', b'{"board": 5}'),
+                                        ('/solve?strategy=parallel', json.dumps(board9).encode()),
+                                        ('/solve?maxNodes=many', json.dumps(board9).encode())])
+def test_service_incorrect_request(serviceURL, path, body):
+    code, response = _request(serviceURL + path, body)
+
+    assert code == 400
+    assert response['error']
+
+
+def test_service_paths(serviceURL):
+    assert _request(serviceURL + '/health')[0] == 200
+    assert _request(serviceURL + '/nothing')[0] == 404
+    assert _request(serviceURL + '/nothing', b'{}')[0] == 404
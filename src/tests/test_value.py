@@ -0,0 +1,108 @@
+"""
+Tests of Board: it can't be changed, equal boards hash the same, with_cell makes a new board
+and spots outside the board are refused
+"""
+
+import pickle
+
+import pytest
+
+from sudoku import sudokusamples
+from sudoku.sudokuboard import SudokuBoard
+from sudoku.sudokuexceptions import BoardError
+from sudoku.sudokukernel import board_to_cells
+from sudoku.sudokuvalue import Board
+
+
+@pytest.fixture
+def board():
+    return Board.from_rows(sudokusamples.boards9[1])
+
+
+def test_immutable(board):
+    cells = board.cells
+
+    with pytest.raises(AttributeError):
+        board._cells = bytes(81)
+    with pytest.raises(AttributeError):
+        board.size = 4
+    with pytest.raises(AttributeError):
+        del board._hash
+    with pytest.raises(TypeError):
+        board.cells[0] = 1
+
+    assert board.cells == cells
+
+
+def test_equal_boards_hash_the_same(board):
+    cells = board_to_cells(sudokusamples.boards9[1])
+    sameBoards = [Board(cells), Board(bytes(cells), 9), Board.from_rows(board.to_rows()),
+                  pickle.loads(pickle.dumps(board)), board.with_cell(0, 0, 5).with_cell(0, 0, 0),
+                  SudokuBoard(Board(cells)).to_value()]
+
+    for sameBoard in sameBoards:
+        assert sameBoard == board
+        assert hash(sameBoard) == hash(board)
+
+    assert len(set(sameBoards + [board])) == 1
+    assert {board: 'found'}[Board(cells)] == 'found'
+
+
+def test_different_boards(board):
+    assert board != board.with_cell(0, 0, 5)
+    assert board != Board(bytes(81))
+    assert Board(bytes(16)) != Board(bytes(81))
+    assert board != board.cells
+    assert board != board.to_rows()
+
+
+def test_with_cell(board):
+    cells = board.cells
+    hash(board)
+
+    newBoard = board.with_cell(0, 0, 5)
+
+    assert newBoard is not board
+    assert newBoard.cell(0, 0) == 5
+    assert newBoard.cells[1:] == cells[1:]
+    assert newBoard.size == board.size
+
+    # the board itself stays the same, its hash too
+    assert board.cells == cells
+    assert board.cell(0, 0) == 0
+    assert hash(board) == hash(Board(cells))
+
+    assert newBoard.with_cell(0, 0, 0) == board
+    assert board.with_cell(0, 0, 0) is board
+
+
+@pytest.mark.parametrize('rowI, elementI', [(-1, 0), (0, -1), (9, 0), (0, 9), (8, 9), (9, 9), (-1, -1)])
+def test_spot_out_of_board(board, rowI, elementI):
+    with pytest.raises(BoardError):
+        board.cell(rowI, elementI)
+    with pytest.raises(BoardError):
+        board.with_cell(rowI, elementI, 1)
+
+
+def test_corner_spots(board):
+    assert board.cell(8, 8) == board.cells[80]
+    assert board.with_cell(8, 8, 9).cells[80] == 9
+    assert board.with_cell(0, 8, 9).cells[8] == 9
+
+
+@pytest.mark.parametrize('num', [-1, 10, 256])
+def test_num_out_of_range(board, num):
+    with pytest.raises(BoardError):
+        board.with_cell(0, 0, num)
+
+    cells = list(board.cells)
+    cells[0] = num
+    with pytest.raises(BoardError):
+        Board(cells)
+
+
+def test_spot_count_not_a_square():
+    with pytest.raises(BoardError):
+        Board(bytes(80))
+    with pytest.raises(BoardError):
+        Board(bytes(81), 8)
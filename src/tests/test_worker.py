@@ -0,0 +1,139 @@
+"""
+Tests of SolveWorker: it solves the same board as the one given (its shape too) and hands out its steps
+keeping to the stepPolicy the same way as a solver running inline
+"""
+
+import pickle
+import time
+
+import pytest
+
+from sudoku import sudokusamples
+from sudoku.sudokuboard import SudokuBoard
+from sudoku.sudokuconstraints import DiagonalConstraint
+from sudoku.sudokuexceptions import ArgumentError
+from sudoku.sudokuworker import SolveWorker, frame_is_over
+
+
+def _copy_board(board):
+    return tuple([list(row) for row in board])
+
+
+def _run_worker(board, mode='thread', queueSize=64, batchSize=256, waitForWorker=False, **policyArgs):
+    """
+    Keyword Arguments:
+        waitForWorker {bool} -- if True, the steps are taken once the worker has made all of them,
+        so a frame never ends just because the worker is behind (default: {False})
+
+    Returns:
+        {list of dicts} -- steps of every frame
+    """
+
+    solveWorker = SolveWorker(board, mode, queueSize, batchSize)
+    solveWorker.start()
+
+    deadline = time.perf_counter() + 60
+    while waitForWorker and solveWorker.is_alive():
+        assert time.perf_counter() < deadline
+        time.sleep(0.001)
+
+    frames = []
+    while not solveWorker.finished:
+        assert time.perf_counter() < deadline
+
+        changes = solveWorker.get_steps(**policyArgs)
+        if changes:
+            frames.append(changes)
+        else:
+            time.sleep(0.001)
+
+    solveWorker.stop()
+    return frames
+
+
+def _solved_rows(board, frames):
+    rows = [list(row) for row in board.board]
+    for changes in frames:
+        for (rowI, elementI), (num, _) in changes.items():
+            rows[rowI][elementI] = num
+
+    return rows
+
+
+@pytest.mark.parametrize('mode', ['thread', 'process'])
+def test_board_definition(mode):
+    # 6x6 is split into 3x2 squares by default
+    board = SudokuBoard(_copy_board([['0'] * 6] * 6), boxRows=2, boxCols=3, constMarker='#')
+    expected = SudokuBoard(*board.to_args())
+    expected.solve(False, 'backtrack')
+
+    # few steps fit into the queue, so some of them get merged
+    frames = _run_worker(board, mode, queueSize=1, batchSize=4)
+
+    assert _solved_rows(board, frames) == [list(row) for row in expected.board]
+    solvedRows = _solved_rows(board, frames)
+    assert SudokuBoard(_copy_board(solvedRows), boxRows=2, boxCols=3).count_solutions() == 1
+    assert SudokuBoard(_copy_board(solvedRows)).count_solutions() == 0
+    assert board.board == _copy_board([['0'] * 6] * 6)
+
+
+def test_to_args():
+    board = SudokuBoard(_copy_board(sudokusamples.boards9[1]), 'easy', '0', False, '#', 3, 3, [DiagonalConstraint()])
+    args = pickle.loads(pickle.dumps(board.to_args()))
+
+    copiedBoard = SudokuBoard(*args)
+    assert copiedBoard.board == board.board
+    assert copiedBoard.board is not board.board
+    assert (copiedBoard.difficulty, copiedBoard.emptySpotChar, copiedBoard.boxRows, copiedBoard.boxCols) == \
+        ('easy', '0', 3, 3)
+    assert [constraint.name for constraint in copiedBoard.constraints] == ['diagonal']
+    assert copiedBoard.to_args()[4] == '#'
+
+    with pytest.raises(ArgumentError):
+        SolveWorker(board)
+
+
+def _expected_frames(deltas, policy, steps):
+    frames = [{}]
+    stepCount = 0
+    for rowI, elementI, num, isValid in deltas:
+        frames[-1][(rowI, elementI)] = (num, isValid)
+        stepCount += 1
+
+        # the deadline of the 'time' policy is always over
+        if frame_is_over(policy, stepCount, steps, 0, isValid):
+            frames.append({})
+            stepCount = 0
+
+    return [frame for frame in frames if frame]
+
+
+@pytest.mark.parametrize('policy, steps', [('steps', 1), ('steps', 7), ('time', 1), ('forward', 1)])
+@pytest.mark.parametrize('boardI', [0, 3])
+def test_step_policy(policy, steps, boardI):
+    board = SudokuBoard(_copy_board(sudokusamples.boards9[boardI]))
+    deltas = list(SudokuBoard(*board.to_args()).gen_solving_deltas())
+
+    # the queue holds every step, so none are merged
+    frames = _run_worker(board, queueSize=len(deltas) + 2, batchSize=1, waitForWorker=True,
+                         policy=policy, steps=steps, timeBudget=0)
+
+    assert frames == _expected_frames(deltas, policy, steps)
+
+
+def test_every_step_waiting():
+    board = SudokuBoard(_copy_board(sudokusamples.boards9[3]))
+    deltas = list(SudokuBoard(*board.to_args()).gen_solving_deltas())
+
+    frames = _run_worker(board, queueSize=len(deltas) + 2, batchSize=1, waitForWorker=True)
+
+    assert len(frames) == 1
+    assert _solved_rows(board, frames) == _solved_rows(board, [dict(((rowI, elementI), (num, isValid))
+                                                                    for rowI, elementI, num, isValid in deltas)])
+
+
+def test_incorrect_policy():
+    solveWorker = SolveWorker(SudokuBoard(_copy_board(sudokusamples.boards9[1])))
+
+    with pytest.raises(ArgumentError):
+        solveWorker.get_steps('fast')